@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 from fastapi import FastAPI
@@ -11,6 +12,7 @@ from app.routers import (
     interacao_solo_estrutura_router,
     utilidades_fund_router,
 )
+from app.services.dimensionamento.estacas.abaco_fco import preaquecer_abaco_fco
 
 
 tags_metadata = [
@@ -32,6 +34,13 @@ tags_metadata = [
 ]
 
 
+@asynccontextmanager
+async def ciclo_de_vida(_: FastAPI):
+    # O abaco FCO e lido na partida, e nao na primeira requisicao que o usa.
+    preaquecer_abaco_fco()
+    yield
+
+
 app = FastAPI(
     title="openStruct",
     description=(
@@ -49,6 +58,7 @@ app = FastAPI(
         "url": "https://opensource.org/licenses/MIT",
     },
     openapi_tags=tags_metadata,
+    lifespan=ciclo_de_vida,
 )
 
 origins = ["*"]
@@ -2,23 +2,34 @@
 
 from __future__ import annotations
 
+import json
 import logging
 from time import perf_counter
-from typing import Any, Dict, List, Literal, Optional
+from typing import Annotated, Any, Dict, Iterator, List, Literal, Optional
 
 from fastapi import APIRouter, Body, HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from app.services.dimensionamento.estacas.abaco_fco import (
+    AbacoFCOIndisponivel,
+)
 from app.services.dimensionamento.estacas.flexo_compressao_obliqua import (
     CatalogoArmadurasFCO,
     DependenciaConcretePropertiesAusente,
     DimensionadorFlexoCompressaoObliqua,
     ErroFlexoCompressaoObliqua,
+    EsbeltezFCO,
     EsforcosFCO,
     FalhaAnaliseSecao,
     MateriaisFCO,
     SecaoCircularFCO,
 )
+from app.services.dimensionamento.estacas.varredura_diametros_fco import (
+    CustosFCO,
+    VarreduraDiametrosFCO,
+)
 
 
 router = APIRouter(tags=["Dimensionamento - Estacas"])
@@ -58,6 +69,9 @@ EXEMPLO_PCALC = {
         "modo_verificacao": "direcional",
         "tolerancia_angular_graus": 0.05,
         "max_iteracoes_angulo": 8,
+        "execucao": "serial",
+        "estrategia_busca": "linear",
+        "motor": "concreteproperties",
     },
 }
 
@@ -139,6 +153,13 @@ class EsforcosFCOInput(BaseModel):
     )
 
 
+class CombinacaoCargaFCOInput(EsforcosFCOInput):
+    nome: Optional[str] = Field(
+        None,
+        description="Identificação da combinação ELU (ex.: 'ELU-03').",
+    )
+
+
 class CombinacaoArmaduraInput(BaseModel):
     quantidade_barras: int = Field(..., ge=3, le=40)
     diametro_barra_mm: float = Field(..., gt=0, le=50)
@@ -180,6 +201,29 @@ class CatalogoArmadurasFCOInput(BaseModel):
             "direcional, a simetria da armadura reduz as análises necessárias."
         ),
     )
+    tolerancia_contorno_tf_m: Optional[float] = Field(
+        None,
+        gt=0,
+        description=(
+            "Erro de corda admitido no contorno da recomendação (tf.m). "
+            "Substitui pontos_diagrama: o contorno começa grosso e recebe "
+            "pontos só onde se afasta da corda mais que a tolerância. O erro "
+            "estimado e as análises feitas vêm em amostragem_diagrama. "
+            "Apenas no modo direcional e fora do motor abaco."
+        ),
+    )
+    formato_diagrama: Literal["pontos", "arrays", "fourier"] = Field(
+        "pontos",
+        description=(
+            "Formato do contorno da recomendação. 'pontos' mantém "
+            "diagrama_recomendacao_mx_my_tf_m. 'arrays' e 'fourier' vão em "
+            "diagrama_recomendacao_compacto: duas listas de coordenadas, ou "
+            "os coeficientes da série de cossenos do raio em função do "
+            "ângulo com a simetria das n barras, com o desvio radial máximo "
+            "em relação ao contorno calculado. O desvio admitido é "
+            "tolerancia_contorno_tf_m ou 0,2 % do raio médio."
+        ),
+    )
     pontos_contorno_secao: int = Field(
         48,
         ge=48,
@@ -218,15 +262,177 @@ class CatalogoArmadurasFCOInput(BaseModel):
         le=20,
         description="Máximo de soluções seccionais na busca angular por alternativa.",
     )
+    execucao: Literal["serial", "processos"] = Field(
+        "serial",
+        description=(
+            "serial avalia as alternativas em sequência; processos distribui "
+            "as bitolas (ou as alternativas) em um pool de processos. O "
+            "resultado é idêntico ao da execução serial."
+        ),
+    )
+    estrategia_busca: Literal[
+        "linear", "bissecao", "ramificacao_limite", "preditor", "triagem"
+    ] = Field(
+        "linear",
+        description=(
+            "Ordem de busca das alternativas. bissecao usa busca galopante e "
+            "bissecção por bitola. preditor parte, em cada bitola, da "
+            "quantidade estimada por uma aproximação fechada da seção "
+            "circular e caminha até a menor quantidade que atende. Ambas "
+            "exigem o modo grade com parar_na_primeira_opcao_por_bitola. "
+            "ramificacao_limite avalia o catálogo em ordem crescente de área "
+            "de aço, poda pelo limite inferior de área necessária e encerra "
+            "na primeira alternativa que atende. A recomendação é a mesma da "
+            "busca exaustiva. triagem avalia todo o catálogo em um modelo "
+            "grosseiro (contorno, perfil do concreto e tolerância angular "
+            "reduzidos) e refaz no modelo completo só as alternativas com "
+            "utilização a menos de 5 % de 1; a resposta informa as opções "
+            "decididas na triagem e a faixa usada. triagem exige "
+            "modo_verificacao direcional."
+        ),
+    )
+    motor: Literal[
+        "concreteproperties", "nativo", "analitico", "abaco"
+    ] = Field(
+        "concreteproperties",
+        description=(
+            "Motor da análise seccional. nativo usa fibras vetorizadas em "
+            "NumPy com o mesmo modelo de materiais (parábola-retângulo e aço "
+            "elastoplástico) e difere do concreteproperties em até 1 % nos "
+            "momentos resistentes. analitico integra o concreto sobre "
+            "segmentos do círculo exato, sem malha nem polígono de "
+            "pontos_contorno_secao lados. abaco interpola momentos "
+            "reduzidos pré-calculados com o motor analitico (fck de 20 a 50 "
+            "MPa, 6 a 24 barras), sem análise seccional na requisição; só "
+            "no modo direcional."
+        ),
+    )
+    confirmar_abaco: bool = Field(
+        False,
+        description=(
+            "Com motor abaco, refaz a alternativa recomendada com o "
+            "concreteproperties e informa as duas utilizações em metodo."
+        ),
+    )
+    conferir_motor_nativo: bool = Field(
+        False,
+        description=(
+            "Com motor nativo ou analitico, compara a alternativa recomendada "
+            "com o concreteproperties e informa o desvio máximo em metodo."
+        ),
+    )
+    usar_tabela_setor: bool = Field(
+        False,
+        description=(
+            "Calcula uma vez, por alternativa e força normal, a capacidade "
+            "em meio setor da camada de barras (pi/n) e a expande por "
+            "simetria. A busca direcional parte da interpolação nessa tabela "
+            "e o contorno da recomendação é lido dela. A tabela fica em "
+            "cache entre requisições."
+        ),
+    )
+    usar_superficie_interacao: bool = Field(
+        False,
+        description=(
+            "No modo direcional, monta por alternativa uma superfície "
+            "N-Mx-My (contornos Mx-My em uma grade de N), guardada em cache "
+            "entre requisições. As demandas são verificadas por interpolação "
+            "e interseção de raio. Utilizações a menos de 5 % de 1 e forças "
+            "normais fora da grade seguem pela análise exata. Compensa em "
+            "verificações repetidas de estacas padronizadas."
+        ),
+    )
+    decisao_antecipada: bool = Field(
+        False,
+        description=(
+            "No modo direcional, limita a capacidade na direção da demanda a "
+            "cada iteração do ângulo da linha neutra e encerra a busca assim "
+            "que a alternativa comprovadamente atende ou não atende. Só "
+            "utilizações próximas de 1 são refinadas. A utilização das "
+            "demais alternativas é um limite conservador; a recomendação é "
+            "sempre refinada."
+        ),
+    )
+    tempo_maximo_s: Optional[float] = Field(
+        None,
+        gt=0,
+        description=(
+            "Orçamento de tempo da análise do catálogo. As alternativas são "
+            "avaliadas da menor para a maior área de aço e a análise para "
+            "quando o prazo termina, entre uma alternativa e outra. A "
+            "recomendação passa a ser a menor opção aprovada entre as "
+            "avaliadas; as demais aparecem em catalogo.prazo e "
+            "resultado_parcial indica a resposta incompleta."
+        ),
+    )
+    instrumentar: bool = Field(
+        False,
+        description=(
+            "Inclui metodo.instrumentacao: chamadas e tempo por etapa "
+            "(geometria, construcao_secao, ultimate_bending_capacity, "
+            "biaxial_bending_diagram, curva_momento_curvatura, "
+            "reanalise_recomendacao, diagrama_recomendacao), contagem de "
+            "iterações da secante e a média por alternativa. Com execução "
+            "por processos, os tempos dos processos são somados."
+        ),
+    )
+
+
+class EsbeltezFCOInput(BaseModel):
+    comprimento_flambagem_m: float = Field(
+        ...,
+        gt=0,
+        description=(
+            "Comprimento de flambagem do trecho sem contenção lateral "
+            "(parte livre ou em solo muito mole), em m."
+        ),
+    )
+    metodo: Literal[
+        "curvatura_aproximada", "rigidez_kappa", "momento_curvatura"
+    ] = Field(
+        "curvatura_aproximada",
+        description=(
+            "Pilar-padrão da NBR 6118 (15.8.3.3): curvatura aproximada ou "
+            "rigidez κ aproximada (λ ≤ 90), ou acoplado à curva "
+            "momento-curvatura de cada alternativa (λ ≤ 140). As curvas "
+            "ficam em cache por alternativa, força normal e direção."
+        ),
+    )
+    alfa_b: float = Field(
+        1.0,
+        ge=0.4,
+        le=1.0,
+        description="Coeficiente αb da NBR 6118 (15.8.2).",
+    )
 
 
 class FlexoCompressaoObliquaInput(BaseModel):
     secao: SecaoCircularFCOInput
     materiais: MateriaisFCOInput
-    esforcos: EsforcosFCOInput
+    esforcos: Optional[EsforcosFCOInput] = Field(
+        None,
+        description="Solicitação única. Use esforcos ou combinacoes_carga.",
+    )
+    combinacoes_carga: Optional[List[CombinacaoCargaFCOInput]] = Field(
+        None,
+        description=(
+            "Combinações ELU verificadas na mesma requisição (até 100). Uma "
+            "alternativa atende quando atende todas; a recomendação é a de "
+            "menor área de aço nessa condição. Combinações com a mesma força "
+            "normal compartilham as análises da seção, e a verificação de "
+            "cada alternativa para na primeira combinação reprovada."
+        ),
+    )
     catalogo: CatalogoArmadurasFCOInput = Field(
         default_factory=CatalogoArmadurasFCOInput
     )
+    esbeltez: Optional[EsbeltezFCOInput] = Field(
+        None,
+        description=(
+            "Efeitos locais de segunda ordem e momento mínimo. Sem este "
+            "campo, apenas a resistência da seção é verificada."
+        ),
+    )
 
 
 class FlexoCompressaoObliquaResult(BaseModel):
@@ -240,6 +446,70 @@ class FlexoCompressaoObliquaResult(BaseModel):
     resumo_por_bitola: List[Dict[str, Any]]
     recomendacao: Optional[Dict[str, Any]]
     diagrama_recomendacao_mx_my_tf_m: List[Dict[str, float]]
+    diagrama_recomendacao_compacto: Optional[Dict[str, Any]] = None
+    resultado_parcial: bool = False
+    segunda_ordem: Optional[Dict[str, Any]] = None
+    avisos: List[str]
+
+
+class SecaoVarreduraFCOInput(SecaoCircularFCOInput):
+    diametro_estaca_m: Optional[float] = Field(
+        None,
+        gt=0,
+        description=(
+            "Opcional na varredura; quando informado, entra na lista "
+            "diametros_estaca_m."
+        ),
+    )
+
+
+class PrecoConcretoFCOInput(BaseModel):
+    fck_mpa: float = Field(..., ge=20, le=50)
+    preco_m3: float = Field(..., ge=0)
+
+
+class CustosFCOInput(BaseModel):
+    preco_concreto_m3: float = Field(
+        650.0, ge=0, description="Preço do concreto por m³."
+    )
+    preco_aco_kg: float = Field(
+        9.0, ge=0, description="Preço do aço longitudinal por kg."
+    )
+    precos_concreto_por_fck: List[PrecoConcretoFCOInput] = Field(
+        default_factory=list,
+        description=(
+            "Preço do concreto por fck; os fck ausentes usam "
+            "preco_concreto_m3."
+        ),
+    )
+
+
+class VarreduraDiametrosFCOInput(FlexoCompressaoObliquaInput):
+    secao: SecaoVarreduraFCOInput
+    diametros_estaca_m: List[Annotated[float, Field(gt=0)]] = Field(
+        ...,
+        min_length=1,
+        max_length=12,
+        description="Diâmetros avaliados na mesma requisição (m).",
+    )
+    fcks_mpa: List[Annotated[float, Field(ge=20, le=50)]] = Field(
+        default_factory=list,
+        max_length=4,
+        description=(
+            "fck avaliados em conjunto com os diâmetros (20 a 50 MPa). Vazio "
+            "usa materiais.fck_mpa."
+        ),
+    )
+    custos: CustosFCOInput = Field(default_factory=CustosFCOInput)
+
+
+class VarreduraDiametrosFCOResult(BaseModel):
+    sistema_unidades: Dict[str, str]
+    metodo: Dict[str, Any]
+    custos: Dict[str, Any]
+    candidatos: List[Dict[str, Any]]
+    melhor: Optional[Dict[str, Any]]
+    resultado_melhor: Optional[FlexoCompressaoObliquaResult]
     avisos: List[str]
 
 
@@ -247,12 +517,125 @@ class ErrorResponse(BaseModel):
     detail: str
 
 
+def _criar_dimensionador(
+    data: FlexoCompressaoObliquaInput, diametro_m: float
+) -> DimensionadorFlexoCompressaoObliqua:
+    combinacoes = tuple(
+        (item.quantidade_barras, item.diametro_barra_mm)
+        for item in (data.catalogo.combinacoes_explicitas or [])
+    )
+    return DimensionadorFlexoCompressaoObliqua(
+        secao=SecaoCircularFCO(
+            diametro_m=diametro_m,
+            cobrimento_nominal_mm=data.secao.cobrimento_nominal_mm,
+            diametro_armadura_transversal_mm=(
+                data.secao.diametro_armadura_transversal_mm
+            ),
+            angulo_inicial_barras_graus=(
+                data.secao.angulo_inicial_barras_graus
+            ),
+        ),
+        materiais=MateriaisFCO(
+            fck_mpa=data.materiais.fck_mpa,
+            fyk_mpa=data.materiais.fyk_mpa,
+            gamma_c=data.materiais.gamma_c,
+            gamma_s=data.materiais.gamma_s,
+            fator_reducao_concreto=(
+                data.materiais.fator_reducao_concreto
+            ),
+            modulo_elasticidade_aco_mpa=(
+                data.materiais.modulo_elasticidade_aco_mpa
+            ),
+            modulo_elasticidade_concreto_mpa=(
+                data.materiais.modulo_elasticidade_concreto_mpa
+            ),
+            deformacao_concreto_inicio_patamar=(
+                data.materiais.deformacao_concreto_inicio_patamar
+            ),
+            deformacao_ultima_concreto=(
+                data.materiais.deformacao_ultima_concreto
+            ),
+            expoente_parabola_concreto=(
+                data.materiais.expoente_parabola_concreto
+            ),
+            deformacao_ultima_aco=data.materiais.deformacao_ultima_aco,
+        ),
+        esforcos=(
+            EsforcosFCO(
+                normal_compressao_sd_tf=(
+                    data.esforcos.normal_compressao_sd_tf
+                ),
+                momento_x_sd_tf_m=data.esforcos.momento_x_sd_tf_m,
+                momento_y_sd_tf_m=data.esforcos.momento_y_sd_tf_m,
+            )
+            if data.esforcos is not None
+            else None
+        ),
+        catalogo=CatalogoArmadurasFCO(
+            bitolas_longitudinais_mm=(
+                data.catalogo.bitolas_longitudinais_mm
+            ),
+            quantidades_barras=data.catalogo.quantidades_barras,
+            combinacoes_explicitas=combinacoes,
+            espacamento_livre_minimo_mm=(
+                data.catalogo.espacamento_livre_minimo_mm
+            ),
+            pontos_diagrama=data.catalogo.pontos_diagrama,
+            pontos_contorno_secao=data.catalogo.pontos_contorno_secao,
+            parar_na_primeira_opcao_por_bitola=(
+                data.catalogo.parar_na_primeira_opcao_por_bitola
+            ),
+            incluir_diagrama_recomendacao=(
+                data.catalogo.incluir_diagrama_recomendacao
+            ),
+            modo_verificacao=data.catalogo.modo_verificacao,
+            tolerancia_angular_graus=(
+                data.catalogo.tolerancia_angular_graus
+            ),
+            max_iteracoes_angulo=data.catalogo.max_iteracoes_angulo,
+            execucao=data.catalogo.execucao,
+            estrategia_busca=data.catalogo.estrategia_busca,
+            motor=data.catalogo.motor,
+            conferir_motor_nativo=data.catalogo.conferir_motor_nativo,
+            usar_tabela_setor=data.catalogo.usar_tabela_setor,
+            usar_superficie_interacao=(
+                data.catalogo.usar_superficie_interacao
+            ),
+            decisao_antecipada=data.catalogo.decisao_antecipada,
+            confirmar_abaco=data.catalogo.confirmar_abaco,
+            tempo_maximo_s=data.catalogo.tempo_maximo_s,
+            tolerancia_contorno_tf_m=data.catalogo.tolerancia_contorno_tf_m,
+            formato_diagrama=data.catalogo.formato_diagrama,
+            instrumentar=data.catalogo.instrumentar,
+        ),
+        combinacoes_carga=tuple(
+            EsforcosFCO(
+                normal_compressao_sd_tf=item.normal_compressao_sd_tf,
+                momento_x_sd_tf_m=item.momento_x_sd_tf_m,
+                momento_y_sd_tf_m=item.momento_y_sd_tf_m,
+                nome=item.nome,
+            )
+            for item in (data.combinacoes_carga or [])
+        ),
+        esbeltez=(
+            EsbeltezFCO(
+                comprimento_flambagem_m=data.esbeltez.comprimento_flambagem_m,
+                metodo=data.esbeltez.metodo,
+                alfa_b=data.esbeltez.alfa_b,
+            )
+            if data.esbeltez is not None
+            else None
+        ),
+    )
+
+
 @router.post(
     "/estacas/flexo-compressao-obliqua",
     summary="Verifica alternativas de armadura para estaca circular",
     description=(
         "Gera alternativas comerciais de armadura longitudinal e verifica cada "
-        "seção circular para Nsd, Mxsd e Mysd. No modo direcional, o "
+        "seção circular para Nsd, Mxsd e Mysd, ou para uma lista de "
+        "combinações de carga (combinacoes_carga). No modo direcional, o "
         "concreteproperties calcula somente as capacidades necessárias para "
         "alinhar o momento resistente à solicitação; a openStruct filtra a "
         "geometria, calcula a utilização e organiza a menor alternativa por "
@@ -281,83 +664,15 @@ def verificar_flexo_compressao_obliqua(
             * len(data.catalogo.quantidades_barras)
         )
     logger.info(
-        "Flexocompressao obliqua iniciada: %s combinacoes, modo=%s, %s pontos.",
+        "Flexocompressao obliqua iniciada: %s combinacoes, %s combinacoes de "
+        "carga, modo=%s, %s pontos.",
         quantidade_opcoes,
+        len(data.combinacoes_carga or []) or 1,
         data.catalogo.modo_verificacao,
         data.catalogo.pontos_diagrama,
     )
     try:
-        combinacoes = tuple(
-            (item.quantidade_barras, item.diametro_barra_mm)
-            for item in (data.catalogo.combinacoes_explicitas or [])
-        )
-        servico = DimensionadorFlexoCompressaoObliqua(
-            secao=SecaoCircularFCO(
-                diametro_m=data.secao.diametro_estaca_m,
-                cobrimento_nominal_mm=data.secao.cobrimento_nominal_mm,
-                diametro_armadura_transversal_mm=(
-                    data.secao.diametro_armadura_transversal_mm
-                ),
-                angulo_inicial_barras_graus=(
-                    data.secao.angulo_inicial_barras_graus
-                ),
-            ),
-            materiais=MateriaisFCO(
-                fck_mpa=data.materiais.fck_mpa,
-                fyk_mpa=data.materiais.fyk_mpa,
-                gamma_c=data.materiais.gamma_c,
-                gamma_s=data.materiais.gamma_s,
-                fator_reducao_concreto=(
-                    data.materiais.fator_reducao_concreto
-                ),
-                modulo_elasticidade_aco_mpa=(
-                    data.materiais.modulo_elasticidade_aco_mpa
-                ),
-                modulo_elasticidade_concreto_mpa=(
-                    data.materiais.modulo_elasticidade_concreto_mpa
-                ),
-                deformacao_concreto_inicio_patamar=(
-                    data.materiais.deformacao_concreto_inicio_patamar
-                ),
-                deformacao_ultima_concreto=(
-                    data.materiais.deformacao_ultima_concreto
-                ),
-                expoente_parabola_concreto=(
-                    data.materiais.expoente_parabola_concreto
-                ),
-                deformacao_ultima_aco=data.materiais.deformacao_ultima_aco,
-            ),
-            esforcos=EsforcosFCO(
-                normal_compressao_sd_tf=(
-                    data.esforcos.normal_compressao_sd_tf
-                ),
-                momento_x_sd_tf_m=data.esforcos.momento_x_sd_tf_m,
-                momento_y_sd_tf_m=data.esforcos.momento_y_sd_tf_m,
-            ),
-            catalogo=CatalogoArmadurasFCO(
-                bitolas_longitudinais_mm=(
-                    data.catalogo.bitolas_longitudinais_mm
-                ),
-                quantidades_barras=data.catalogo.quantidades_barras,
-                combinacoes_explicitas=combinacoes,
-                espacamento_livre_minimo_mm=(
-                    data.catalogo.espacamento_livre_minimo_mm
-                ),
-                pontos_diagrama=data.catalogo.pontos_diagrama,
-                pontos_contorno_secao=data.catalogo.pontos_contorno_secao,
-                parar_na_primeira_opcao_por_bitola=(
-                    data.catalogo.parar_na_primeira_opcao_por_bitola
-                ),
-                incluir_diagrama_recomendacao=(
-                    data.catalogo.incluir_diagrama_recomendacao
-                ),
-                modo_verificacao=data.catalogo.modo_verificacao,
-                tolerancia_angular_graus=(
-                    data.catalogo.tolerancia_angular_graus
-                ),
-                max_iteracoes_angulo=data.catalogo.max_iteracoes_angulo,
-            ),
-        )
+        servico = _criar_dimensionador(data, data.secao.diametro_estaca_m)
         resultado = servico.analisar()
         duracao = perf_counter() - inicio
         resultado["metodo"]["tempo_processamento_s"] = round(duracao, 3)
@@ -371,7 +686,7 @@ def verificar_flexo_compressao_obliqua(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
         ) from exc
-    except DependenciaConcretePropertiesAusente as exc:
+    except (DependenciaConcretePropertiesAusente, AbacoFCOIndisponivel) as exc:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
         ) from exc
@@ -393,3 +708,201 @@ def verificar_flexo_compressao_obliqua(
                 f"{exc}"
             ),
         ) from exc
+
+
+def _erro_http_fco(exc: Exception) -> HTTPException:
+    if isinstance(exc, HTTPException):
+        return exc
+    if isinstance(exc, ErroFlexoCompressaoObliqua):
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        )
+    if isinstance(
+        exc, (DependenciaConcretePropertiesAusente, AbacoFCOIndisponivel)
+    ):
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        )
+    if isinstance(exc, FalhaAnaliseSecao):
+        return HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+        )
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail=(
+            "Erro inesperado ao verificar a flexocompressao obliqua: "
+            f"{exc}"
+        ),
+    )
+
+
+def _linha_ndjson(evento: Dict[str, Any]) -> bytes:
+    return (
+        json.dumps(jsonable_encoder(evento), ensure_ascii=False) + "\n"
+    ).encode("utf-8")
+
+
+@router.post(
+    "/estacas/flexo-compressao-obliqua/fluxo",
+    summary="Verifica alternativas de armadura com resultados em fluxo",
+    description=(
+        "Mesma verificação de /estacas/flexo-compressao-obliqua, entregue "
+        "como NDJSON (um objeto JSON por linha) à medida que as "
+        "alternativas são concluídas. Eventos, pelo campo tipo: inicio; "
+        "opcao (uma por alternativa, sem o contorno, com "
+        "tempo_analise_s); resumo_por_bitola; recomendacao (com "
+        "diagrama_recomendacao_mx_my_tf_m e diagrama_recomendacao_compacto); "
+        "resultado (demais chaves da "
+        "resposta, com ids_opcoes na ordem de opcoes). A resposta completa "
+        "é reconstruída juntando os eventos. Erros de validação retornam o "
+        "status HTTP habitual; falhas após o início do fluxo chegam como "
+        "evento erro, com status_code e detail."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}},
+            "description": "Eventos NDJSON da verificação.",
+        },
+        400: {"model": ErrorResponse, "description": "Dados incompatíveis."},
+        503: {"model": ErrorResponse, "description": "Dependência ausente."},
+        500: {"model": ErrorResponse, "description": "Erro interno."},
+    },
+)
+def verificar_flexo_compressao_obliqua_em_fluxo(
+    data: FlexoCompressaoObliquaInput = Body(..., examples=[EXEMPLO_PCALC]),
+) -> StreamingResponse:
+    inicio = perf_counter()
+    try:
+        servico = _criar_dimensionador(data, data.secao.diametro_estaca_m)
+        eventos = servico.analisar_em_fluxo()
+        primeiro = next(eventos)
+    except Exception as exc:
+        erro = _erro_http_fco(exc)
+        if erro.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR:
+            logger.exception("Falha inesperada ao iniciar o fluxo FCO.")
+        raise erro from exc
+    logger.info(
+        "Fluxo de flexocompressao obliqua iniciado: %s combinacoes.",
+        primeiro["quantidade_combinacoes_solicitadas"],
+    )
+
+    def linhas() -> Iterator[bytes]:
+        opcoes = 0
+        try:
+            yield _linha_ndjson(primeiro)
+            for evento in eventos:
+                if evento["tipo"] == "opcao":
+                    opcoes += 1
+                elif evento["tipo"] == "resultado":
+                    duracao = perf_counter() - inicio
+                    evento["resultado"]["metodo"][
+                        "tempo_processamento_s"
+                    ] = round(duracao, 3)
+                    logger.info(
+                        "Fluxo de flexocompressao obliqua concluido em "
+                        "%.3f s: %s opcoes enviadas.",
+                        duracao,
+                        opcoes,
+                    )
+                yield _linha_ndjson(evento)
+        except Exception as exc:
+            erro = _erro_http_fco(exc)
+            if erro.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR:
+                logger.exception(
+                    "Falha inesperada no fluxo FCO apos %.3f s.",
+                    perf_counter() - inicio,
+                )
+            yield _linha_ndjson(
+                {
+                    "tipo": "erro",
+                    "status_code": erro.status_code,
+                    "detail": erro.detail,
+                }
+            )
+        finally:
+            # Cliente desconectado: interrompe a analise.
+            eventos.close()
+
+    return StreamingResponse(linhas(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/estacas/flexo-compressao-obliqua/varredura-diametros",
+    summary="Escolhe diâmetro e armadura de menor custo para estaca circular",
+    description=(
+        "Repete a verificação de flexocompressão oblíqua para cada diâmetro "
+        "(e, opcionalmente, cada fck) com o mesmo catálogo e as mesmas "
+        "solicitações, e devolve o par diâmetro + armadura de menor custo "
+        "por metro de estaca (concreto por m³ e aço por kg). Pares que não "
+        "resistem à força normal ou ao limite inferior de armadura são "
+        "descartados antes de montar as seções, e os demais são analisados "
+        "em ordem de custo mínimo estimado. resultado_melhor traz a resposta "
+        "completa da verificação do par escolhido."
+    ),
+    response_model=VarreduraDiametrosFCOResult,
+    responses={
+        400: {"model": ErrorResponse, "description": "Dados incompatíveis."},
+        422: {"model": ErrorResponse, "description": "Falha da análise seccional."},
+        503: {"model": ErrorResponse, "description": "Dependência ausente."},
+        500: {"model": ErrorResponse, "description": "Erro interno."},
+    },
+)
+def varrer_diametros_flexo_compressao_obliqua(
+    data: VarreduraDiametrosFCOInput,
+) -> Dict[str, Any]:
+    inicio = perf_counter()
+    diametros = list(data.diametros_estaca_m)
+    if data.secao.diametro_estaca_m is not None:
+        diametros.append(data.secao.diametro_estaca_m)
+    logger.info(
+        "Varredura FCO iniciada: %s diametros, %s fck.",
+        len(set(diametros)),
+        len(set(data.fcks_mpa)) or 1,
+    )
+    try:
+        varredura = VarreduraDiametrosFCO(
+            base=_criar_dimensionador(data, diametros[0]),
+            diametros_m=diametros,
+            fcks_mpa=data.fcks_mpa,
+            custos=CustosFCO(
+                preco_concreto_m3=data.custos.preco_concreto_m3,
+                preco_aco_kg=data.custos.preco_aco_kg,
+                precos_concreto_m3_por_fck=tuple(
+                    (item.fck_mpa, item.preco_m3)
+                    for item in data.custos.precos_concreto_por_fck
+                ),
+            ),
+        )
+        resultado = varredura.analisar()
+        duracao = perf_counter() - inicio
+        resultado["metodo"]["tempo_processamento_s"] = round(duracao, 3)
+        logger.info(
+            "Varredura FCO concluida em %.3f s: %s catalogos analisados.",
+            duracao,
+            resultado["metodo"]["analises_de_catalogo"],
+        )
+        return resultado
+    except ErroFlexoCompressaoObliqua as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+    except (DependenciaConcretePropertiesAusente, AbacoFCOIndisponivel) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        ) from exc
+    except FalhaAnaliseSecao as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+        ) from exc
+    except HTTPException:
+        raise
+    except Exception as exc:
+        logger.exception(
+            "Falha inesperada na varredura FCO apos %.3f s.",
+            perf_counter() - inicio,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro inesperado na varredura de diametros: {exc}",
+        ) from exc
@@ -0,0 +1,454 @@
+"""Ábaco adimensional de flexocompressão oblíqua para estacas circulares.
+
+Com o modelo de materiais do serviço FCO (parábola-retângulo no concreto,
+aço elastoplástico perfeito e barras pontuais que descontam o concreto
+deslocado), os esforços reduzidos
+
+* ``nu = N / (Ac fcd)``;
+* ``mu = M / (Ac D fcd)``;
+* ``omega = As fyd / (Ac fcd)``
+
+dependem apenas das deformações do diagrama, de ``eps_yd = fyd / Es``, da
+razão ``fcd / fyd``, da razão ``raio das barras / raio da seção`` e do
+número de barras. O fck entra somente por ``fcd / fyd``; a faixa de 20 a
+50 MPa vira um eixo curto do ábaco.
+
+O ábaco guarda ``mu`` resistente em direções do meio setor ``[0, pi/n]``
+medidas a partir do eixo de uma barra; as demais direções vêm da simetria
+da camada. Os valores ficam em um ``.npy`` float16, lido por ``np.load``
+com ``mmap_mode="r"``, e os eixos em um ``.json`` ao lado. Para gerar os
+arquivos:
+
+    python -m app.services.dimensionamento.estacas.abaco_fco
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.dimensionamento.estacas.geometria_setor_fco import (
+    construir_tabela_setor_capacidade,
+    intersecoes_raios_poligonos,
+)
+from app.services.dimensionamento.estacas.secao_fibras_fco import (
+    FalhaEquilibrioFibras,
+    SecaoSegmentosCircularFCO,
+)
+
+
+VERSAO_ABACO_FCO = 1
+DIRETORIO_ABACO_FCO = Path(__file__).with_name("dados")
+ARQUIVO_MOMENTOS_ABACO_FCO = DIRETORIO_ABACO_FCO / "abaco_fco.npy"
+ARQUIVO_EIXOS_ABACO_FCO = DIRETORIO_ABACO_FCO / "abaco_fco.json"
+
+FYD_BASE_MPA = 500.0 / 1.15
+PARAMETROS_BASE_ABACO = {
+    "deformacao_concreto_inicio_patamar": 0.002,
+    "deformacao_ultima_concreto": 0.0035,
+    "expoente_parabola_concreto": 2.0,
+    "deformacao_escoamento_aco": FYD_BASE_MPA / 200_000.0,
+}
+# fck de 20, 35 e 50 MPa com gamma_c = 1,4, fator 0,85 e CA-50.
+RAZOES_FCD_FYD = tuple(
+    round(0.85 * fck / 1.4 / FYD_BASE_MPA, 6) for fck in (20.0, 35.0, 50.0)
+)
+RAZOES_RAIO_BARRAS = tuple(round(0.50 + 0.05 * indice, 2) for indice in range(10))
+QUANTIDADES_BARRAS = tuple(range(6, 25))
+TAXAS_MECANICAS = tuple(round(0.15 * indice, 2) for indice in range(21))
+FRACOES_NORMAL = tuple(round(0.05 * indice, 2) for indice in range(21))
+DIRECOES_MEIO_SETOR = 5
+PONTOS_SETOR_GERACAO = 4
+TOLERANCIA_PARAMETROS_ABACO = 1e-6
+
+
+class AbacoFCOIndisponivel(RuntimeError):
+    """Os arquivos do ábaco não foram gerados ou estão incompatíveis."""
+
+
+class ForaDoAbacoFCO(ValueError):
+    """A alternativa ou a solicitação sai dos eixos tabelados."""
+
+
+@dataclass(frozen=True, eq=False)
+class AbacoFCO:
+    """Momentos reduzidos resistentes ``mu[r, rho, n, omega, s, phi]``.
+
+    ``r = fcd/fyd``, ``rho = raio das barras / raio da seção``, ``s`` é a
+    fração ``nu / nu_max`` com ``nu_max = 1 + omega (1 - r)`` e ``phi`` o
+    ângulo, no meio setor, do vetor geométrico ``(m_y, m_x)``.
+    """
+
+    versao: int
+    parametros: Dict[str, float]
+    razoes_fcd_fyd: Tuple[float, ...]
+    razoes_raio_barras: Tuple[float, ...]
+    quantidades_barras: Tuple[int, ...]
+    taxas_mecanicas: Tuple[float, ...]
+    fracoes_normal: Tuple[float, ...]
+    momentos: np.ndarray
+
+    @property
+    def direcoes_meio_setor(self) -> int:
+        return int(self.momentos.shape[-1])
+
+    def motivo_fora_da_cobertura(
+        self, *, parametros: Dict[str, float]
+    ) -> Optional[str]:
+        """Explica por que os materiais não são cobertos, ou ``None``."""
+
+        calculados = {
+            "deformacao_concreto_inicio_patamar": (
+                parametros["deformacao_concreto_inicio_patamar"]
+            ),
+            "deformacao_ultima_concreto": parametros["deformacao_ultima_concreto"],
+            "expoente_parabola_concreto": parametros["expoente_parabola_concreto"],
+            "deformacao_escoamento_aco": (
+                parametros["fyd_mpa"] / parametros["modulo_elasticidade_aco_mpa"]
+            ),
+        }
+        for nome, valor in calculados.items():
+            if not math.isclose(
+                valor,
+                self.parametros[nome],
+                rel_tol=1e-6,
+                abs_tol=TOLERANCIA_PARAMETROS_ABACO,
+            ):
+                return (
+                    f"O abaco foi gerado com {nome} = {self.parametros[nome]:g}; "
+                    f"a requisicao usa {valor:g}. Use outro motor."
+                )
+        razao = parametros["fcd_diagrama_mpa"] / parametros["fyd_mpa"]
+        if not (
+            self.razoes_fcd_fyd[0] - TOLERANCIA_PARAMETROS_ABACO
+            <= razao
+            <= self.razoes_fcd_fyd[-1] + TOLERANCIA_PARAMETROS_ABACO
+        ):
+            return (
+                f"fcd/fyd = {razao:.4f} fora do abaco "
+                f"({self.razoes_fcd_fyd[0]:.4f} a {self.razoes_fcd_fyd[-1]:.4f}). "
+                "Use outro motor."
+            )
+        return None
+
+    def momento_reduzido_resistente(
+        self,
+        *,
+        razao_fcd_fyd: float,
+        razao_raio_barras: float,
+        quantidade_barras: int,
+        taxa_mecanica: float,
+        normal_reduzida: float,
+        angulo_geometrico: float,
+    ) -> float:
+        """``mu`` resistente na direção ``angulo_geometrico`` de ``(m_y, m_x)``.
+
+        O ângulo é medido a partir do eixo da primeira barra. Fora do domínio
+        de compressão (``nu > nu_max``) a capacidade é nula.
+        """
+
+        if quantidade_barras not in self.quantidades_barras:
+            raise ForaDoAbacoFCO(
+                f"O abaco cobre de {self.quantidades_barras[0]} a "
+                f"{self.quantidades_barras[-1]} barras."
+            )
+        normal_maxima = 1.0 + taxa_mecanica * (1.0 - razao_fcd_fyd)
+        fracao = normal_reduzida / normal_maxima
+        if fracao >= 1.0:
+            return 0.0
+        angulo_setor = 2.0 * math.pi / quantidade_barras
+        angulo = math.fmod(angulo_geometrico, angulo_setor)
+        if angulo < 0:
+            angulo += angulo_setor
+        if angulo > angulo_setor / 2.0:
+            angulo = angulo_setor - angulo
+
+        indices: List[slice] = []
+        pesos: List[np.ndarray] = []
+        for nome, eixo, valor in (
+            ("fcd/fyd", self.razoes_fcd_fyd, razao_fcd_fyd),
+            ("raio das barras / raio", self.razoes_raio_barras, razao_raio_barras),
+            ("omega", self.taxas_mecanicas, taxa_mecanica),
+            ("nu/nu_max", self.fracoes_normal, max(0.0, fracao)),
+        ):
+            inicio, peso = localizar_no_eixo(eixo, valor, nome)
+            indices.append(slice(inicio, inicio + 2))
+            pesos.append(np.array([1.0 - peso, peso]))
+        passo_angular = (angulo_setor / 2.0) / (self.direcoes_meio_setor - 1)
+        posicao = min(angulo / passo_angular, self.direcoes_meio_setor - 1.0)
+        inicio = min(int(posicao), self.direcoes_meio_setor - 2)
+        indices.append(slice(inicio, inicio + 2))
+        pesos.append(np.array([inicio + 1.0 - posicao, posicao - inicio]))
+
+        bloco = np.asarray(
+            self.momentos[
+                indices[0],
+                indices[1],
+                self.quantidades_barras.index(quantidade_barras),
+                indices[2],
+                indices[3],
+                indices[4],
+            ],
+            dtype=float,
+        )
+        for peso in pesos:
+            bloco = np.tensordot(peso, bloco, axes=(0, 0))
+        return float(bloco)
+
+    def contorno(
+        self,
+        *,
+        razao_fcd_fyd: float,
+        razao_raio_barras: float,
+        quantidade_barras: int,
+        taxa_mecanica: float,
+        normal_reduzida: float,
+        angulo_inicial_barras_rad: float,
+        escala_momento: float,
+        pontos: int,
+    ) -> List[Tuple[float, float]]:
+        """Contorno ``(m_x, m_y)`` em ``pontos`` direções, em ``escala_momento``."""
+
+        saida: List[Tuple[float, float]] = []
+        for indice in range(pontos):
+            angulo = 2.0 * math.pi * indice / pontos
+            mu = self.momento_reduzido_resistente(
+                razao_fcd_fyd=razao_fcd_fyd,
+                razao_raio_barras=razao_raio_barras,
+                quantidade_barras=quantidade_barras,
+                taxa_mecanica=taxa_mecanica,
+                normal_reduzida=normal_reduzida,
+                angulo_geometrico=angulo,
+            )
+            absoluto = angulo + angulo_inicial_barras_rad
+            saida.append(
+                (
+                    mu * escala_momento * math.sin(absoluto),
+                    mu * escala_momento * math.cos(absoluto),
+                )
+            )
+        return saida
+
+
+def localizar_no_eixo(
+    eixo: Sequence[float], valor: float, nome: str
+) -> Tuple[int, float]:
+    """Intervalo ``[eixo[i], eixo[i+1]]`` que contém ``valor`` e o peso de ``i+1``."""
+
+    if len(eixo) < 2:
+        return 0, 0.0
+    if not (
+        eixo[0] - TOLERANCIA_PARAMETROS_ABACO
+        <= valor
+        <= eixo[-1] + TOLERANCIA_PARAMETROS_ABACO
+    ):
+        raise ForaDoAbacoFCO(
+            f"{nome} = {valor:.4f} fora do abaco ({eixo[0]:g} a {eixo[-1]:g})."
+        )
+    inicio = min(max(0, int(np.searchsorted(eixo, valor)) - 1), len(eixo) - 2)
+    largura = eixo[inicio + 1] - eixo[inicio]
+    peso = (valor - eixo[inicio]) / largura
+    return inicio, min(1.0, max(0.0, peso))
+
+
+_ABACO_FCO: Optional[AbacoFCO] = None
+_TRAVA_ABACO_FCO = threading.Lock()
+
+
+def carregar_abaco_fco() -> AbacoFCO:
+    """Abre o ábaco uma única vez por processo, mapeado em memória."""
+
+    global _ABACO_FCO
+    with _TRAVA_ABACO_FCO:
+        if _ABACO_FCO is None:
+            try:
+                eixos = json.loads(ARQUIVO_EIXOS_ABACO_FCO.read_text("utf-8"))
+                momentos = np.load(ARQUIVO_MOMENTOS_ABACO_FCO, mmap_mode="r")
+            except (OSError, ValueError) as exc:
+                raise AbacoFCOIndisponivel(
+                    "Abaco FCO nao encontrado. Gere os arquivos com: python -m "
+                    "app.services.dimensionamento.estacas.abaco_fco"
+                ) from exc
+            if eixos.get("versao") != VERSAO_ABACO_FCO:
+                raise AbacoFCOIndisponivel(
+                    f"Abaco FCO na versao {eixos.get('versao')}; esperada "
+                    f"{VERSAO_ABACO_FCO}. Gere os arquivos novamente."
+                )
+            _ABACO_FCO = AbacoFCO(
+                versao=eixos["versao"],
+                parametros=eixos["parametros"],
+                razoes_fcd_fyd=tuple(eixos["razoes_fcd_fyd"]),
+                razoes_raio_barras=tuple(eixos["razoes_raio_barras"]),
+                quantidades_barras=tuple(eixos["quantidades_barras"]),
+                taxas_mecanicas=tuple(eixos["taxas_mecanicas"]),
+                fracoes_normal=tuple(eixos["fracoes_normal"]),
+                momentos=momentos,
+            )
+        return _ABACO_FCO
+
+
+def preaquecer_abaco_fco() -> bool:
+    """Abre o ábaco e lê a tabela uma vez, na partida da aplicação.
+
+    A primeira requisição com ``motor="abaco"`` deixa de pagar a leitura dos
+    eixos e das páginas do ``.npy``. Sem os arquivos, devolve ``False`` e as
+    requisições continuam informando o motivo.
+    """
+
+    try:
+        abaco = carregar_abaco_fco()
+    except AbacoFCOIndisponivel:
+        return False
+    # Percorre o mapeamento para trazer as paginas para a memoria.
+    float(np.max(abaco.momentos))
+    return True
+
+
+def gerar_abaco_fco(
+    *,
+    razoes_fcd_fyd: Sequence[float] = RAZOES_FCD_FYD,
+    razoes_raio_barras: Sequence[float] = RAZOES_RAIO_BARRAS,
+    quantidades_barras: Sequence[int] = QUANTIDADES_BARRAS,
+    taxas_mecanicas: Sequence[float] = TAXAS_MECANICAS,
+    fracoes_normal: Sequence[float] = FRACOES_NORMAL,
+    direcoes_meio_setor: int = DIRECOES_MEIO_SETOR,
+    pontos_setor: int = PONTOS_SETOR_GERACAO,
+    progresso: Optional[Callable[[int, int], None]] = None,
+) -> np.ndarray:
+    """Tabela ``mu`` com o motor analítico em uma seção de referência.
+
+    Para cada combinação, a capacidade em meio setor é expandida por
+    simetria (``construir_tabela_setor_capacidade``) e ``mu`` é a interseção
+    do raio de cada direção com esse contorno.
+    """
+
+    diametro_mm = 1_000.0
+    area_bruta = math.pi * diametro_mm**2 / 4.0
+    momentos = np.zeros(
+        (
+            len(razoes_fcd_fyd),
+            len(razoes_raio_barras),
+            len(quantidades_barras),
+            len(taxas_mecanicas),
+            len(fracoes_normal),
+            direcoes_meio_setor,
+        ),
+        dtype=np.float32,
+    )
+    total = int(np.prod(momentos.shape[:-1]))
+    feitos = 0
+    for i, razao in enumerate(razoes_fcd_fyd):
+        fcd = razao * FYD_BASE_MPA
+        parametros = {
+            "fcd_diagrama_mpa": fcd,
+            "fyd_mpa": FYD_BASE_MPA,
+            "modulo_elasticidade_aco_mpa": (
+                FYD_BASE_MPA / PARAMETROS_BASE_ABACO["deformacao_escoamento_aco"]
+            ),
+            "deformacao_concreto_inicio_patamar": (
+                PARAMETROS_BASE_ABACO["deformacao_concreto_inicio_patamar"]
+            ),
+            "deformacao_ultima_concreto": (
+                PARAMETROS_BASE_ABACO["deformacao_ultima_concreto"]
+            ),
+            "expoente_parabola_concreto": (
+                PARAMETROS_BASE_ABACO["expoente_parabola_concreto"]
+            ),
+        }
+        escala = area_bruta * diametro_mm * fcd
+        for j, rho in enumerate(razoes_raio_barras):
+            for k, quantidade in enumerate(quantidades_barras):
+                angulo_setor = 2.0 * math.pi / quantidade
+                fases = np.linspace(
+                    0.0, angulo_setor / 2.0, direcoes_meio_setor
+                )
+                direcoes = np.column_stack([np.sin(fases), np.cos(fases)])
+                for w, omega in enumerate(taxas_mecanicas):
+                    secao = SecaoSegmentosCircularFCO(
+                        diametro_mm=diametro_mm,
+                        raio_eixo_barras_mm=rho * diametro_mm / 2.0,
+                        quantidade_barras=quantidade,
+                        area_barra_mm2=(
+                            omega * area_bruta * fcd / FYD_BASE_MPA / quantidade
+                        ),
+                        angulo_inicial_rad=0.0,
+                        parametros=parametros,
+                    )
+                    normal_maxima = 1.0 + omega * (1.0 - razao)
+                    for s, fracao in enumerate(fracoes_normal):
+                        feitos += 1
+                        if fracao >= 1.0:
+                            continue
+                        try:
+                            contorno = construir_tabela_setor_capacidade(
+                                secao_concreto=secao,
+                                normal_n=(
+                                    fracao * normal_maxima * area_bruta * fcd
+                                ),
+                                quantidade_barras=quantidade,
+                                angulo_inicial_barras_rad=0.0,
+                                pontos_setor=pontos_setor,
+                            ).contorno()
+                        except FalhaEquilibrioFibras:
+                            # Concreto simples sem normal: nao ha equilibrio
+                            # e a capacidade fica nula.
+                            continue
+                        fatores = intersecoes_raios_poligonos(
+                            direcoes, contorno
+                        )["fator_escala"]
+                        momentos[i, j, k, w, s] = np.nan_to_num(
+                            fatores / escala, nan=0.0
+                        )
+                    if progresso is not None:
+                        progresso(feitos, total)
+    return momentos
+
+
+def salvar_abaco_fco(
+    momentos: np.ndarray,
+    *,
+    razoes_fcd_fyd: Sequence[float] = RAZOES_FCD_FYD,
+    razoes_raio_barras: Sequence[float] = RAZOES_RAIO_BARRAS,
+    quantidades_barras: Sequence[int] = QUANTIDADES_BARRAS,
+    taxas_mecanicas: Sequence[float] = TAXAS_MECANICAS,
+    fracoes_normal: Sequence[float] = FRACOES_NORMAL,
+) -> None:
+    DIRETORIO_ABACO_FCO.mkdir(parents=True, exist_ok=True)
+    np.save(ARQUIVO_MOMENTOS_ABACO_FCO, momentos.astype(np.float16))
+    eixos: Dict[str, Any] = {
+        "versao": VERSAO_ABACO_FCO,
+        "parametros": PARAMETROS_BASE_ABACO,
+        "razoes_fcd_fyd": list(razoes_fcd_fyd),
+        "razoes_raio_barras": list(razoes_raio_barras),
+        "quantidades_barras": list(quantidades_barras),
+        "taxas_mecanicas": list(taxas_mecanicas),
+        "fracoes_normal": list(fracoes_normal),
+    }
+    ARQUIVO_EIXOS_ABACO_FCO.write_text(
+        json.dumps(eixos, indent=2) + "\n", encoding="utf-8"
+    )
+
+
+def main() -> None:
+    inicio = time.perf_counter()
+
+    def progresso(feitos: int, total: int) -> None:
+        print(
+            f"\r{feitos}/{total} ({time.perf_counter() - inicio:.0f} s)",
+            end="",
+            flush=True,
+        )
+
+    salvar_abaco_fco(gerar_abaco_fco(progresso=progresso))
+    print(f"\nAbaco salvo em {ARQUIVO_MOMENTOS_ABACO_FCO}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,641 @@
+"""Benchmark de desempenho e precisão da verificação FCO.
+
+Um corpus fixo de estacas (diâmetros de 0,25 a 1,20 m, fck de 20 a 50 MPa,
+excentricidades relativas ``e / D`` de 0,05 a 1,5 e catálogos em grade e
+explícitos) é analisado por ``DimensionadorFlexoCompressaoObliqua.analisar``
+nos modos ``direcional`` e ``diagrama_completo``. Para cada caso e modo, o
+relatório guarda:
+
+* o tempo de parede, o menor de ``repeticoes`` execuções com os caches
+  vazios;
+* as chamadas e o tempo por etapa do solver, de ``metodo.instrumentacao``;
+* o pico de memória Python (``tracemalloc``) em uma execução à parte, para
+  que o rastreamento não entre no tempo.
+
+Com ``execucao="processos"``, o pool é recriado antes de cada execução, e o
+tempo inclui a partida dos processos; o pico de memória é só o do processo
+principal.
+
+A precisão é o desvio entre as utilizações dos dois modos nas alternativas
+analisadas em ambos, com as que mudam de ``status``; as alternativas com
+``erro_analise`` (p. ex. busca direcional sem convergência) são contadas à
+parte.
+
+O relatório é um JSON. Sem referência, já são regressões: caso que falha,
+alternativa com ``erro_analise``, caso sem nenhuma alternativa comparável
+entre os dois modos, divergência de ``status`` entre eles e desvio de
+utilização acima de ``LimitesRegressaoFCO.desvio_utilizacao``. Com um
+relatório de referência, tempo, chamadas e memória que passam dos demais
+limites também viram regressões. Havendo regressão, o comando termina com
+código 1:
+
+    python -m app.services.dimensionamento.estacas.benchmark_fco \\
+        --motor nativo --saida benchmark.json --referencia anterior.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass, fields, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.services.dimensionamento.estacas.flexo_compressao_obliqua import (
+    MODOS_EXECUCAO,
+    MOTORES,
+    CatalogoArmadurasFCO,
+    DimensionadorFlexoCompressaoObliqua,
+    EsforcosFCO,
+    MateriaisFCO,
+    SecaoCircularFCO,
+    encerrar_pool_processos_fco,
+    limpar_caches_fco,
+    versao_pacote,
+)
+
+
+VERSAO_BENCHMARK_FCO = 1
+MODOS_BENCHMARK = ("direcional", "diagrama_completo")
+# Etapas cujas chamadas entram na verificacao de regressao.
+ETAPAS_SOLVER = (
+    "ultimate_bending_capacity",
+    "biaxial_bending_diagram",
+    "construcao_secao",
+    "curva_momento_curvatura",
+)
+BITOLAS_GRADE_MM = (12.5, 16.0, 20.0, 25.0)
+
+
+@dataclass(frozen=True)
+class CasoBenchmarkFCO:
+    """Estaca do corpus; os esforços vêm de ``normal_tf`` e ``e / D``.
+
+    O momento ``N e`` faz ``angulo_momento_graus`` com o eixo de ``M_y``.
+    """
+
+    nome: str
+    diametro_m: float
+    fck_mpa: float
+    normal_tf: float
+    excentricidade_relativa: float
+    angulo_momento_graus: float
+    bitolas_longitudinais_mm: Tuple[float, ...] = ()
+    quantidades_barras: Tuple[int, ...] = ()
+    combinacoes_explicitas: Tuple[Tuple[int, float], ...] = ()
+    cobrimento_nominal_mm: float = 50.0
+
+    def esforcos(self) -> EsforcosFCO:
+        momento = (
+            self.normal_tf * self.excentricidade_relativa * self.diametro_m
+        )
+        angulo = math.radians(self.angulo_momento_graus)
+        return EsforcosFCO(
+            normal_compressao_sd_tf=self.normal_tf,
+            momento_x_sd_tf_m=momento * math.sin(angulo),
+            momento_y_sd_tf_m=momento * math.cos(angulo),
+            nome=self.nome,
+        )
+
+    def dimensionador(
+        self, catalogo_base: CatalogoArmadurasFCO, modo: str
+    ) -> DimensionadorFlexoCompressaoObliqua:
+        return DimensionadorFlexoCompressaoObliqua(
+            secao=SecaoCircularFCO(
+                diametro_m=self.diametro_m,
+                cobrimento_nominal_mm=self.cobrimento_nominal_mm,
+            ),
+            materiais=MateriaisFCO(fck_mpa=self.fck_mpa),
+            esforcos=self.esforcos(),
+            catalogo=replace(
+                catalogo_base,
+                bitolas_longitudinais_mm=self.bitolas_longitudinais_mm,
+                quantidades_barras=self.quantidades_barras,
+                combinacoes_explicitas=self.combinacoes_explicitas,
+                modo_verificacao=modo,
+                instrumentar=True,
+            ),
+        )
+
+
+CORPUS_BENCHMARK_FCO = (
+    CasoBenchmarkFCO(
+        "d025_fck20_e005",
+        diametro_m=0.25,
+        fck_mpa=20.0,
+        normal_tf=40.0,
+        excentricidade_relativa=0.05,
+        angulo_momento_graus=30.0,
+        bitolas_longitudinais_mm=(10.0, 12.5),
+        quantidades_barras=(6, 8),
+        cobrimento_nominal_mm=30.0,
+    ),
+    CasoBenchmarkFCO(
+        "d030_fck25_e040",
+        diametro_m=0.30,
+        fck_mpa=25.0,
+        normal_tf=30.0,
+        excentricidade_relativa=0.40,
+        angulo_momento_graus=0.0,
+        bitolas_longitudinais_mm=(10.0, 12.5, 16.0),
+        quantidades_barras=(6, 8),
+        cobrimento_nominal_mm=30.0,
+    ),
+    CasoBenchmarkFCO(
+        "d040_fck25_e020_explicito",
+        diametro_m=0.40,
+        fck_mpa=25.0,
+        normal_tf=80.0,
+        excentricidade_relativa=0.20,
+        angulo_momento_graus=45.0,
+        combinacoes_explicitas=((6, 12.5), (8, 12.5), (6, 16.0), (8, 16.0)),
+    ),
+    CasoBenchmarkFCO(
+        "d050_fck30_e100",
+        diametro_m=0.50,
+        fck_mpa=30.0,
+        normal_tf=40.0,
+        excentricidade_relativa=1.00,
+        angulo_momento_graus=20.0,
+        bitolas_longitudinais_mm=BITOLAS_GRADE_MM[:3],
+        quantidades_barras=(8, 10, 12, 14),
+    ),
+    CasoBenchmarkFCO(
+        "d060_fck30_e010",
+        diametro_m=0.60,
+        fck_mpa=30.0,
+        normal_tf=250.0,
+        excentricidade_relativa=0.10,
+        angulo_momento_graus=60.0,
+        bitolas_longitudinais_mm=BITOLAS_GRADE_MM[:3],
+        quantidades_barras=(8, 10, 12),
+    ),
+    CasoBenchmarkFCO(
+        "d080_fck35_e030_explicito",
+        diametro_m=0.80,
+        fck_mpa=35.0,
+        normal_tf=300.0,
+        excentricidade_relativa=0.30,
+        angulo_momento_graus=10.0,
+        combinacoes_explicitas=(
+            (10, 16.0),
+            (12, 16.0),
+            (10, 20.0),
+            (12, 20.0),
+            (14, 20.0),
+        ),
+    ),
+    CasoBenchmarkFCO(
+        "d080_fck40_e150",
+        diametro_m=0.80,
+        fck_mpa=40.0,
+        normal_tf=60.0,
+        excentricidade_relativa=1.50,
+        angulo_momento_graus=75.0,
+        bitolas_longitudinais_mm=BITOLAS_GRADE_MM[1:],
+        quantidades_barras=(10, 12, 14, 16),
+    ),
+    CasoBenchmarkFCO(
+        "d100_fck40_e060",
+        diametro_m=1.00,
+        fck_mpa=40.0,
+        normal_tf=350.0,
+        excentricidade_relativa=0.60,
+        angulo_momento_graus=35.0,
+        bitolas_longitudinais_mm=BITOLAS_GRADE_MM[1:],
+        quantidades_barras=(12, 14, 16, 18),
+    ),
+    CasoBenchmarkFCO(
+        "d120_fck50_e020_explicito",
+        diametro_m=1.20,
+        fck_mpa=50.0,
+        normal_tf=1_200.0,
+        excentricidade_relativa=0.20,
+        angulo_momento_graus=50.0,
+        combinacoes_explicitas=(
+            (14, 20.0),
+            (16, 20.0),
+            (14, 25.0),
+            (16, 25.0),
+            (20, 25.0),
+        ),
+    ),
+    CasoBenchmarkFCO(
+        "d120_fck20_e080",
+        diametro_m=1.20,
+        fck_mpa=20.0,
+        normal_tf=250.0,
+        excentricidade_relativa=0.80,
+        angulo_momento_graus=90.0,
+        bitolas_longitudinais_mm=BITOLAS_GRADE_MM[2:],
+        quantidades_barras=(14, 16, 18, 20, 24),
+    ),
+)
+
+
+@dataclass(frozen=True)
+class LimitesRegressaoFCO:
+    """Folgas admitidas sobre o relatório de referência.
+
+    Os limites relativos valem por caso e modo; ``tempo_minimo_s`` é o
+    aumento absoluto abaixo do qual a variação de tempo é tratada como
+    ruído. ``desvio_utilizacao`` é o maior desvio absoluto admitido entre
+    os modos e não depende da referência.
+    """
+
+    tempo_relativo: float = 0.25
+    tempo_minimo_s: float = 0.05
+    chamadas_relativo: float = 0.10
+    memoria_relativo: float = 0.25
+    desvio_utilizacao: float = 0.03
+
+
+def executar_benchmark_fco(
+    *,
+    casos: Sequence[CasoBenchmarkFCO] = CORPUS_BENCHMARK_FCO,
+    motor: str = CatalogoArmadurasFCO.motor,
+    execucao: str = "serial",
+    repeticoes: int = 1,
+    medir_memoria: bool = True,
+) -> Dict[str, Any]:
+    """Relatório do corpus; ``verificar_regressoes`` o compara depois."""
+
+    if motor not in MOTORES:
+        raise ValueError(f"motor deve ser um de {MOTORES}.")
+    if execucao not in MODOS_EXECUCAO:
+        raise ValueError(f"execucao deve ser um de {MODOS_EXECUCAO}.")
+    if repeticoes < 1:
+        raise ValueError("repeticoes deve ser pelo menos 1.")
+    catalogo_base = CatalogoArmadurasFCO(
+        bitolas_longitudinais_mm=(),
+        quantidades_barras=(),
+        motor=motor,
+        execucao=execucao,
+        # O contorno da recomendacao nao muda as utilizacoes; fica de fora
+        # para que o tempo seja o da busca no catalogo.
+        incluir_diagrama_recomendacao=False,
+    )
+    # O modo diagrama_completo nao existe para o motor abaco.
+    modos = ("direcional",) if motor == "abaco" else MODOS_BENCHMARK
+
+    resultados_casos = []
+    for caso in casos:
+        resultado_caso: Dict[str, Any] = {
+            "nome": caso.nome,
+            "entrada": asdict(caso),
+            "modos": {},
+        }
+        utilizacoes: Dict[str, Dict[str, Tuple[float, str]]] = {}
+        for modo in modos:
+            medicao, utilizacoes[modo] = _medir_caso(
+                caso.dimensionador(catalogo_base, modo),
+                repeticoes=repeticoes,
+                medir_memoria=medir_memoria,
+            )
+            resultado_caso["modos"][modo] = medicao
+        if len(utilizacoes) == len(MODOS_BENCHMARK):
+            resultado_caso["desvio_utilizacao"] = comparar_utilizacoes(
+                *(utilizacoes[modo] for modo in MODOS_BENCHMARK)
+            )
+        resultados_casos.append(resultado_caso)
+    if execucao == "processos":
+        encerrar_pool_processos_fco()
+
+    return {
+        "versao": VERSAO_BENCHMARK_FCO,
+        "data": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "ambiente": {
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "processadores": os.cpu_count(),
+            "numpy": versao_pacote("numpy"),
+            "concreteproperties": versao_pacote("concreteproperties"),
+        },
+        "configuracao": {
+            "motor": motor,
+            "execucao": execucao,
+            "repeticoes": repeticoes,
+            "medir_memoria": medir_memoria,
+        },
+        "casos": resultados_casos,
+        "totais": _totais(resultados_casos, modos),
+    }
+
+
+def _medir_caso(
+    servico: DimensionadorFlexoCompressaoObliqua,
+    *,
+    repeticoes: int,
+    medir_memoria: bool,
+) -> Tuple[Dict[str, Any], Dict[str, Tuple[float, str]]]:
+    tempos = []
+    try:
+        for _ in range(repeticoes):
+            _esvaziar_caches(servico)
+            inicio = perf_counter()
+            resultado = servico.analisar()
+            tempos.append(perf_counter() - inicio)
+        memoria_pico_mb = None
+        if medir_memoria:
+            _esvaziar_caches(servico)
+            tracemalloc.start()
+            try:
+                servico.analisar()
+                memoria_pico_mb = tracemalloc.get_traced_memory()[1] / 2**20
+            finally:
+                tracemalloc.stop()
+    except Exception as exc:  # noqa: BLE001 - o caso falho entra no relatorio
+        return {"erro": f"{type(exc).__name__}: {exc}"}, {}
+
+    instrumentacao = resultado["metodo"]["instrumentacao"]
+    utilizacoes = {
+        opcao["id"]: (opcao["utilizacao"], opcao["status"])
+        for opcao in resultado["opcoes"]
+        if opcao.get("utilizacao") is not None
+    }
+    recomendacao = resultado.get("recomendacao")
+    return (
+        {
+            "tempo_s": min(tempos),
+            "tempos_s": tempos,
+            "memoria_pico_mb": memoria_pico_mb,
+            "chamadas": {
+                nome: etapa["chamadas"]
+                for nome, etapa in instrumentacao["etapas"].items()
+            },
+            "tempo_etapas_s": {
+                nome: etapa["tempo_s"]
+                for nome, etapa in instrumentacao["etapas"].items()
+            },
+            "contagens": instrumentacao["contagens"],
+            "opcoes_analisadas": len(utilizacoes),
+            "opcoes_com_erro": sum(
+                1
+                for opcao in resultado["opcoes"]
+                if opcao["status"] == "erro_analise"
+            ),
+            "recomendacao": recomendacao["id"] if recomendacao else None,
+        },
+        utilizacoes,
+    )
+
+
+def _esvaziar_caches(servico: DimensionadorFlexoCompressaoObliqua) -> None:
+    # Cada execucao paga a construcao das secoes. Os processos do pool tem
+    # caches proprios, esvaziados ao recriar o pool.
+    limpar_caches_fco()
+    if servico.catalogo.execucao == "processos":
+        encerrar_pool_processos_fco()
+
+
+def comparar_utilizacoes(
+    direcional: Dict[str, Tuple[float, str]],
+    diagrama_completo: Dict[str, Tuple[float, str]],
+) -> Dict[str, Any]:
+    """Desvio das utilizações direcionais sobre as do diagrama completo.
+
+    Só entram as alternativas analisadas nos dois modos; a parada na
+    primeira alternativa aprovada pode deixar conjuntos diferentes.
+    """
+
+    comuns = [id_ for id_ in direcional if id_ in diagrama_completo]
+    desvios = [
+        direcional[id_][0] - diagrama_completo[id_][0] for id_ in comuns
+    ]
+    relativos = [
+        abs(desvio) / diagrama_completo[id_][0]
+        for id_, desvio in zip(comuns, desvios)
+        if diagrama_completo[id_][0] > 0.0
+    ]
+    return {
+        "opcoes_comparadas": len(comuns),
+        "maximo_absoluto": max((abs(d) for d in desvios), default=None),
+        "medio": sum(desvios) / len(desvios) if desvios else None,
+        "maximo_relativo": max(relativos, default=None),
+        "divergencias_status": [
+            id_
+            for id_ in comuns
+            if direcional[id_][1] != diagrama_completo[id_][1]
+        ],
+    }
+
+
+def _totais(
+    casos: Sequence[Dict[str, Any]], modos: Sequence[str]
+) -> Dict[str, Any]:
+    totais: Dict[str, Any] = {}
+    for modo in modos:
+        medicoes = [
+            caso["modos"][modo]
+            for caso in casos
+            if "erro" not in caso["modos"][modo]
+        ]
+        chamadas: Dict[str, int] = {}
+        for medicao in medicoes:
+            for nome, quantidade in medicao["chamadas"].items():
+                chamadas[nome] = chamadas.get(nome, 0) + quantidade
+        totais[modo] = {
+            "tempo_s": sum(medicao["tempo_s"] for medicao in medicoes),
+            "chamadas": dict(sorted(chamadas.items())),
+            # Caso que falhou inteiro ou com alguma alternativa em erro.
+            "casos_com_erro": sum(
+                1
+                for caso in casos
+                if "erro" in caso["modos"][modo]
+                or caso["modos"][modo]["opcoes_com_erro"]
+            ),
+            "opcoes_com_erro": sum(
+                medicao["opcoes_com_erro"] for medicao in medicoes
+            ),
+        }
+    comparacoes = [
+        caso["desvio_utilizacao"]
+        for caso in casos
+        if "desvio_utilizacao" in caso
+    ]
+    totais["desvio_utilizacao_maximo"] = max(
+        (
+            comparacao["maximo_absoluto"]
+            for comparacao in comparacoes
+            if comparacao["maximo_absoluto"] is not None
+        ),
+        default=None,
+    )
+    totais["divergencias_status"] = sum(
+        len(comparacao["divergencias_status"]) for comparacao in comparacoes
+    )
+    return totais
+
+
+def verificar_regressoes(
+    relatorio: Dict[str, Any],
+    referencia: Optional[Dict[str, Any]] = None,
+    limites: LimitesRegressaoFCO = LimitesRegressaoFCO(),
+) -> List[str]:
+    """Descrição de cada regressão do ``relatorio``; vazia se não houver."""
+
+    regressoes = []
+    casos_referencia = {
+        caso["nome"]: caso for caso in (referencia or {}).get("casos", ())
+    }
+    if referencia is not None and any(
+        referencia["configuracao"][chave] != relatorio["configuracao"][chave]
+        for chave in ("motor", "execucao")
+    ):
+        regressoes.append(
+            "A referencia usa outro motor ou modo de execucao; tempo, "
+            "chamadas e memoria nao foram comparados."
+        )
+        casos_referencia = {}
+
+    for caso in relatorio["casos"]:
+        nome = caso["nome"]
+        for modo, medicao in caso["modos"].items():
+            if "erro" in medicao:
+                regressoes.append(f"{nome} ({modo}): {medicao['erro']}")
+                continue
+            if medicao["opcoes_com_erro"]:
+                regressoes.append(
+                    f"{nome} ({modo}): {medicao['opcoes_com_erro']} "
+                    f"alternativa(s) com erro de analise"
+                )
+            anterior = (
+                casos_referencia.get(nome, {}).get("modos", {}).get(modo)
+            )
+            if anterior is None or "erro" in anterior:
+                continue
+            if (
+                medicao["tempo_s"]
+                > anterior["tempo_s"] * (1.0 + limites.tempo_relativo)
+                and medicao["tempo_s"] - anterior["tempo_s"]
+                > limites.tempo_minimo_s
+            ):
+                regressoes.append(
+                    f"{nome} ({modo}): tempo {medicao['tempo_s']:.3f} s, "
+                    f"referencia {anterior['tempo_s']:.3f} s"
+                )
+            for etapa in ETAPAS_SOLVER:
+                atual = medicao["chamadas"].get(etapa, 0)
+                base = anterior["chamadas"].get(etapa, 0)
+                if atual > base * (1.0 + limites.chamadas_relativo):
+                    regressoes.append(
+                        f"{nome} ({modo}): {atual} chamadas de {etapa}, "
+                        f"referencia {base}"
+                    )
+            if (
+                medicao["memoria_pico_mb"] is not None
+                and anterior["memoria_pico_mb"] is not None
+                and medicao["memoria_pico_mb"]
+                > anterior["memoria_pico_mb"]
+                * (1.0 + limites.memoria_relativo)
+            ):
+                regressoes.append(
+                    f"{nome} ({modo}): pico de memoria "
+                    f"{medicao['memoria_pico_mb']:.1f} MB, referencia "
+                    f"{anterior['memoria_pico_mb']:.1f} MB"
+                )
+        comparacao = caso.get("desvio_utilizacao")
+        if comparacao is None or any(
+            "erro" in medicao for medicao in caso["modos"].values()
+        ):
+            continue
+        if comparacao["opcoes_comparadas"] == 0:
+            regressoes.append(
+                f"{nome}: nenhuma alternativa analisada nos dois modos para "
+                f"comparar as utilizacoes"
+            )
+        if comparacao["divergencias_status"]:
+            regressoes.append(
+                f"{nome}: status diferente entre os modos em "
+                f"{', '.join(comparacao['divergencias_status'])}"
+            )
+        desvio = comparacao["maximo_absoluto"]
+        if desvio is not None and desvio > limites.desvio_utilizacao:
+            regressoes.append(
+                f"{nome}: desvio de utilizacao entre os modos {desvio:.4f}, "
+                f"limite {limites.desvio_utilizacao:.4f}"
+            )
+    return regressoes
+
+
+def main(argumentos: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark de desempenho e precisao da verificacao FCO."
+    )
+    parser.add_argument(
+        "--motor", choices=MOTORES, default=CatalogoArmadurasFCO.motor
+    )
+    parser.add_argument("--execucao", choices=MODOS_EXECUCAO, default="serial")
+    parser.add_argument("--repeticoes", type=int, default=1)
+    parser.add_argument(
+        "--casos",
+        nargs="*",
+        help="Trechos de nome dos casos do corpus a executar.",
+    )
+    parser.add_argument("--sem-memoria", action="store_true")
+    parser.add_argument(
+        "--saida", type=Path, help="Arquivo do relatorio JSON."
+    )
+    parser.add_argument(
+        "--referencia", type=Path, help="Relatorio anterior para comparacao."
+    )
+    for campo in fields(LimitesRegressaoFCO):
+        parser.add_argument(
+            f"--limite-{campo.name.replace('_', '-')}",
+            dest=campo.name,
+            type=float,
+            default=campo.default,
+        )
+    opcoes = parser.parse_args(argumentos)
+
+    casos = [
+        caso
+        for caso in CORPUS_BENCHMARK_FCO
+        if not opcoes.casos
+        or any(trecho in caso.nome for trecho in opcoes.casos)
+    ]
+    relatorio = executar_benchmark_fco(
+        casos=casos,
+        motor=opcoes.motor,
+        execucao=opcoes.execucao,
+        repeticoes=opcoes.repeticoes,
+        medir_memoria=not opcoes.sem_memoria,
+    )
+    limites = LimitesRegressaoFCO(
+        **{
+            campo.name: getattr(opcoes, campo.name)
+            for campo in fields(LimitesRegressaoFCO)
+        }
+    )
+    referencia = (
+        json.loads(opcoes.referencia.read_text(encoding="utf-8"))
+        if opcoes.referencia is not None
+        else None
+    )
+    regressoes = verificar_regressoes(relatorio, referencia, limites)
+    relatorio["limites"] = asdict(limites)
+    relatorio["referencia"] = (
+        str(opcoes.referencia) if opcoes.referencia is not None else None
+    )
+    relatorio["regressoes"] = regressoes
+    relatorio["aprovado"] = not regressoes
+
+    texto = json.dumps(relatorio, indent=2, ensure_ascii=False) + "\n"
+    if opcoes.saida is not None:
+        opcoes.saida.write_text(texto, encoding="utf-8")
+        for regressao in regressoes:
+            print(regressao, file=sys.stderr)
+    else:
+        sys.stdout.write(texto)
+    return 1 if regressoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
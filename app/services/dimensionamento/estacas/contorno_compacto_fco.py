@@ -0,0 +1,162 @@
+"""Representações compactas do contorno Mx-My da recomendação.
+
+Com a força normal dentro da capacidade, o contorno envolve a origem e é
+estrelado em relação a ela: basta o raio ``r`` em função do ângulo
+geométrico ``beta = atan2(m_x, m_y)``, isto é, ``m_x = r sen(beta)`` e
+``m_y = r cos(beta)``. Pela convenção ``m_x = soma(F*y)`` e
+``m_y = soma(F*x)``, o vetor ``(m_y, m_x)`` gira e reflete com a armadura
+(ver ``construir_tabela_setor_capacidade``). Uma camada de ``n`` barras com
+a primeira em ``alfa`` dá então a ``r`` período ``2 pi / n`` e simetria par
+em torno de ``beta = alfa``, e a série de Fourier só tem os cossenos
+
+    r(beta) = a_0 + soma_j a_j cos(j n (beta - alfa)).
+
+Os coeficientes saem de mínimos quadrados sobre a volta completa, e o desvio
+radial máximo é medido contra o contorno amostrado, nos ângulos de uma grade
+fina e nos dos próprios vértices.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.dimensionamento.estacas.geometria_setor_fco import (
+    intersecoes_raios_poligonos,
+)
+
+
+FORMATOS_DIAGRAMA = ("pontos", "arrays", "fourier")
+HARMONICAS_MAXIMAS_FOURIER = 32
+AMOSTRAS_AJUSTE_FOURIER = 2048
+# Desvio admitido sem tolerancia informada, sobre o raio medio do contorno.
+DESVIO_RELATIVO_FOURIER = 0.002
+
+
+@dataclass(frozen=True)
+class SerieFourierContornoFCO:
+    """Raio do contorno em função de ``beta``, com a simetria da camada."""
+
+    quantidade_barras: int
+    angulo_eixo_rad: float
+    coeficientes: Tuple[float, ...]
+
+    def raio(self, beta: Any) -> np.ndarray:
+        harmonicas = self.quantidade_barras * np.arange(len(self.coeficientes))
+        fase = np.asarray(beta, dtype=float)[..., None] - self.angulo_eixo_rad
+        return np.cos(fase * harmonicas) @ np.asarray(self.coeficientes)
+
+    def contorno(self, pontos: int) -> List[Tuple[float, float]]:
+        beta = np.linspace(-math.pi, math.pi, pontos, endpoint=False)
+        raio = self.raio(beta)
+        return list(zip(raio * np.sin(beta), raio * np.cos(beta)))
+
+
+def ajustar_serie_fourier_contorno(
+    contorno: Sequence[Tuple[float, float]],
+    *,
+    quantidade_barras: int,
+    angulo_inicial_barras_rad: float,
+    desvio_maximo: Optional[float] = None,
+    harmonicas_maximas: int = HARMONICAS_MAXIMAS_FOURIER,
+) -> Tuple[SerieFourierContornoFCO, float]:
+    """Menor série que fica a ``desvio_maximo`` do contorno, e o desvio obtido.
+
+    Sem ``desvio_maximo``, admite ``DESVIO_RELATIVO_FOURIER`` do raio médio.
+    Se nem ``harmonicas_maximas`` cossenos bastam, devolve a última série com
+    o desvio que ela alcança. ``ValueError`` indica contorno que não envolve
+    a origem.
+    """
+
+    vertices = np.asarray(contorno, dtype=float).reshape(-1, 2)
+    beta = np.concatenate(
+        [
+            np.linspace(
+                -math.pi, math.pi, AMOSTRAS_AJUSTE_FOURIER, endpoint=False
+            ),
+            np.arctan2(vertices[:, 0], vertices[:, 1]),
+        ]
+    )
+    raio = intersecoes_raios_poligonos(
+        np.column_stack([np.sin(beta), np.cos(beta)]), vertices
+    )["fator_escala"]
+    if np.isnan(raio).any():
+        raise ValueError(
+            "O contorno nao envolve a origem; a serie de Fourier nao se aplica."
+        )
+    if desvio_maximo is None:
+        desvio_maximo = DESVIO_RELATIVO_FOURIER * float(
+            raio[:AMOSTRAS_AJUSTE_FOURIER].mean()
+        )
+
+    repeticoes = max(1, int(quantidade_barras))
+    fase = (beta - angulo_inicial_barras_rad)[:, None]
+    for quantidade in range(1, harmonicas_maximas + 2):
+        base = np.cos(fase * repeticoes * np.arange(quantidade))
+        # A grade uniforme define o ajuste; os vertices so entram no desvio.
+        coeficientes = np.linalg.lstsq(
+            base[:AMOSTRAS_AJUSTE_FOURIER],
+            raio[:AMOSTRAS_AJUSTE_FOURIER],
+            rcond=None,
+        )[0]
+        desvio = float(np.abs(base @ coeficientes - raio).max())
+        if desvio <= desvio_maximo:
+            break
+    serie = SerieFourierContornoFCO(
+        quantidade_barras=repeticoes,
+        angulo_eixo_rad=angulo_inicial_barras_rad,
+        coeficientes=tuple(float(valor) for valor in coeficientes),
+    )
+    return serie, desvio
+
+
+def compactar_diagrama(
+    diagrama_tf_m: Sequence[Dict[str, float]],
+    *,
+    formato: str,
+    quantidade_barras: int,
+    angulo_inicial_barras_rad: float,
+    desvio_maximo_tf_m: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Contorno ``[{mx_rd_tf_m, my_rd_tf_m}]`` no ``formato`` pedido.
+
+    ``arrays`` separa as coordenadas em duas listas; ``fourier`` devolve os
+    coeficientes de ``ajustar_serie_fourier_contorno`` e volta para
+    ``arrays``, com o motivo, se o contorno não envolver a origem.
+    """
+
+    mx = [ponto["mx_rd_tf_m"] for ponto in diagrama_tf_m]
+    my = [ponto["my_rd_tf_m"] for ponto in diagrama_tf_m]
+    arrays = {"formato": "arrays", "mx_rd_tf_m": mx, "my_rd_tf_m": my}
+    if formato == "arrays" or not diagrama_tf_m:
+        return arrays
+    try:
+        serie, desvio = ajustar_serie_fourier_contorno(
+            list(zip(mx, my)),
+            quantidade_barras=quantidade_barras,
+            angulo_inicial_barras_rad=angulo_inicial_barras_rad,
+            desvio_maximo=desvio_maximo_tf_m,
+        )
+    except ValueError as exc:
+        return {**arrays, "erro_fourier": str(exc)}
+    return {
+        "formato": "fourier",
+        "expressao": (
+            "r(beta) = soma_j coeficientes_tf_m[j] * cos(j * "
+            "quantidade_barras * (beta - angulo_eixo_rad)), com "
+            "mx_rd_tf_m = r sen(beta) e my_rd_tf_m = r cos(beta); a "
+            "demanda atende se |M| <= r(atan2(mx, my))"
+        ),
+        "quantidade_barras": serie.quantidade_barras,
+        "angulo_eixo_rad": serie.angulo_eixo_rad,
+        "coeficientes_tf_m": list(serie.coeficientes),
+        "desvio_radial_maximo_tf_m": desvio,
+        "desvio_admitido_tf_m": (
+            desvio_maximo_tf_m
+            if desvio_maximo_tf_m is not None
+            else DESVIO_RELATIVO_FOURIER * serie.coeficientes[0]
+        ),
+    }
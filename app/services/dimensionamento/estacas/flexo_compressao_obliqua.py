@@ -12,16 +12,172 @@ e a classificação não substitui as demais verificações normativas.
 
 from __future__ import annotations
 
+import heapq
 import importlib.metadata
 import math
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import multiprocessing
+import os
+import queue
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import astuple, dataclass, field, replace
+from time import monotonic, perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+import numpy as np
+
+from app.services.dimensionamento.estacas.abaco_fco import (
+    AbacoFCO,
+    ForaDoAbacoFCO,
+    carregar_abaco_fco,
+)
+from app.services.dimensionamento.estacas.contorno_compacto_fco import (
+    FORMATOS_DIAGRAMA,
+    compactar_diagrama,
+)
+from app.services.dimensionamento.estacas.geometria_setor_fco import (
+    INTERVALOS_INICIAIS_CONTORNO_ADAPTATIVO,
+    PROFUNDIDADE_MAXIMA_CONTORNO_ADAPTATIVO,
+    TOLERANCIA,
+    TabelaSetorCapacidadeFCO,
+    construir_tabela_setor_adaptativa,
+    construir_tabela_setor_capacidade,
+    fechar_poligono,
+    imagens_simetricas_momento,
+    intersecao_raio_poligono,
+    intersecoes_raios_poligonos,
+    normalizar_angulo_rad,
+    pontos_tabela_setor,
+)
+from app.services.dimensionamento.estacas.instrumentacao_fco import (
+    contar,
+    instrumentacao_ativa,
+    instrumentar_fco,
+    medir,
+)
+from app.services.dimensionamento.estacas.momento_curvatura_fco import (
+    FATOR_PICO_CONCRETO_CURVA,
+    PONTOS_CURVA_MOMENTO_CURVATURA,
+    CurvaMomentoCurvaturaFCO,
+    construir_curva_momento_curvatura,
+)
+from app.services.dimensionamento.estacas.secao_fibras_fco import (
+    ANEIS_PADRAO,
+    FIBRAS_NO_ANEL_CENTRAL,
+    PONTOS_GAUSS_SEGMENTO,
+    FalhaEquilibrioFibras,
+    SecaoFibrasCircularFCO,
+    SecaoSegmentosCircularFCO,
+    comparar_capacidades,
+)
 
 
 TF_PARA_N = 9_806.65
 TF_M_PARA_N_MM = TF_PARA_N * 1_000.0
-TOLERANCIA = 1e-9
 MAXIMO_COMBINACOES = 80
+MAXIMO_COMBINACOES_CARGA = 100
+CACHE_SECOES_MAXIMO_ENTRADAS = 256
+CACHE_GEOMETRIAS_MAXIMO_ENTRADAS = 64
+# Custo estimado em vertices da geometria: contorno do concreto, furos e
+# barras. Limita a memoria do cache independentemente do tamanho das secoes.
+CACHE_SECOES_CUSTO_MAXIMO = 200_000
+PONTOS_CONTORNO_BARRA = 8
+PROCESSOS_FCO_MAXIMO = max(1, min(8, os.cpu_count() or 1))
+MODOS_EXECUCAO = ("serial", "processos")
+MOTORES = ("concreteproperties", "nativo", "analitico", "abaco")
+BIBLIOTECAS_MOTOR = {
+    "concreteproperties": "concreteproperties",
+    "nativo": "openStruct - fibras NumPy",
+    "analitico": "openStruct - segmentos circulares NumPy",
+    "abaco": "openStruct - abaco adimensional (segmentos circulares)",
+}
+ESTRATEGIAS_BUSCA = (
+    "linear",
+    "bissecao",
+    "ramificacao_limite",
+    "preditor",
+    "triagem",
+)
+# Intervalos minimos por meio setor quando a tabela de capacidade por
+# simetria orienta a busca direcional.
+PONTOS_TABELA_SETOR_MINIMO = 4
+# Superficie de interacao N-Mx-My: niveis de N, direcoes de momento por nivel
+# e faixa de utilizacao em torno de 1 em que a interpolacao nao decide.
+# A versao entra na chave do cache e deve mudar com o formato dos arrays.
+VERSAO_SUPERFICIE_INTERACAO = 1
+NIVEIS_SUPERFICIE_INTERACAO = 16
+DIRECOES_SUPERFICIE_INTERACAO = 72
+MARGEM_SUPERFICIE_INTERACAO = 0.05
+PEDIDOS_SUPERFICIE_MAXIMO_ENTRADAS = 1_024
+# Folga dos limites de capacidade do modo de decisao antecipada. A
+# normalidade do contorno discreto falha em ate ~0,6% nos dois motores
+# nativos.
+FOLGA_LIMITES_CAPACIDADE = 0.02
+PONTOS_PERFIL_CONCRETO = 20
+# Modelo grosseiro da estrategia "triagem". As opcoes com utilizacao a menos
+# de FAIXA_INCERTEZA_TRIAGEM de 1 sao refeitas no modelo completo.
+PONTOS_CONTORNO_TRIAGEM = 24
+PONTOS_PERFIL_TRIAGEM = 6
+ANEIS_TRIAGEM = 8
+PONTOS_GAUSS_TRIAGEM = 4
+TOLERANCIA_ANGULAR_TRIAGEM_GRAUS = 0.5
+FAIXA_INCERTEZA_TRIAGEM = 0.05
+# Inclinacoes d(theta)/d(angulo do momento) aceitas como primeiro passo da
+# busca seguinte; fora disso a secante degenerou.
+INCLINACAO_PARTIDA_MINIMA = 0.2
+INCLINACAO_PARTIDA_MAXIMA = 5.0
+# Inclinacao sem historico: o momento resistente da linha neutra ``theta``
+# aponta para cerca de ``-theta`` (ver ``momento_curvatura_fco``).
+INCLINACAO_PARTIDA_FRIA = -1.0
+# Profundidade relativa do bloco retangular equivalente (NBR 6118, fck <= 50).
+FATOR_BLOCO_RETANGULAR = 0.8
+# Analise em fluxo: eventos aguardando o consumidor e intervalo em que a
+# thread da analise confere se o fluxo foi fechado.
+MAXIMO_EVENTOS_PENDENTES_FLUXO = 16
+INTERVALO_ESPERA_FLUXO_S = 0.5
+# Chaves que a analise ainda le de uma alternativa ja enviada no fluxo; as
+# demais saem dela assim que o evento e produzido.
+CHAVES_OPCAO_FLUXO = frozenset(
+    {
+        "id",
+        "quantidade_barras",
+        "diametro_barra_mm",
+        "area_aco_total_cm2",
+        "status",
+        "atende",
+        "utilizacao",
+        "iteracoes_angulo",
+        "combinacoes_por_decisao_antecipada",
+        "decidida_na_triagem",
+        "utilizacao_triagem",
+    }
+)
+# Efeitos locais de segunda ordem (NBR 6118, 15.8). Os metodos aproximados do
+# pilar-padrao valem ate lambda = 90; o pilar-padrao acoplado a curvas
+# momento-curvatura, ate lambda = 140.
+METODOS_SEGUNDA_ORDEM = (
+    "curvatura_aproximada",
+    "rigidez_kappa",
+    "momento_curvatura",
+)
+ESBELTEZ_MAXIMA_METODOS_APROXIMADOS = 90.0
+ESBELTEZ_MAXIMA_MOMENTO_CURVATURA = 140.0
+ANEIS_CURVA_MOMENTO_CURVATURA = 12
+CACHE_CURVAS_MAXIMO_ENTRADAS = 1_024
 
 
 class ErroFlexoCompressaoObliqua(ValueError):
@@ -36,6 +192,137 @@ class FalhaAnaliseSecao(RuntimeError):
     """Indica falha numérica durante a análise de uma ou mais seções."""
 
 
+class FluxoFCOInterrompido(RuntimeError):
+    """Indica que o consumidor fechou o fluxo de ``analisar_em_fluxo``."""
+
+
+class PrazoEsgotadoFCO(RuntimeError):
+    """Indica que o ``tempo_maximo_s`` do catálogo terminou."""
+
+
+class CacheLRUFCO:
+    """Cache LRU limitado por quantidade de entradas e por custo estimado.
+
+    E compartilhado entre requisicoes do mesmo processo. O acesso e protegido
+    por trava porque as rotas sincronas do FastAPI rodam em threads.
+    """
+
+    def __init__(self, max_entradas: int, custo_maximo: float) -> None:
+        self.max_entradas = max_entradas
+        self.custo_maximo = custo_maximo
+        self._itens: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._custo_total = 0.0
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter_ou_criar(
+        self,
+        chave: Hashable,
+        fabrica: Callable[[], Any],
+        custo: float,
+    ) -> Tuple[Any, bool]:
+        """Retorna ``(valor, acertou)``, construindo o valor na falha."""
+
+        with self._trava:
+            item = self._itens.get(chave)
+            if item is not None:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return item[0], True
+            self.falhas += 1
+
+        # A construcao fica fora da trava para nao serializar as requisicoes.
+        valor = fabrica()
+        if custo > self.custo_maximo:
+            return valor, False
+
+        with self._trava:
+            anterior = self._itens.pop(chave, None)
+            if anterior is not None:
+                self._custo_total -= anterior[1]
+            self._itens[chave] = (valor, custo)
+            self._custo_total += custo
+            while self._itens and (
+                len(self._itens) > self.max_entradas
+                or self._custo_total > self.custo_maximo
+            ):
+                _, (_, custo_removido) = self._itens.popitem(last=False)
+                self._custo_total -= custo_removido
+        return valor, False
+
+    def __contains__(self, chave: Hashable) -> bool:
+        with self._trava:
+            return chave in self._itens
+
+    def estatisticas(self) -> Dict[str, Any]:
+        with self._trava:
+            return {
+                "entradas": len(self._itens),
+                "max_entradas": self.max_entradas,
+                "custo_estimado": self._custo_total,
+                "custo_maximo": self.custo_maximo,
+                "acertos_acumulados": self.acertos,
+                "falhas_acumuladas": self.falhas,
+            }
+
+    def limpar(self) -> None:
+        with self._trava:
+            self._itens.clear()
+            self._custo_total = 0.0
+            self.acertos = 0
+            self.falhas = 0
+
+
+CACHE_SECOES_FCO = CacheLRUFCO(
+    max_entradas=CACHE_SECOES_MAXIMO_ENTRADAS,
+    custo_maximo=CACHE_SECOES_CUSTO_MAXIMO,
+)
+# Discos de concreto sem armadura, compartilhados por todas as alternativas
+# de um mesmo diametro.
+CACHE_GEOMETRIAS_FCO = CacheLRUFCO(
+    max_entradas=CACHE_GEOMETRIAS_MAXIMO_ENTRADAS,
+    custo_maximo=CACHE_SECOES_CUSTO_MAXIMO,
+)
+# Tabelas de capacidade por setor, uma por secao e forca normal.
+CACHE_TABELAS_SETOR_FCO = CacheLRUFCO(
+    max_entradas=CACHE_SECOES_MAXIMO_ENTRADAS,
+    custo_maximo=CACHE_SECOES_CUSTO_MAXIMO,
+)
+# Superficies N-Mx-My por alternativa; o custo e o numero de raios.
+CACHE_SUPERFICIES_FCO = CacheLRUFCO(
+    max_entradas=CACHE_SECOES_MAXIMO_ENTRADAS,
+    custo_maximo=CACHE_SECOES_CUSTO_MAXIMO,
+)
+# Chaves de superficie das alternativas que ja atenderam na analise da
+# secao: so elas ganham superficie quando verificadas de novo.
+CACHE_PEDIDOS_SUPERFICIES_FCO = CacheLRUFCO(
+    max_entradas=PEDIDOS_SUPERFICIE_MAXIMO_ENTRADAS,
+    custo_maximo=PEDIDOS_SUPERFICIE_MAXIMO_ENTRADAS,
+)
+# Curvas momento-curvatura por alternativa, forca normal e direcao reduzida
+# ao meio setor das barras; o custo e o numero de pontos.
+CACHE_CURVAS_FCO = CacheLRUFCO(
+    max_entradas=CACHE_CURVAS_MAXIMO_ENTRADAS,
+    custo_maximo=CACHE_SECOES_CUSTO_MAXIMO,
+)
+CACHES_FCO = {
+    "secoes": CACHE_SECOES_FCO,
+    "geometrias_concreto": CACHE_GEOMETRIAS_FCO,
+    "tabelas_setor": CACHE_TABELAS_SETOR_FCO,
+    "superficies_interacao": CACHE_SUPERFICIES_FCO,
+    "pedidos_superficies_interacao": CACHE_PEDIDOS_SUPERFICIES_FCO,
+    "curvas_momento_curvatura": CACHE_CURVAS_FCO,
+}
+
+
+def limpar_caches_fco() -> None:
+    """Esvazia os caches de processo usados pela verificacao FCO."""
+
+    for cache in CACHES_FCO.values():
+        cache.limpar()
+
+
 @dataclass(frozen=True)
 class SecaoCircularFCO:
     diametro_m: float
@@ -64,6 +351,20 @@ class EsforcosFCO:
     normal_compressao_sd_tf: float
     momento_x_sd_tf_m: float
     momento_y_sd_tf_m: float
+    nome: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class EsbeltezFCO:
+    """Trecho sem contenção lateral da estaca (parte livre ou em solo mole).
+
+    ``alfa_b`` segue a NBR 6118 (15.8.2) e vale 1 quando o momento de
+    primeira ordem fica abaixo do mínimo.
+    """
+
+    comprimento_flambagem_m: float
+    metodo: str = "curvatura_aproximada"
+    alfa_b: float = 1.0
 
 
 @dataclass(frozen=True)
@@ -79,67 +380,295 @@ class CatalogoArmadurasFCO:
     modo_verificacao: str = "direcional"
     tolerancia_angular_graus: float = 0.05
     max_iteracoes_angulo: int = 8
+    execucao: str = "serial"
+    estrategia_busca: str = "linear"
+    motor: str = "concreteproperties"
+    conferir_motor_nativo: bool = False
+    usar_tabela_setor: bool = False
+    usar_superficie_interacao: bool = False
+    decisao_antecipada: bool = False
+    confirmar_abaco: bool = False
+    tolerancia_contorno_tf_m: Optional[float] = None
+    formato_diagrama: str = "pontos"
+    instrumentar: bool = False
+    # Orcamento da requisicao; sem ele o catalogo e avaliado por inteiro.
+    tempo_maximo_s: Optional[float] = None
+
+
+@dataclass(frozen=True, eq=False)
+class SuperficieInteracaoFCO:
+    """Pilha de contornos Mx-My em uma grade de N, em ``float32``.
+
+    ``raios_n_mm[i, j]`` e o momento resistente na direcao
+    ``-pi + 2*pi*j/m`` para a forca normal ``normais_n[i]``.
+    """
+
+    normais_n: np.ndarray
+    raios_n_mm: np.ndarray
+
+    def avaliar(
+        self,
+        *,
+        normal_n: float,
+        demanda_n_mm: Tuple[float, float],
+        margem: float,
+    ) -> Optional[Dict[str, Any]]:
+        """Verifica a demanda por interpolacao bilinear em (N, direcao).
+
+        Retorna ``None`` quando a superficie nao decide: demanda nula,
+        utilizacao a menos de ``margem`` de 1 ou N fora da grade. O ultimo
+        intervalo da grade tambem fica de fora, porque o contorno se fecha
+        rapidamente perto da compressao centrada e a interpolacao linear em
+        N deixa de ser confiavel. Nesses casos a verificacao segue pela
+        analise da secao.
+        """
+
+        normais = self.normais_n
+        modulo = math.hypot(*demanda_n_mm)
+        if (
+            len(normais) < 3
+            or modulo <= TOLERANCIA
+            or not normais[0] <= normal_n < normais[-2]
+        ):
+            return None
+
+        nivel = int(np.searchsorted(normais, normal_n, side="right")) - 1
+        fracao_normal = (normal_n - float(normais[nivel])) / float(
+            normais[nivel + 1] - normais[nivel]
+        )
+        direcoes = self.raios_n_mm.shape[1]
+        angulo = math.atan2(demanda_n_mm[1], demanda_n_mm[0])
+        posicao = (angulo + math.pi) / (2.0 * math.pi) * direcoes
+        direcao = int(posicao) % direcoes
+        fracao_direcao = posicao - math.floor(posicao)
+        vizinhos = self.raios_n_mm[
+            nivel : nivel + 2, [direcao, (direcao + 1) % direcoes]
+        ].astype(float)
+        por_nivel = (
+            vizinhos[:, 0] * (1.0 - fracao_direcao)
+            + vizinhos[:, 1] * fracao_direcao
+        )
+        momento_resistente = float(
+            por_nivel[0] * (1.0 - fracao_normal) + por_nivel[1] * fracao_normal
+        )
+        if momento_resistente <= TOLERANCIA:
+            return None
+        utilizacao = modulo / momento_resistente
+        if abs(utilizacao - 1.0) <= margem:
+            return None
+
+        fator_reserva = momento_resistente / modulo
+        return {
+            "convergiu": True,
+            "atende": utilizacao <= 1.0,
+            "utilizacao": utilizacao,
+            "fator_reserva": fator_reserva,
+            "momento_resistente_n_mm": momento_resistente,
+            "ponto_resistente_n_mm": (
+                demanda_n_mm[0] * fator_reserva,
+                demanda_n_mm[1] * fator_reserva,
+            ),
+            "angulo_linha_neutra_graus": None,
+            "angulo_momento_resistente_graus": math.degrees(angulo),
+            "erro_angular_graus": None,
+            "iteracoes_angulo": 0,
+            "origem": "superficie_interacao",
+        }
 
 
 @dataclass
 class DimensionadorFlexoCompressaoObliqua:
     secao: SecaoCircularFCO
     materiais: MateriaisFCO
-    esforcos: EsforcosFCO
+    esforcos: Optional[EsforcosFCO]
     catalogo: CatalogoArmadurasFCO
+    # Alternativa a ``esforcos``: todas as combinacoes ELU a atender.
+    combinacoes_carga: Sequence[EsforcosFCO] = ()
+    # Sem ``esbeltez``, apenas a resistencia da secao e verificada.
+    esbeltez: Optional[EsbeltezFCO] = None
+    _estatisticas_cache: Dict[str, Dict[str, int]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+    _ordem_combinacoes: Dict[float, List[int]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+    # Verdadeiro na copia criada por ``_modelo_triagem``.
+    _grosseiro: bool = field(default=False, init=False, repr=False)
+    # Ultimo ``(theta, inclinacao)`` por combinacao de carga: partida da
+    # busca direcional na alternativa seguinte.
+    _partidas_angulo: Dict[int, Tuple[float, float]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+    # ``(ordem, id, secao)`` da alternativa mais barata que atende ate aqui,
+    # durante uma requisicao; o contorno da recomendacao reaproveita a secao
+    # mesmo apos sair do cache.
+    _secao_recomendada: Optional[
+        Tuple[Tuple[float, int, float], str, Any]
+    ] = field(default=None, init=False, repr=False)
+    # ``(material_concreto, material_aco)`` ja criados para os mesmos
+    # materiais, p. ex. pela varredura de diametros.
+    _materiais_compartilhados: Optional[Tuple[Any, Any]] = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    # Efeitos de segunda ordem por combinacao e esforcos de calculo
+    # correspondentes; dependem apenas dos campos de entrada.
+    _segunda_ordem: Optional[List[Dict[str, Any]]] = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    _esforcos_calculo: Optional[List[EsforcosFCO]] = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    # Instante de ``time.monotonic`` em que ``tempo_maximo_s`` termina. O
+    # relogio monotonico e o do sistema, comum aos processos do pool.
+    _prazo: Optional[float] = field(default=None, init=False, repr=False)
+    # Chamada com cada alternativa concluida (ver ``analisar_em_fluxo``).
+    _ao_concluir_opcao: Optional[Callable[[Dict[str, Any]], None]] = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    # Na analise em fluxo, a alternativa completa de menor quantidade que
+    # atende em cada bitola; ``None`` fora do fluxo.
+    _retidas_fluxo: Optional[Dict[float, Dict[str, Any]]] = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # A notificacao pertence ao processo principal; os processos do pool
+        # devolvem as alternativas, notificadas ao chegar.
+        estado = dict(self.__dict__)
+        estado["_ao_concluir_opcao"] = None
+        estado["_secao_recomendada"] = None
+        estado["_retidas_fluxo"] = None
+        return estado
 
     def analisar(self) -> Dict[str, Any]:
+        if not self.catalogo.instrumentar:
+            return self._analisar()
+        inicio = perf_counter()
+        with instrumentar_fco() as instrumentacao:
+            resultado = self._analisar()
+        resumo = instrumentacao.resumo()
+        iteracoes_secante = resumo["contagens"].get("iteracoes_secante", 0)
+        analisadas = sum(
+            1
+            for opcao in resultado["opcoes"]
+            if opcao.get("iteracoes_angulo") is not None
+        )
+        resultado["metodo"]["instrumentacao"] = {
+            "tempo_analise_s": perf_counter() - inicio,
+            **resumo,
+            # Inclui a reanalise da recomendacao; sem busca direcional (modo
+            # diagrama_completo ou motor abaco) fica None.
+            "iteracoes_secante_por_opcao": (
+                iteracoes_secante / analisadas
+                if iteracoes_secante and analisadas
+                else None
+            ),
+        }
+        return resultado
+
+    def _analisar(self) -> Dict[str, Any]:
+        self._estatisticas_cache = {
+            nome: {"acertos": 0, "falhas": 0} for nome in CACHES_FCO
+        }
+        self._secao_recomendada = None
         self._validar_entradas()
+        self._prazo = (
+            monotonic() + self.catalogo.tempo_maximo_s
+            if self.catalogo.tempo_maximo_s is not None
+            else None
+        )
         combinacoes, modo_catalogo = self._combinacoes()
         deps = self._carregar_dependencias()
-        material_concreto, material_aco = self._criar_materiais(deps)
+        material_concreto, material_aco = (
+            self._materiais_compartilhados or self._criar_materiais(deps)
+        )
 
         opcoes: List[Dict[str, Any]] = []
         interrompidas_por_bitola: Dict[float, int] = {}
+        busca_por_bitola: Dict[float, Dict[str, Any]] = {}
         incluir_diagrama_durante_catalogo = (
             self.catalogo.incluir_diagrama_recomendacao
             and self.catalogo.modo_verificacao == "diagrama_completo"
         )
 
-        if modo_catalogo == "grade":
-            por_bitola: Dict[float, List[int]] = {}
-            for quantidade, bitola in combinacoes:
-                por_bitola.setdefault(bitola, []).append(quantidade)
-
-            for bitola in sorted(por_bitola):
-                quantidades = sorted(set(por_bitola[bitola]))
-                encontrou = False
-                for indice, quantidade in enumerate(quantidades):
-                    opcao = self._analisar_opcao(
-                        deps=deps,
-                        material_concreto=material_concreto,
-                        material_aco=material_aco,
-                        quantidade=quantidade,
-                        bitola_mm=bitola,
-                        incluir_diagrama=incluir_diagrama_durante_catalogo,
-                    )
-                    opcoes.append(opcao)
-                    if opcao["atende"]:
-                        encontrou = True
-                        if self.catalogo.parar_na_primeira_opcao_por_bitola:
-                            interrompidas_por_bitola[bitola] = (
-                                len(quantidades) - indice - 1
-                            )
-                            break
-                if not encontrou:
-                    interrompidas_por_bitola.setdefault(bitola, 0)
+        triagem = None
+        if self.catalogo.estrategia_busca == "ramificacao_limite":
+            # A poda depende da melhor opcao ja encontrada: busca sequencial.
+            processos = 1
+            quantidade_tarefas = 1
+            resultados_por_bitola = self._buscar_por_ramificacao(
+                deps=deps,
+                material_concreto=material_concreto,
+                material_aco=material_aco,
+                combinacoes=combinacoes,
+                incluir_diagrama=incluir_diagrama_durante_catalogo,
+            )
+        elif self.catalogo.estrategia_busca == "triagem":
+            resultados_por_bitola, processos, triagem = self._buscar_por_triagem(
+                deps=deps,
+                material_concreto=material_concreto,
+                material_aco=material_aco,
+                combinacoes=combinacoes,
+                incluir_diagrama=incluir_diagrama_durante_catalogo,
+            )
+            quantidade_tarefas = len(combinacoes)
         else:
-            for quantidade, bitola in combinacoes:
-                opcoes.append(
-                    self._analisar_opcao(
-                        deps=deps,
-                        material_concreto=material_concreto,
-                        material_aco=material_aco,
-                        quantidade=quantidade,
-                        bitola_mm=bitola,
-                        incluir_diagrama=incluir_diagrama_durante_catalogo,
-                    )
+            tarefas = self._tarefas_catalogo(combinacoes, modo_catalogo)
+            quantidade_tarefas = len(tarefas)
+            resultados, processos = self._avaliar_tarefas(
+                deps=deps,
+                tarefas=tarefas,
+                incluir_diagrama=incluir_diagrama_durante_catalogo,
+                material_concreto=material_concreto,
+                material_aco=material_aco,
+            )
+            pares = list(zip(tarefas, resultados))
+            if self.catalogo.tempo_maximo_s is not None and not any(
+                parar for _, _, parar in tarefas
+            ):
+                # As tarefas isoladas correram por area; a resposta volta a
+                # ordem do catalogo.
+                posicao = {
+                    combinacao: indice
+                    for indice, combinacao in enumerate(combinacoes)
+                }
+                pares.sort(
+                    key=lambda par: posicao[(par[0][1][0], par[0][0])]
+                )
+            resultados_por_bitola = [
+                (bitola, resultado) for (bitola, _, _), resultado in pares
+            ]
+
+        pendentes_prazo: List[Tuple[int, float]] = []
+        for bitola, resultado in resultados_por_bitola:
+            opcoes.extend(resultado["opcoes"])
+            pendentes_prazo.extend(
+                (quantidade, bitola)
+                for quantidade in resultado.get("pendentes_prazo", [])
+            )
+            if modo_catalogo == "grade":
+                interrompidas_por_bitola[bitola] = (
+                    interrompidas_por_bitola.get(bitola, 0)
+                    + resultado["nao_avaliadas"]
                 )
+            if resultado.get("busca"):
+                busca_por_bitola[bitola] = resultado["busca"]
 
         candidatas = [opcao for opcao in opcoes if opcao["atende"]]
         recomendacao_original = min(
@@ -153,41 +682,156 @@ class DimensionadorFlexoCompressaoObliqua:
         )
 
         diagrama_recomendacao: List[Dict[str, float]] = []
+        # Etapas posteriores ao catalogo puladas por tempo_maximo_s.
+        etapas_omitidas: List[str] = []
         recomendacao = (
             dict(recomendacao_original) if recomendacao_original else None
         )
-        if recomendacao and self.catalogo.incluir_diagrama_recomendacao:
+        # Na decisao antecipada a utilizacao do catalogo e apenas um limite,
+        # e na triagem pode vir do modelo grosseiro: so nesses casos a
+        # recomendacao e analisada de novo, ate a tolerancia angular.
+        refinar_recomendacao = bool(
+            recomendacao
+            and self.catalogo.modo_verificacao == "direcional"
+            and (
+                recomendacao["combinacoes_por_decisao_antecipada"]
+                or recomendacao.get("decidida_na_triagem")
+            )
+        )
+        if recomendacao and refinar_recomendacao:
+            angulo = recomendacao.get("angulo_linha_neutra_graus")
+            if angulo is not None:
+                # Com execucao por processos, o estado do processo principal
+                # nao viu a recomendacao.
+                determinante = recomendacao["combinacao_determinante"]
+                _, inclinacao = self._partidas_angulo.get(
+                    determinante, (0.0, INCLINACAO_PARTIDA_FRIA)
+                )
+                self._partidas_angulo[determinante] = (
+                    math.radians(angulo),
+                    inclinacao,
+                )
+            try:
+                with medir("reanalise_recomendacao"):
+                    detalhada = self._analisar_opcao(
+                        deps=deps,
+                        material_concreto=material_concreto,
+                        material_aco=material_aco,
+                        quantidade=recomendacao["quantidade_barras"],
+                        bitola_mm=recomendacao["diametro_barra_mm"],
+                        incluir_diagrama=(
+                            self.catalogo.incluir_diagrama_recomendacao
+                        ),
+                        refinar=True,
+                    )
+            except PrazoEsgotadoFCO:
+                etapas_omitidas.append("refino_recomendacao")
+                if self.catalogo.incluir_diagrama_recomendacao:
+                    etapas_omitidas.append("diagrama_recomendacao")
+            else:
+                diagrama_recomendacao = detalhada.pop(
+                    "diagrama_mx_my_tf_m", []
+                )
+                recomendacao = detalhada
+        elif recomendacao and self.catalogo.incluir_diagrama_recomendacao:
             if self.catalogo.modo_verificacao == "diagrama_completo":
                 diagrama_recomendacao = recomendacao.pop(
                     "diagrama_mx_my_tf_m", []
                 )
+            elif self._prazo_esgotado():
+                etapas_omitidas.append("diagrama_recomendacao")
+            else:
+                # O resultado direcional do catalogo ja e o definitivo: falta
+                # apenas o contorno.
+                with medir("diagrama_recomendacao"):
+                    diagrama_recomendacao, erro_diagrama, amostragem = (
+                        self._diagrama_recomendacao(
+                            deps=deps,
+                            material_concreto=material_concreto,
+                            material_aco=material_aco,
+                            opcao=recomendacao,
+                        )
+                    )
+                recomendacao["erro_diagrama_recomendacao"] = erro_diagrama
+                recomendacao["amostragem_diagrama"] = amostragem
+        # A secao guardada so servia ao contorno da recomendacao.
+        self._secao_recomendada = None
+
+        confirmacao_abaco = None
+        if recomendacao and self.catalogo.confirmar_abaco:
+            if self._prazo_esgotado():
+                etapas_omitidas.append("confirmacao_abaco")
             else:
-                detalhada = self._analisar_opcao(
+                confirmacao_abaco = self._confirmar_abaco(recomendacao)
+
+        conferencia_motor_nativo = None
+        if (
+            recomendacao
+            and self.catalogo.motor != "concreteproperties"
+            and self.catalogo.conferir_motor_nativo
+        ):
+            if self._prazo_esgotado():
+                etapas_omitidas.append("conferencia_motor_nativo")
+            else:
+                conferencia_motor_nativo = self._conferir_motor_nativo(
                     deps=deps,
                     material_concreto=material_concreto,
                     material_aco=material_aco,
-                    quantidade=recomendacao["quantidade_barras"],
-                    bitola_mm=recomendacao["diametro_barra_mm"],
-                    incluir_diagrama=True,
+                    opcao=recomendacao,
                 )
-                diagrama_recomendacao = detalhada.pop(
-                    "diagrama_mx_my_tf_m", []
-                )
-                recomendacao = detalhada
 
         # Os contornos das demais alternativas sao dados temporarios. A API
         # devolve somente o contorno recomendado para manter a resposta leve.
         for opcao in opcoes:
             opcao.pop("diagrama_mx_my_tf_m", None)
+        diagrama_compacto = None
+        if self.catalogo.formato_diagrama != "pontos" and recomendacao:
+            diagrama_compacto = compactar_diagrama(
+                diagrama_recomendacao,
+                formato=self.catalogo.formato_diagrama,
+                quantidade_barras=recomendacao["quantidade_barras"],
+                angulo_inicial_barras_rad=math.radians(
+                    self.secao.angulo_inicial_barras_graus
+                ),
+                desvio_maximo_tf_m=self.catalogo.tolerancia_contorno_tf_m,
+            )
+            diagrama_recomendacao = []
 
         resumo_por_bitola = self._resumir_por_bitola(
             opcoes=opcoes,
             combinacoes=combinacoes,
             nao_avaliadas=interrompidas_por_bitola,
+            busca_por_bitola=busca_por_bitola,
         )
         parametros = self._parametros_calculados()
+        resultado_parcial = bool(pendentes_prazo or etapas_omitidas)
+        prazo = None
+        if self.catalogo.tempo_maximo_s is not None:
+            prazo = {
+                "tempo_maximo_s": self.catalogo.tempo_maximo_s,
+                "resultado_parcial": resultado_parcial,
+                "opcoes_nao_avaliadas": [
+                    {
+                        "id": f"{quantidade}x{formatar_bitola_id(bitola)}",
+                        "quantidade_barras": quantidade,
+                        "diametro_barra_mm": bitola,
+                        "area_aco_total_cm2": (
+                            quantidade * math.pi * bitola**2 / 400.0
+                        ),
+                    }
+                    for quantidade, bitola in sorted(
+                        pendentes_prazo,
+                        key=lambda item: (
+                            item[0] * item[1] ** 2,
+                            item[0],
+                            item[1],
+                        ),
+                    )
+                ],
+                "etapas_omitidas": etapas_omitidas,
+            }
 
-        return {
+        resultado = {
             "sistema_unidades": {
                 "forca": "tf",
                 "momento": "tf.m",
@@ -199,8 +843,11 @@ class DimensionadorFlexoCompressaoObliqua:
             },
             "metodo": {
                 "analise": "compatibilidade de deformacoes e equilibrio seccional",
-                "biblioteca": "concreteproperties",
+                "biblioteca": BIBLIOTECAS_MOTOR[self.catalogo.motor],
                 "versao_biblioteca": deps["versao"],
+                "motor": self.catalogo.motor,
+                "conferencia_motor_nativo": conferencia_motor_nativo,
+                "confirmacao_abaco": confirmacao_abaco,
                 "modelo_normativo": "NBR 6118 parametrizado pela openStruct",
                 "status_modelo_normativo": (
                     "nao e um modulo NBR oficial do concreteproperties"
@@ -220,6 +867,12 @@ class DimensionadorFlexoCompressaoObliqua:
                 "criterio_recomendacao": (
                     "menor area de aco entre as candidatas avaliadas que atendem"
                 ),
+                "caches": self._resumir_caches(),
+                "execucao": {
+                    "modo": self.catalogo.execucao,
+                    "processos": processos,
+                    "tarefas": quantidade_tarefas,
+                },
             },
             "secao": {
                 "tipo": "circular macica",
@@ -246,23 +899,23 @@ class DimensionadorFlexoCompressaoObliqua:
                 },
                 "calculo": parametros,
             },
-            "esforcos_solicitantes": {
-                "normal_compressao_sd_tf": (
-                    self.esforcos.normal_compressao_sd_tf
-                ),
-                "momento_x_sd_tf_m": self.esforcos.momento_x_sd_tf_m,
-                "momento_y_sd_tf_m": self.esforcos.momento_y_sd_tf_m,
-                "momento_resultante_sd_tf_m": math.hypot(
-                    self.esforcos.momento_x_sd_tf_m,
-                    self.esforcos.momento_y_sd_tf_m,
-                ),
-                "angulo_momento_graus": math.degrees(
-                    math.atan2(
-                        self.esforcos.momento_y_sd_tf_m,
-                        self.esforcos.momento_x_sd_tf_m,
-                    )
-                ),
-            },
+            "esforcos_solicitantes": (
+                {
+                    "quantidade_combinacoes": len(self.combinacoes_carga),
+                    "combinacoes": [
+                        {
+                            "indice": indice,
+                            "nome": esforcos.nome,
+                            **resumir_esforcos(esforcos),
+                        }
+                        for indice, esforcos in enumerate(
+                            self.combinacoes_carga
+                        )
+                    ],
+                }
+                if self.combinacoes_carga
+                else resumir_esforcos(self.esforcos)
+            ),
             "catalogo": {
                 "modo": modo_catalogo,
                 "bitolas_longitudinais_mm": sorted(
@@ -275,11 +928,28 @@ class DimensionadorFlexoCompressaoObliqua:
                     self.catalogo.espacamento_livre_minimo_mm
                 ),
                 "pontos_diagrama": self.catalogo.pontos_diagrama,
+                "tolerancia_contorno_tf_m": (
+                    self.catalogo.tolerancia_contorno_tf_m
+                ),
+                "formato_diagrama": self.catalogo.formato_diagrama,
                 "modo_verificacao": self.catalogo.modo_verificacao,
                 "tolerancia_angular_graus": (
                     self.catalogo.tolerancia_angular_graus
                 ),
                 "max_iteracoes_angulo": self.catalogo.max_iteracoes_angulo,
+                "execucao": self.catalogo.execucao,
+                "estrategia_busca": self.catalogo.estrategia_busca,
+                "usar_tabela_setor": self.catalogo.usar_tabela_setor,
+                "usar_superficie_interacao": (
+                    self.catalogo.usar_superficie_interacao
+                ),
+                "decisao_antecipada": self.catalogo.decisao_antecipada,
+                "triagem": triagem,
+                "prazo": prazo,
+                "analises_evitadas_pela_busca": sum(
+                    item["analises_evitadas"]
+                    for item in busca_por_bitola.values()
+                ),
                 "parar_na_primeira_opcao_por_bitola": (
                     self.catalogo.parar_na_primeira_opcao_por_bitola
                     if modo_catalogo == "grade"
@@ -292,11 +962,22 @@ class DimensionadorFlexoCompressaoObliqua:
             "resumo_por_bitola": resumo_por_bitola,
             "recomendacao": recomendacao,
             "diagrama_recomendacao_mx_my_tf_m": diagrama_recomendacao,
+            "diagrama_recomendacao_compacto": diagrama_compacto,
+            "resultado_parcial": resultado_parcial,
+            "segunda_ordem": self._resumir_segunda_ordem(),
             "avisos": [
                 (
                     "O modelo verifica apenas a resistencia da secao no ELU. "
                     "Nao inclui efeitos locais/globais de segunda ordem, "
                     "imperfeicoes, fluencia, fissuracao, cisalhamento ou fadiga."
+                )
+                if self.esbeltez is None
+                else (
+                    "Os efeitos locais de segunda ordem seguem o pilar-padrao "
+                    "da NBR 6118 no trecho de comprimento_flambagem_m "
+                    "informado, com o momento total na direcao do momento de "
+                    "primeira ordem. Nao inclui efeitos globais, fluencia, "
+                    "interacao com o solo, cisalhamento ou fadiga."
                 ),
                 (
                     "A verificacao de espacamento usa o valor minimo informado "
@@ -319,6 +1000,152 @@ class DimensionadorFlexoCompressaoObliqua:
                 ),
             ],
         }
+        if resultado_parcial:
+            resultado["avisos"].append(
+                "O tempo_maximo_s do catalogo terminou antes do fim da analise: "
+                "a recomendacao e a menor opcao aprovada entre as avaliadas e "
+                "pode existir opcao menor em catalogo.prazo.opcoes_nao_avaliadas."
+            )
+        return resultado
+
+    def analisar_em_fluxo(self) -> Iterator[Dict[str, Any]]:
+        """Eventos de ``analisar`` a medida que as alternativas terminam.
+
+        A validacao e a carga das dependencias ocorrem antes do primeiro
+        evento, ``inicio``; os erros dessa fase sobem na primeira leitura.
+        Depois, a analise roda em uma thread e o gerador produz:
+
+        - ``opcao``: cada alternativa assim que fica definitiva, sem o
+          contorno Mx-My e com ``tempo_analise_s``;
+        - ``resumo_por_bitola`` e ``recomendacao`` (com o contorno);
+        - ``resultado``: as demais chaves da resposta, com ``ids_opcoes`` na
+          ordem de ``opcoes`` de ``analisar``.
+
+        A fila e limitada a ``MAXIMO_EVENTOS_PENDENTES_FLUXO`` eventos: um
+        consumidor lento segura a analise. Fechar o gerador interrompe a
+        analise na alternativa seguinte. Cada alternativa enviada fica so com
+        ``CHAVES_OPCAO_FLUXO``, salvo a menor quantidade que atende em cada
+        bitola, candidata ao resumo e a recomendacao.
+        """
+
+        self._validar_entradas()
+        self._carregar_dependencias()
+        fila: "queue.Queue[Tuple[str, Any]]" = queue.Queue(
+            maxsize=MAXIMO_EVENTOS_PENDENTES_FLUXO
+        )
+        interrompido = threading.Event()
+
+        def enviar(evento: Tuple[str, Any]) -> None:
+            while not interrompido.is_set():
+                try:
+                    fila.put(evento, timeout=INTERVALO_ESPERA_FLUXO_S)
+                    return
+                except queue.Full:
+                    continue
+            raise FluxoFCOInterrompido("O fluxo de resultados foi fechado.")
+
+        def ao_concluir(opcao: Dict[str, Any]) -> None:
+            enviar(
+                (
+                    "opcao",
+                    {
+                        chave: valor
+                        for chave, valor in opcao.items()
+                        if chave != "diagrama_mx_my_tf_m"
+                    },
+                )
+            )
+
+        def executar() -> None:
+            self._ao_concluir_opcao = ao_concluir
+            self._retidas_fluxo = {}
+            try:
+                resultado = self.analisar()
+            except FluxoFCOInterrompido:
+                return
+            except Exception as exc:
+                try:
+                    enviar(("erro", exc))
+                except FluxoFCOInterrompido:
+                    pass
+                return
+            finally:
+                self._ao_concluir_opcao = None
+                self._retidas_fluxo = None
+            try:
+                enviar(("fim", resultado))
+            except FluxoFCOInterrompido:
+                pass
+
+        combinacoes, modo_catalogo = self._combinacoes()
+        yield {
+            "tipo": "inicio",
+            "modo_catalogo": modo_catalogo,
+            "quantidade_combinacoes_solicitadas": len(combinacoes),
+        }
+        threading.Thread(
+            target=executar, name="fco-fluxo", daemon=True
+        ).start()
+        try:
+            while True:
+                tipo, valor = fila.get()
+                if tipo == "erro":
+                    raise valor
+                if tipo == "fim":
+                    break
+                yield {"tipo": "opcao", "opcao": valor}
+            resultado = valor
+            yield {
+                "tipo": "resumo_por_bitola",
+                "resumo_por_bitola": resultado.pop("resumo_por_bitola"),
+            }
+            yield {
+                "tipo": "recomendacao",
+                "recomendacao": resultado.pop("recomendacao"),
+                "diagrama_recomendacao_mx_my_tf_m": resultado.pop(
+                    "diagrama_recomendacao_mx_my_tf_m"
+                ),
+                "diagrama_recomendacao_compacto": resultado.pop(
+                    "diagrama_recomendacao_compacto"
+                ),
+            }
+            resultado["ids_opcoes"] = [
+                opcao["id"] for opcao in resultado.pop("opcoes")
+            ]
+            yield {"tipo": "resultado", "resultado": resultado}
+        finally:
+            interrompido.set()
+
+    def _notificar_opcao(self, opcao: Dict[str, Any]) -> None:
+        if self._ao_concluir_opcao is None:
+            return
+        self._ao_concluir_opcao(opcao)
+        if self._retidas_fluxo is None:
+            return
+        # O evento ja saiu; a alternativa so continua completa enquanto for a
+        # menor quantidade que atende na bitola.
+        bitola = opcao["diametro_barra_mm"]
+        retida = self._retidas_fluxo.get(bitola)
+        if opcao["atende"] and (
+            retida is None
+            or opcao["quantidade_barras"] < retida["quantidade_barras"]
+        ):
+            self._retidas_fluxo[bitola] = opcao
+            if retida is None:
+                return
+            opcao = retida
+        for chave in list(opcao):
+            if chave not in CHAVES_OPCAO_FLUXO:
+                del opcao[chave]
+
+    def _prazo_esgotado(self) -> bool:
+        return self._prazo is not None and monotonic() >= self._prazo
+
+    def _verificar_prazo(self) -> None:
+        if self._prazo_esgotado():
+            raise PrazoEsgotadoFCO(
+                f"tempo_maximo_s = {self.catalogo.tempo_maximo_s} s esgotado."
+            )
 
     def _validar_entradas(self) -> None:
         valores_positivos = {
@@ -377,20 +1204,35 @@ class DimensionadorFlexoCompressaoObliqua:
                 "diametro_armadura_transversal_mm deve ser maior ou igual a zero."
             )
 
-        for nome, valor in (
-            ("normal_compressao_sd_tf", self.esforcos.normal_compressao_sd_tf),
-            ("momento_x_sd_tf_m", self.esforcos.momento_x_sd_tf_m),
-            ("momento_y_sd_tf_m", self.esforcos.momento_y_sd_tf_m),
+        if (self.esforcos is None) == (not self.combinacoes_carga):
+            raise ErroFlexoCompressaoObliqua(
+                "Informe esforcos ou combinacoes_carga, e somente um deles."
+            )
+        if len(self.combinacoes_carga) > MAXIMO_COMBINACOES_CARGA:
+            raise ErroFlexoCompressaoObliqua(
+                f"Foram informadas {len(self.combinacoes_carga)} combinacoes "
+                f"de carga; o limite e {MAXIMO_COMBINACOES_CARGA}."
+            )
+        for indice, esforcos in enumerate(
+            self._lista_esforcos_primeira_ordem()
         ):
-            if not math.isfinite(valor):
+            prefixo = (
+                f"combinacao {indice + 1}: " if self.combinacoes_carga else ""
+            )
+            for nome, valor in (
+                ("normal_compressao_sd_tf", esforcos.normal_compressao_sd_tf),
+                ("momento_x_sd_tf_m", esforcos.momento_x_sd_tf_m),
+                ("momento_y_sd_tf_m", esforcos.momento_y_sd_tf_m),
+            ):
+                if not math.isfinite(valor):
+                    raise ErroFlexoCompressaoObliqua(
+                        f"{prefixo}{nome} deve ser um numero finito."
+                    )
+            if esforcos.normal_compressao_sd_tf < 0:
                 raise ErroFlexoCompressaoObliqua(
-                    f"{nome} deve ser um numero finito."
+                    f"{prefixo}normal_compressao_sd_tf deve ser positiva para "
+                    "compressao. Esta rota nao cobre flexotracao."
                 )
-        if self.esforcos.normal_compressao_sd_tf < 0:
-            raise ErroFlexoCompressaoObliqua(
-                "normal_compressao_sd_tf deve ser positiva para compressao. "
-                "Esta rota nao cobre flexotracao."
-            )
 
         if self.catalogo.modo_verificacao not in {
             "direcional",
@@ -417,6 +1259,133 @@ class DimensionadorFlexoCompressaoObliqua:
             raise ErroFlexoCompressaoObliqua(
                 "max_iteracoes_angulo deve estar entre 2 e 20."
             )
+        if self.catalogo.execucao not in MODOS_EXECUCAO:
+            raise ErroFlexoCompressaoObliqua(
+                "execucao deve ser 'serial' ou 'processos'."
+            )
+        if self.catalogo.motor not in MOTORES:
+            raise ErroFlexoCompressaoObliqua(
+                "motor deve ser 'concreteproperties', 'nativo', 'analitico' ou "
+                "'abaco'."
+            )
+        if self.catalogo.estrategia_busca not in ESTRATEGIAS_BUSCA:
+            raise ErroFlexoCompressaoObliqua(
+                "estrategia_busca deve ser uma de: "
+                + ", ".join(ESTRATEGIAS_BUSCA)
+                + "."
+            )
+        if self.catalogo.estrategia_busca in {"bissecao", "preditor"} and (
+            self.catalogo.combinacoes_explicitas
+            or not self.catalogo.parar_na_primeira_opcao_por_bitola
+        ):
+            raise ErroFlexoCompressaoObliqua(
+                f"estrategia_busca '{self.catalogo.estrategia_busca}' so se "
+                "aplica ao catalogo em grade com "
+                "parar_na_primeira_opcao_por_bitola; nos demais casos todas "
+                "as alternativas sao analisadas e a busca seria linear."
+            )
+        if (
+            self.catalogo.estrategia_busca == "triagem"
+            and self.catalogo.modo_verificacao != "direcional"
+        ):
+            raise ErroFlexoCompressaoObliqua(
+                "estrategia_busca 'triagem' usa apenas modo_verificacao="
+                "'direcional': no diagrama completo o modelo grosseiro tambem "
+                "calcula o diagrama biaxial de cada alternativa e nao decide "
+                "por limites."
+            )
+        tempo_maximo = self.catalogo.tempo_maximo_s
+        if tempo_maximo is not None and (
+            not math.isfinite(tempo_maximo) or tempo_maximo <= 0
+        ):
+            raise ErroFlexoCompressaoObliqua(
+                "tempo_maximo_s deve ser finito e maior que zero."
+            )
+        if self.catalogo.formato_diagrama not in FORMATOS_DIAGRAMA:
+            raise ErroFlexoCompressaoObliqua(
+                "formato_diagrama deve ser um de: "
+                + ", ".join(FORMATOS_DIAGRAMA)
+                + "."
+            )
+        tolerancia_contorno = self.catalogo.tolerancia_contorno_tf_m
+        if tolerancia_contorno is not None:
+            if (
+                not math.isfinite(tolerancia_contorno)
+                or tolerancia_contorno <= 0
+            ):
+                raise ErroFlexoCompressaoObliqua(
+                    "tolerancia_contorno_tf_m deve ser finita e maior que zero."
+                )
+            if (
+                self.catalogo.modo_verificacao != "direcional"
+                or self.catalogo.motor == "abaco"
+            ):
+                raise ErroFlexoCompressaoObliqua(
+                    "tolerancia_contorno_tf_m so se aplica ao modo_verificacao "
+                    "'direcional' com motor diferente de 'abaco'."
+                )
+        if self.catalogo.motor == "abaco":
+            self._validar_abaco()
+        elif self.catalogo.confirmar_abaco:
+            raise ErroFlexoCompressaoObliqua(
+                "confirmar_abaco so se aplica ao motor 'abaco'."
+            )
+        self._validar_esbeltez()
+
+    def _validar_esbeltez(self) -> None:
+        if self.esbeltez is None:
+            return
+        if self.esbeltez.metodo not in METODOS_SEGUNDA_ORDEM:
+            raise ErroFlexoCompressaoObliqua(
+                "esbeltez.metodo deve ser um de: "
+                + ", ".join(METODOS_SEGUNDA_ORDEM)
+                + "."
+            )
+        comprimento = self.esbeltez.comprimento_flambagem_m
+        if not math.isfinite(comprimento) or comprimento <= 0:
+            raise ErroFlexoCompressaoObliqua(
+                "comprimento_flambagem_m deve ser finito e maior que zero."
+            )
+        if not 0.4 <= self.esbeltez.alfa_b <= 1.0:
+            raise ErroFlexoCompressaoObliqua(
+                "alfa_b deve estar entre 0,4 e 1,0."
+            )
+        esbeltez = self._indice_esbeltez()
+        if self.esbeltez.metodo == "momento_curvatura":
+            if esbeltez > ESBELTEZ_MAXIMA_MOMENTO_CURVATURA:
+                raise ErroFlexoCompressaoObliqua(
+                    f"Indice de esbeltez {esbeltez:.1f} acima de "
+                    f"{ESBELTEZ_MAXIMA_MOMENTO_CURVATURA:.0f}: o pilar-padrao "
+                    "nao se aplica; e necessaria uma analise geral de "
+                    "segunda ordem."
+                )
+        elif esbeltez > ESBELTEZ_MAXIMA_METODOS_APROXIMADOS:
+            raise ErroFlexoCompressaoObliqua(
+                f"Indice de esbeltez {esbeltez:.1f} acima de "
+                f"{ESBELTEZ_MAXIMA_METODOS_APROXIMADOS:.0f}, limite do metodo "
+                f"'{self.esbeltez.metodo}'. Use metodo='momento_curvatura'."
+            )
+
+    def _validar_abaco(self) -> None:
+        if self.catalogo.modo_verificacao != "direcional":
+            raise ErroFlexoCompressaoObliqua(
+                "O motor 'abaco' usa apenas modo_verificacao='direcional'."
+            )
+        if self.catalogo.estrategia_busca == "triagem":
+            raise ErroFlexoCompressaoObliqua(
+                "O motor 'abaco' ja e uma consulta a tabela; use outra "
+                "estrategia_busca."
+            )
+        if self.catalogo.conferir_motor_nativo:
+            raise ErroFlexoCompressaoObliqua(
+                "Com o motor 'abaco', use confirmar_abaco para conferir a "
+                "recomendacao com o concreteproperties."
+            )
+        motivo = carregar_abaco_fco().motivo_fora_da_cobertura(
+            parametros=self._parametros_calculados()
+        )
+        if motivo:
+            raise ErroFlexoCompressaoObliqua(motivo)
 
     def _combinacoes(self) -> Tuple[List[Tuple[int, float]], str]:
         if self.catalogo.combinacoes_explicitas:
@@ -462,67 +1431,897 @@ class DimensionadorFlexoCompressaoObliqua:
                 )
         return combinacoes, modo
 
-    def _parametros_calculados(self) -> Dict[str, float]:
-        fcd_base = self.materiais.fck_mpa / self.materiais.gamma_c
-        fcd_diagrama = fcd_base * self.materiais.fator_reducao_concreto
-        fyd = self.materiais.fyk_mpa / self.materiais.gamma_s
-        ec = self.materiais.modulo_elasticidade_concreto_mpa
-        if ec is None:
-            ec = 5_600.0 * math.sqrt(self.materiais.fck_mpa)
-        fctm = 0.3 * self.materiais.fck_mpa ** (2.0 / 3.0)
-        return {
-            "fcd_base_mpa": fcd_base,
-            "fcd_diagrama_mpa": fcd_diagrama,
-            "fyd_mpa": fyd,
-            "modulo_elasticidade_concreto_mpa": ec,
-            "modulo_elasticidade_aco_mpa": (
-                self.materiais.modulo_elasticidade_aco_mpa
-            ),
-            "fctm_mpa": fctm,
-            "deformacao_concreto_inicio_patamar": (
-                self.materiais.deformacao_concreto_inicio_patamar
-            ),
-            "deformacao_ultima_concreto": (
-                self.materiais.deformacao_ultima_concreto
-            ),
-            "expoente_parabola_concreto": (
-                self.materiais.expoente_parabola_concreto
-            ),
-            "deformacao_ultima_aco": self.materiais.deformacao_ultima_aco,
-        }
+    def _tarefas_catalogo(
+        self,
+        combinacoes: Sequence[Tuple[int, float]],
+        modo_catalogo: str,
+    ) -> List[Tuple[float, List[int], bool]]:
+        """Agrupa o catalogo em cadeias independentes ``(bitola, qtds, parar)``.
 
-    def _carregar_dependencias(self) -> Dict[str, Any]:
-        try:
-            import concreteproperties.stress_strain_profile as ssp
-            from concreteproperties import (
-                Concrete,
-                ConcreteSection,
-                SteelBar,
-                add_bar_circular_array,
-            )
-            from sectionproperties.pre.library import circular_section
-        except ImportError as exc:
-            raise DependenciaConcretePropertiesAusente(
-                "Pacote concreteproperties nao instalado. Execute: "
-                "pip install concreteproperties==0.8.0"
-            ) from exc
+        Com parada na primeira opcao, cada bitola e uma cadeia sequencial; nos
+        demais casos cada alternativa e uma tarefa isolada. A ordem das tarefas
+        reproduz a ordem de avaliacao serial; com ``tempo_maximo_s``, as
+        tarefas isoladas seguem a area de aco crescente.
+        """
 
-        try:
-            versao = importlib.metadata.version("concreteproperties")
-        except importlib.metadata.PackageNotFoundError:
-            versao = "desconhecida"
+        if (
+            modo_catalogo == "grade"
+            and self.catalogo.parar_na_primeira_opcao_por_bitola
+        ):
+            por_bitola: Dict[float, List[int]] = {}
+            for quantidade, bitola in combinacoes:
+                por_bitola.setdefault(bitola, []).append(quantidade)
+            return [
+                (bitola, sorted(set(por_bitola[bitola])), True)
+                for bitola in sorted(por_bitola)
+            ]
+        if self.catalogo.tempo_maximo_s is not None:
+            # Com prazo, as alternativas de menor area vem primeiro.
+            combinacoes = sorted(
+                combinacoes,
+                key=lambda item: (
+                    item[0] * math.pi * item[1] ** 2 / 4.0,
+                    item[0],
+                    item[1],
+                ),
+            )
+        return [
+            (bitola, [quantidade], False) for quantidade, bitola in combinacoes
+        ]
+
+    def _avaliar_cadeia(
+        self,
+        deps: Dict[str, Any],
+        material_concreto: Any,
+        material_aco: Any,
+        bitola_mm: float,
+        quantidades: Sequence[int],
+        parar_ao_atender: bool,
+        incluir_diagrama: bool,
+    ) -> Dict[str, Any]:
+        """Avalia uma cadeia de quantidades de mesma bitola.
+
+        Devolve ``opcoes`` (em ordem crescente de quantidade), ``nao_avaliadas``
+        e, para estrategias diferentes da linear, o resumo ``busca``. Se o
+        prazo termina, ``pendentes_prazo`` lista as quantidades que ficaram
+        sem analise.
+        """
+
+        def analisar(quantidade: int) -> Dict[str, Any]:
+            opcao = self._analisar_opcao(
+                deps=deps,
+                material_concreto=material_concreto,
+                material_aco=material_aco,
+                quantidade=quantidade,
+                bitola_mm=bitola_mm,
+                incluir_diagrama=incluir_diagrama,
+            )
+            self._notificar_opcao(opcao)
+            return opcao
+
+        if parar_ao_atender and self.catalogo.estrategia_busca in {
+            "bissecao",
+            "preditor",
+        }:
+            return self._buscar_monotona(analisar, bitola_mm, quantidades)
+
+        opcoes: List[Dict[str, Any]] = []
+        for indice, quantidade in enumerate(quantidades):
+            try:
+                opcao = analisar(quantidade)
+            except PrazoEsgotadoFCO:
+                return {
+                    "opcoes": opcoes,
+                    "nao_avaliadas": len(quantidades) - indice,
+                    "pendentes_prazo": list(quantidades[indice:]),
+                }
+            opcoes.append(opcao)
+            if opcao["atende"] and parar_ao_atender:
+                return {
+                    "opcoes": opcoes,
+                    "nao_avaliadas": len(quantidades) - indice - 1,
+                }
+        return {"opcoes": opcoes, "nao_avaliadas": 0}
+
+    def _buscar_monotona(
+        self,
+        analisar: Callable[[int], Dict[str, Any]],
+        bitola_mm: float,
+        quantidades: Sequence[int],
+    ) -> Dict[str, Any]:
+        """Encontra a menor quantidade que atende sem varrer toda a lista.
+
+        Para bitola e raio fixos, a capacidade cresce com o numero de barras e
+        o espacamento livre diminui. As quantidades geometricamente viaveis
+        formam, portanto, um prefixo da lista, e dentro dele o atendimento e
+        monotono. O resultado e o mesmo da varredura linear com parada na
+        primeira opcao; muda apenas a ordem em que as quantidades sao testadas.
+        """
+
+        viaveis = [
+            quantidade
+            for quantidade in quantidades
+            if avaliar_geometria_armadura_circular(
+                diametro_secao_mm=self.secao.diametro_m * 1_000.0,
+                cobrimento_nominal_mm=self.secao.cobrimento_nominal_mm,
+                diametro_armadura_transversal_mm=(
+                    self.secao.diametro_armadura_transversal_mm
+                ),
+                quantidade_barras=quantidade,
+                diametro_barra_mm=bitola_mm,
+                espacamento_livre_minimo_mm=(
+                    self.catalogo.espacamento_livre_minimo_mm
+                ),
+            )["viavel_geometricamente"]
+        ]
+        avaliadas: Dict[int, Dict[str, Any]] = {}
+
+        def atende(indice: int) -> Optional[bool]:
+            # ``None`` para falha de analise: o atendimento fica desconhecido
+            # e nao entra na monotonia.
+            quantidade = viaveis[indice]
+            if quantidade not in avaliadas:
+                avaliadas[quantidade] = analisar(quantidade)
+            if avaliadas[quantidade]["status"] == "erro_analise":
+                return None
+            return bool(avaliadas[quantidade]["atende"])
+
+        busca: Dict[str, Any] = {"estrategia": self.catalogo.estrategia_busca}
+        try:
+            if self.catalogo.estrategia_busca == "preditor":
+                aprovado = self._buscar_a_partir_do_preditor(
+                    atende, bitola_mm, viaveis, busca
+                )
+            else:
+                aprovado = buscar_primeiro_aprovado_galopante(
+                    atende, len(viaveis)
+                )
+        except PrazoEsgotadoFCO:
+            # Busca interrompida: a fronteira de atendimento nao e conhecida.
+            opcoes = [avaliadas[quantidade] for quantidade in sorted(avaliadas)]
+            busca.update(
+                {
+                    "quantidade_final": None,
+                    "analises_realizadas": len(opcoes),
+                    "analises_evitadas": 0,
+                    "interrompida_pelo_prazo": True,
+                }
+            )
+            return {
+                "opcoes": opcoes,
+                "nao_avaliadas": len(quantidades) - len(opcoes),
+                "busca": busca,
+                "pendentes_prazo": [
+                    quantidade
+                    for quantidade in viaveis
+                    if quantidade not in avaliadas
+                ],
+            }
+
+        if aprovado is None:
+            # Sem opcao que atende, a varredura linear percorreria a lista
+            # inteira. As inviaveis entram na resposta sem custo de analise.
+            for quantidade in quantidades:
+                if quantidade not in viaveis:
+                    avaliadas[quantidade] = analisar(quantidade)
+            analises_lineares = len(viaveis)
+        else:
+            analises_lineares = aprovado + 1
+
+        opcoes = [avaliadas[quantidade] for quantidade in sorted(avaliadas)]
+        analises = sum(
+            1 for opcao in opcoes if opcao["status"] != "inviavel_geometricamente"
+        )
+        busca.update(
+            {
+                "quantidade_final": (
+                    viaveis[aprovado] if aprovado is not None else None
+                ),
+                "analises_realizadas": analises,
+                "analises_evitadas": analises_lineares - analises,
+            }
+        )
+        return {
+            "opcoes": opcoes,
+            "nao_avaliadas": len(quantidades) - len(opcoes),
+            "busca": busca,
+        }
+
+    def _buscar_a_partir_do_preditor(
+        self,
+        atende: Callable[[int], Optional[bool]],
+        bitola_mm: float,
+        viaveis: Sequence[int],
+        busca: Dict[str, Any],
+    ) -> Optional[int]:
+        """Parte da quantidade prevista e caminha ate a fronteira de atendimento.
+
+        Alternativas com falha de analise (``atende`` igual a ``None``) nao
+        marcam a fronteira: a descida passa por elas e para apenas na
+        primeira que comprovadamente nao atende.
+        """
+
+        parametros = self._parametros_calculados()
+        diametro_mm = self.secao.diametro_m * 1_000.0
+        raio_eixo = (
+            diametro_mm / 2.0
+            - self.secao.cobrimento_nominal_mm
+            - self.secao.diametro_armadura_transversal_mm
+            - bitola_mm / 2.0
+        )
+        # A alternativa precisa atender todas as combinacoes.
+        area_prevista = max(
+            estimar_area_aco_necessaria_mm2(
+                diametro_secao_mm=diametro_mm,
+                raio_eixo_barras_mm=raio_eixo,
+                fcd_mpa=parametros["fcd_diagrama_mpa"],
+                fyd_mpa=parametros["fyd_mpa"],
+                modulo_elasticidade_aco_mpa=(
+                    parametros["modulo_elasticidade_aco_mpa"]
+                ),
+                deformacao_ultima_concreto=(
+                    parametros["deformacao_ultima_concreto"]
+                ),
+                normal_n=esforcos.normal_compressao_sd_tf * TF_PARA_N,
+                momento_n_mm=math.hypot(
+                    esforcos.momento_x_sd_tf_m,
+                    esforcos.momento_y_sd_tf_m,
+                )
+                * TF_M_PARA_N_MM,
+            )
+            for esforcos in self._lista_esforcos()
+        )
+        quantidade_prevista = (
+            math.ceil(area_prevista / (math.pi * bitola_mm**2 / 4.0) - 1e-9)
+            if math.isfinite(area_prevista)
+            else None
+        )
+        busca["area_aco_prevista_cm2"] = (
+            area_prevista / 100.0 if math.isfinite(area_prevista) else None
+        )
+        busca["quantidade_prevista"] = quantidade_prevista
+        if not viaveis:
+            return None
+
+        if quantidade_prevista is None:
+            indice = len(viaveis) - 1
+        else:
+            indice = next(
+                (
+                    posicao
+                    for posicao, quantidade in enumerate(viaveis)
+                    if quantidade >= quantidade_prevista
+                ),
+                len(viaveis) - 1,
+            )
+        estado = atende(indice)
+        if estado is not False:
+            menor = indice if estado else None
+            for anterior in range(indice - 1, -1, -1):
+                estado = atende(anterior)
+                if estado is False:
+                    break
+                if estado:
+                    menor = anterior
+            if menor is not None:
+                return menor
+        while indice < len(viaveis) - 1:
+            indice += 1
+            if atende(indice):
+                return indice
+        return None
+
+    def _limites_area_aco_por_bitola(
+        self, bitolas: Iterable[float]
+    ) -> Dict[float, float]:
+        """``area_aco_minima_necessaria_mm2`` de cada bitola (mm²).
+
+        O limite de todas as combinacoes de carga e o maior entre elas;
+        ``inf`` quando o eixo das barras nao cabe na secao.
+        """
+
+        parametros = self._parametros_calculados()
+        diametro_mm = self.secao.diametro_m * 1_000.0
+        limites: Dict[float, float] = {}
+        for bitola in sorted(bitolas):
+            raio_eixo = (
+                diametro_mm / 2.0
+                - self.secao.cobrimento_nominal_mm
+                - self.secao.diametro_armadura_transversal_mm
+                - bitola / 2.0
+            )
+            limites[bitola] = (
+                max(
+                    area_aco_minima_necessaria_mm2(
+                        diametro_secao_mm=diametro_mm,
+                        raio_eixo_barras_mm=raio_eixo,
+                        fcd_mpa=parametros["fcd_diagrama_mpa"],
+                        fyd_mpa=parametros["fyd_mpa"],
+                        normal_n=esforcos.normal_compressao_sd_tf * TF_PARA_N,
+                        momento_n_mm=math.hypot(
+                            esforcos.momento_x_sd_tf_m,
+                            esforcos.momento_y_sd_tf_m,
+                        )
+                        * TF_M_PARA_N_MM,
+                    )
+                    for esforcos in self._lista_esforcos()
+                )
+                if raio_eixo > 0
+                else math.inf
+            )
+        return limites
+
+    def _buscar_por_ramificacao(
+        self,
+        deps: Dict[str, Any],
+        material_concreto: Any,
+        material_aco: Any,
+        combinacoes: Sequence[Tuple[int, float]],
+        incluir_diagrama: bool,
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """Busca a menor area de aco por ramificacao e limite.
+
+        As alternativas sao avaliadas em ordem crescente da mesma chave usada
+        na recomendacao. A primeira que atende e, portanto, a recomendacao da
+        busca exaustiva, e todas as seguintes sao podadas pela incumbente.
+        Antes de qualquer analise, descartam-se as alternativas com area menor
+        que ``area_aco_minima_necessaria_mm2``, um limite inferior rigoroso
+        para tensoes limitadas a fcd no concreto e fyd no aco.
+        """
+
+        limites_por_bitola = self._limites_area_aco_por_bitola(
+            {bitola for _, bitola in combinacoes}
+        )
+
+        ordenadas = sorted(
+            combinacoes,
+            key=lambda item: (
+                item[0] * math.pi * item[1] ** 2 / 4.0,
+                item[0],
+                item[1],
+            ),
+        )
+        busca: Dict[float, Dict[str, Any]] = {
+            bitola: {
+                "estrategia": "ramificacao_limite",
+                "area_aco_minima_necessaria_cm2": (
+                    limite / 100.0 if math.isfinite(limite) else None
+                ),
+                "bitola_podada_pelo_limite_inferior": False,
+                "podadas_pelo_limite_inferior": 0,
+                "podadas_pela_incumbente": 0,
+                "analises_realizadas": 0,
+                "analises_evitadas": 0,
+            }
+            for bitola, limite in limites_por_bitola.items()
+        }
+        opcoes_por_bitola: Dict[float, List[Dict[str, Any]]] = {
+            bitola: [] for bitola in limites_por_bitola
+        }
+        pendentes_por_bitola: Dict[float, List[int]] = {
+            bitola: [] for bitola in limites_por_bitola
+        }
+        incumbente: Optional[Dict[str, Any]] = None
+        prazo_esgotado = False
+        for quantidade, bitola in ordenadas:
+            info = busca[bitola]
+            if incumbente is not None:
+                info["podadas_pela_incumbente"] += 1
+                info["analises_evitadas"] += 1
+                continue
+            area_mm2 = quantidade * math.pi * bitola**2 / 4.0
+            if area_mm2 < limites_por_bitola[bitola]:
+                info["podadas_pelo_limite_inferior"] += 1
+                info["analises_evitadas"] += 1
+                continue
+            if prazo_esgotado:
+                pendentes_por_bitola[bitola].append(quantidade)
+                continue
+            try:
+                opcao = self._analisar_opcao(
+                    deps=deps,
+                    material_concreto=material_concreto,
+                    material_aco=material_aco,
+                    quantidade=quantidade,
+                    bitola_mm=bitola,
+                    incluir_diagrama=incluir_diagrama,
+                )
+            except PrazoEsgotadoFCO:
+                prazo_esgotado = True
+                pendentes_por_bitola[bitola].append(quantidade)
+                continue
+            self._notificar_opcao(opcao)
+            opcoes_por_bitola[bitola].append(opcao)
+            if opcao["status"] != "inviavel_geometricamente":
+                info["analises_realizadas"] += 1
+            if opcao["atende"]:
+                incumbente = opcao
+
+        resultados: List[Tuple[float, Dict[str, Any]]] = []
+        for bitola, info in busca.items():
+            total = sum(1 for _, item in combinacoes if item == bitola)
+            info["bitola_podada_pelo_limite_inferior"] = (
+                info["podadas_pelo_limite_inferior"] == total
+            )
+            resultados.append(
+                (
+                    bitola,
+                    {
+                        "opcoes": sorted(
+                            opcoes_por_bitola[bitola],
+                            key=lambda item: item["quantidade_barras"],
+                        ),
+                        "nao_avaliadas": total - len(opcoes_por_bitola[bitola]),
+                        "busca": info,
+                        "pendentes_prazo": sorted(pendentes_por_bitola[bitola]),
+                    },
+                )
+            )
+        return resultados
+
+    def _buscar_por_triagem(
+        self,
+        deps: Dict[str, Any],
+        material_concreto: Any,
+        material_aco: Any,
+        combinacoes: Sequence[Tuple[int, float]],
+        incluir_diagrama: bool,
+    ) -> Tuple[List[Tuple[float, Dict[str, Any]]], int, Dict[str, Any]]:
+        """Avalia o catalogo no modelo grosseiro e refina so as duvidosas.
+
+        Todo o catalogo passa pelo modelo de ``_modelo_triagem``, com
+        decisao antecipada. Ficam decididas as opcoes inviaveis e as de
+        utilizacao fora da faixa ``1 +- FAIXA_INCERTEZA_TRIAGEM``; as demais,
+        e as que falharam no modelo grosseiro, sao refeitas no modelo
+        completo. Os limites da decisao antecipada sao conservadores, entao a
+        faixa cobre apenas o erro de discretizacao do modelo grosseiro. Devolve os
+        resultados por bitola, os processos usados e o resumo da triagem.
+
+        Se o prazo termina, as opcoes sem modelo grosseiro e as duvidosas
+        ainda nao refeitas ficam em ``pendentes_prazo``.
+        """
+
+        grosseiro = self._modelo_triagem()
+        tarefas = self._tarefas_catalogo(combinacoes, "explicito")
+        triadas, processos_triagem = grosseiro._avaliar_tarefas(
+            deps=deps,
+            tarefas=tarefas,
+            incluir_diagrama=False,
+        )
+
+        por_tarefa: List[Dict[str, Any]] = []
+        refazer: List[Tuple[float, List[int], bool]] = []
+        pendentes_por_bitola: Dict[float, List[int]] = {}
+        for tarefa, resultado in zip(tarefas, triadas):
+            if not resultado["opcoes"]:
+                pendentes_por_bitola.setdefault(tarefa[0], []).extend(
+                    resultado["pendentes_prazo"]
+                )
+                continue
+            opcao = resultado["opcoes"][0]
+            utilizacao = opcao["utilizacao"]
+            decidida = opcao["status"] == "inviavel_geometricamente" or (
+                opcao["status"] != "erro_analise"
+                and utilizacao is not None
+                and abs(utilizacao - 1.0) > FAIXA_INCERTEZA_TRIAGEM
+            )
+            opcao["decidida_na_triagem"] = decidida
+            opcao["utilizacao_triagem"] = utilizacao
+            por_tarefa.append(opcao)
+            if decidida:
+                self._notificar_opcao(opcao)
+            else:
+                refazer.append(tarefa)
+
+        processos_refino = 1
+        if refazer:
+            ao_concluir = self._ao_concluir_opcao
+            if ao_concluir is not None:
+                utilizacoes_triagem = {
+                    opcao["id"]: opcao["utilizacao_triagem"]
+                    for opcao in por_tarefa
+                }
+
+                def anotar_refinada(opcao: Dict[str, Any]) -> None:
+                    # Mesmas chaves gravadas abaixo, ja no evento do fluxo.
+                    opcao["decidida_na_triagem"] = False
+                    opcao["utilizacao_triagem"] = utilizacoes_triagem[
+                        opcao["id"]
+                    ]
+                    ao_concluir(opcao)
 
+                self._ao_concluir_opcao = anotar_refinada
+            try:
+                refinadas, processos_refino = self._avaliar_tarefas(
+                    deps=deps,
+                    tarefas=refazer,
+                    incluir_diagrama=incluir_diagrama,
+                    material_concreto=material_concreto,
+                    material_aco=material_aco,
+                )
+            finally:
+                self._ao_concluir_opcao = ao_concluir
+            refinadas_por_id = {
+                resultado["opcoes"][0]["id"]: resultado["opcoes"][0]
+                for resultado in refinadas
+                if resultado["opcoes"]
+            }
+        else:
+            refinadas_por_id = {}
+
+        desvios: List[float] = []
+        busca: Dict[float, Dict[str, Any]] = {
+            bitola: {
+                "estrategia": "triagem",
+                "decididas_na_triagem": 0,
+                "refinadas": 0,
+                "analises_realizadas": 0,
+                "analises_evitadas": 0,
+            }
+            for bitola, _, _ in tarefas
+        }
+        opcoes_por_bitola: Dict[float, List[Dict[str, Any]]] = {}
+        for opcao in por_tarefa:
+            bitola = opcao["diametro_barra_mm"]
+            info = busca[bitola]
+            refinada = refinadas_por_id.get(opcao["id"])
+            if refinada is None and not opcao["decidida_na_triagem"]:
+                # Duvidosa sem refino: o prazo terminou antes.
+                pendentes_por_bitola.setdefault(bitola, []).append(
+                    opcao["quantidade_barras"]
+                )
+                continue
+            if refinada is None:
+                info["decididas_na_triagem"] += 1
+                if opcao["status"] != "inviavel_geometricamente":
+                    info["analises_evitadas"] += 1
+            else:
+                refinada["decidida_na_triagem"] = False
+                refinada["utilizacao_triagem"] = opcao["utilizacao_triagem"]
+                # Utilizacoes da decisao antecipada sao limites, nao
+                # estimativas; ficam fora do desvio entre os modelos.
+                if (
+                    refinada["utilizacao"] is not None
+                    and opcao["utilizacao_triagem"] is not None
+                    and not opcao["combinacoes_por_decisao_antecipada"]
+                ):
+                    desvios.append(
+                        abs(
+                            opcao["utilizacao_triagem"]
+                            / refinada["utilizacao"]
+                            - 1.0
+                        )
+                    )
+                info["refinadas"] += 1
+                info["analises_realizadas"] += 1
+                opcao = refinada
+            opcoes_por_bitola.setdefault(bitola, []).append(opcao)
+
+        resultados = [
+            (
+                bitola,
+                {
+                    "opcoes": sorted(
+                        opcoes_por_bitola.get(bitola, []),
+                        key=lambda item: item["quantidade_barras"],
+                    ),
+                    "nao_avaliadas": len(pendentes_por_bitola.get(bitola, [])),
+                    "busca": busca[bitola],
+                    "pendentes_prazo": sorted(
+                        pendentes_por_bitola.get(bitola, [])
+                    ),
+                },
+            )
+            for bitola in sorted(busca)
+        ]
+        resumo = {
+            "modelo_grosseiro": {
+                "pontos_contorno_secao": (
+                    grosseiro.catalogo.pontos_contorno_secao
+                ),
+                "pontos_perfil_concreto": PONTOS_PERFIL_TRIAGEM,
+                "aneis_fibras": ANEIS_TRIAGEM,
+                "pontos_gauss": PONTOS_GAUSS_TRIAGEM,
+                "tolerancia_angular_graus": (
+                    grosseiro.catalogo.tolerancia_angular_graus
+                ),
+            },
+            "faixa_incerteza_utilizacao": FAIXA_INCERTEZA_TRIAGEM,
+            "opcoes_decididas_na_triagem": sum(
+                info["decididas_na_triagem"] for info in busca.values()
+            ),
+            "opcoes_refinadas": len(refazer),
+            # Desvio relativo entre os dois modelos nas opcoes refinadas; se
+            # passar da faixa, a triagem pode ter decidido opcoes erradas.
+            "desvio_maximo_observado": max(desvios, default=None),
+        }
+        return resultados, max(processos_triagem, processos_refino), resumo
+
+    def _modelo_triagem(self) -> "DimensionadorFlexoCompressaoObliqua":
+        """Copia do servico com a discretizacao grosseira da triagem."""
+
+        grosseiro = replace(
+            self,
+            catalogo=replace(
+                self.catalogo,
+                pontos_contorno_secao=PONTOS_CONTORNO_TRIAGEM,
+                tolerancia_angular_graus=max(
+                    self.catalogo.tolerancia_angular_graus,
+                    TOLERANCIA_ANGULAR_TRIAGEM_GRAUS,
+                ),
+                usar_superficie_interacao=False,
+                # A triagem so precisa decidir: os limites da decisao
+                # antecipada custam menos que a tabela de setor.
+                usar_tabela_setor=False,
+                decisao_antecipada=True,
+                estrategia_busca="linear",
+            ),
+        )
+        grosseiro._grosseiro = True
+        grosseiro._prazo = self._prazo
+        grosseiro._estatisticas_cache = self._estatisticas_cache
+        grosseiro._ordem_combinacoes = self._ordem_combinacoes
+        grosseiro._partidas_angulo = self._partidas_angulo
+        return grosseiro
+
+    def _avaliar_tarefas(
+        self,
+        deps: Dict[str, Any],
+        tarefas: Sequence[Tuple[float, List[int], bool]],
+        incluir_diagrama: bool,
+        material_concreto: Any = None,
+        material_aco: Any = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Executa as cadeias em serie ou no pool, conforme ``execucao``."""
+
+        if self.catalogo.execucao == "processos" and len(tarefas) > 1:
+            return self._executar_em_processos(tarefas, incluir_diagrama)
+        if material_concreto is None and material_aco is None:
+            material_concreto, material_aco = self._criar_materiais(deps)
+        if (
+            self.catalogo.tempo_maximo_s is not None
+            and self.catalogo.estrategia_busca == "linear"
+            and len(tarefas) > 1
+            and all(parar for _, _, parar in tarefas)
+        ):
+            return self._avaliar_cadeias_por_area(
+                deps=deps,
+                material_concreto=material_concreto,
+                material_aco=material_aco,
+                tarefas=tarefas,
+                incluir_diagrama=incluir_diagrama,
+            ), 1
+        return [
+            self._avaliar_cadeia(
+                deps=deps,
+                material_concreto=material_concreto,
+                material_aco=material_aco,
+                bitola_mm=bitola,
+                quantidades=quantidades,
+                parar_ao_atender=parar,
+                incluir_diagrama=incluir_diagrama,
+            )
+            for bitola, quantidades, parar in tarefas
+        ], 1
+
+    def _avaliar_cadeias_por_area(
+        self,
+        deps: Dict[str, Any],
+        material_concreto: Any,
+        material_aco: Any,
+        tarefas: Sequence[Tuple[float, List[int], bool]],
+        incluir_diagrama: bool,
+    ) -> List[Dict[str, Any]]:
+        """Cadeias lineares intercaladas em ordem crescente de area de aco.
+
+        Avalia as mesmas alternativas que ``_avaliar_cadeia`` em cada cadeia,
+        mas a seguinte e sempre a de menor area entre as cadeias em aberto:
+        quando o prazo termina, as alternativas mais promissoras ja foram
+        avaliadas em todas as bitolas.
+        """
+
+        resultados: List[Dict[str, Any]] = [
+            {"opcoes": [], "nao_avaliadas": 0} for _ in tarefas
+        ]
+        proximas = [0] * len(tarefas)
+        fila = [
+            (quantidades[0] * math.pi * bitola**2 / 4.0, indice)
+            for indice, (bitola, quantidades, _) in enumerate(tarefas)
+            if quantidades
+        ]
+        heapq.heapify(fila)
+        try:
+            while fila:
+                # Sai da fila so depois da analise: se o prazo terminar, a
+                # cadeia continua entre as pendentes.
+                _, indice = fila[0]
+                bitola, quantidades, _ = tarefas[indice]
+                opcao = self._analisar_opcao(
+                    deps=deps,
+                    material_concreto=material_concreto,
+                    material_aco=material_aco,
+                    quantidade=quantidades[proximas[indice]],
+                    bitola_mm=bitola,
+                    incluir_diagrama=incluir_diagrama,
+                )
+                heapq.heappop(fila)
+                self._notificar_opcao(opcao)
+                resultados[indice]["opcoes"].append(opcao)
+                proximas[indice] += 1
+                restantes = len(quantidades) - proximas[indice]
+                if opcao["atende"]:
+                    resultados[indice]["nao_avaliadas"] = restantes
+                elif restantes:
+                    heapq.heappush(
+                        fila,
+                        (
+                            quantidades[proximas[indice]]
+                            * math.pi
+                            * bitola**2
+                            / 4.0,
+                            indice,
+                        ),
+                    )
+        except PrazoEsgotadoFCO:
+            for _, indice in fila:
+                quantidades = tarefas[indice][1]
+                resultados[indice]["nao_avaliadas"] = (
+                    len(quantidades) - proximas[indice]
+                )
+                resultados[indice]["pendentes_prazo"] = list(
+                    quantidades[proximas[indice] :]
+                )
+        return resultados
+
+    def _discretizacao(self) -> Tuple[int, int, int]:
+        """``(n_points do perfil parabolico, aneis, pontos de Gauss)``."""
+
+        if self._grosseiro:
+            return PONTOS_PERFIL_TRIAGEM, ANEIS_TRIAGEM, PONTOS_GAUSS_TRIAGEM
+        return PONTOS_PERFIL_CONCRETO, ANEIS_PADRAO, PONTOS_GAUSS_SEGMENTO
+
+    def _executar_em_processos(
+        self,
+        tarefas: Sequence[Tuple[float, List[int], bool]],
+        incluir_diagrama: bool,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        pool = obter_pool_processos_fco()
+        futuros = [
+            pool.submit(
+                _avaliar_cadeia_em_processo,
+                self,
+                bitola,
+                quantidades,
+                parar,
+                incluir_diagrama,
+            )
+            for bitola, quantidades, parar in tarefas
+        ]
+        posicoes = {futuro: posicao for posicao, futuro in enumerate(futuros)}
+        resultados: List[Dict[str, Any]] = [{} for _ in futuros]
+        try:
+            # Os resultados seguem a ordem das tarefas; a notificacao, a
+            # ordem de conclusao.
+            instrumentacao = instrumentacao_ativa()
+            for futuro in as_completed(futuros):
+                resultado, estatisticas, medicoes = futuro.result()
+                resultados[posicoes[futuro]] = resultado
+                if instrumentacao is not None and medicoes is not None:
+                    instrumentacao.combinar(medicoes)
+                for nome, contagem in estatisticas.items():
+                    acumulado = self._estatisticas_cache.setdefault(
+                        nome, {"acertos": 0, "falhas": 0}
+                    )
+                    for chave, valor in contagem.items():
+                        acumulado[chave] = acumulado.get(chave, 0) + valor
+                for opcao in resultado["opcoes"]:
+                    self._notificar_opcao(opcao)
+        except BrokenProcessPool as exc:
+            encerrar_pool_processos_fco()
+            raise FalhaAnaliseSecao(
+                "O pool de processos da verificacao FCO foi interrompido. "
+                "Repita a requisicao ou use execucao='serial'."
+            ) from exc
+        finally:
+            # Com o fluxo interrompido ou uma falha, as tarefas ainda na fila
+            # sao descartadas.
+            for futuro in futuros:
+                futuro.cancel()
+        return resultados, min(PROCESSOS_FCO_MAXIMO, len(tarefas))
+
+    def _parametros_calculados(self) -> Dict[str, float]:
+        fcd_base = self.materiais.fck_mpa / self.materiais.gamma_c
+        fcd_diagrama = fcd_base * self.materiais.fator_reducao_concreto
+        fyd = self.materiais.fyk_mpa / self.materiais.gamma_s
+        ec = self.materiais.modulo_elasticidade_concreto_mpa
+        if ec is None:
+            ec = 5_600.0 * math.sqrt(self.materiais.fck_mpa)
+        fctm = 0.3 * self.materiais.fck_mpa ** (2.0 / 3.0)
         return {
-            "ssp": ssp,
-            "Concrete": Concrete,
-            "ConcreteSection": ConcreteSection,
-            "SteelBar": SteelBar,
-            "add_bar_circular_array": add_bar_circular_array,
-            "circular_section": circular_section,
-            "versao": versao,
+            "fcd_base_mpa": fcd_base,
+            "fcd_diagrama_mpa": fcd_diagrama,
+            "fyd_mpa": fyd,
+            "modulo_elasticidade_concreto_mpa": ec,
+            "modulo_elasticidade_aco_mpa": (
+                self.materiais.modulo_elasticidade_aco_mpa
+            ),
+            "fctm_mpa": fctm,
+            "deformacao_concreto_inicio_patamar": (
+                self.materiais.deformacao_concreto_inicio_patamar
+            ),
+            "deformacao_ultima_concreto": (
+                self.materiais.deformacao_ultima_concreto
+            ),
+            "expoente_parabola_concreto": (
+                self.materiais.expoente_parabola_concreto
+            ),
+            "deformacao_ultima_aco": self.materiais.deformacao_ultima_aco,
         }
 
+    def _carregar_dependencias(self) -> Dict[str, Any]:
+        if self.catalogo.motor == "abaco":
+            abaco = carregar_abaco_fco()
+            return {"versao": f"abaco_fco v{abaco.versao}", "abaco": abaco}
+        if self.catalogo.motor != "concreteproperties":
+            return {"versao": "numpy " + versao_pacote("numpy")}
+        return carregar_concreteproperties()
+
     def _criar_materiais(self, deps: Dict[str, Any]) -> Tuple[Any, Any]:
+        if "ssp" not in deps:
+            # Os motores nativos leem os parametros de MateriaisFCO.
+            return None, None
+        return self._criar_materiais_concreteproperties(deps)
+
+    def _conferir_motor_nativo(
+        self,
+        deps: Dict[str, Any],
+        material_concreto: Any,
+        material_aco: Any,
+        opcao: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Compara a alternativa no motor nativo e no concreteproperties."""
+
+        try:
+            deps_referencia = carregar_concreteproperties()
+        except DependenciaConcretePropertiesAusente as exc:
+            return {"realizada": False, "motivo": str(exc)}
+        concreto, aco = self._criar_materiais_concreteproperties(
+            deps_referencia
+        )
+        argumentos = {
+            "quantidade": opcao["quantidade_barras"],
+            "bitola_mm": opcao["diametro_barra_mm"],
+            "raio_eixo_barras_mm": opcao["raio_eixo_barras_mm"],
+        }
+        comparacao = comparar_capacidades(
+            self._obter_secao_concreto(
+                deps=deps_referencia,
+                material_concreto=concreto,
+                material_aco=aco,
+                **argumentos,
+            ),
+            self._obter_secao_concreto(
+                deps=deps,
+                material_concreto=material_concreto,
+                material_aco=material_aco,
+                **argumentos,
+            ),
+            normal_n=(
+                self._lista_esforcos()[opcao["combinacao_determinante"]]
+                .normal_compressao_sd_tf
+                * TF_PARA_N
+            ),
+        )
+        return {
+            "realizada": True,
+            "opcao": opcao["id"],
+            "versao_concreteproperties": deps_referencia["versao"],
+            **comparacao,
+        }
+
+    def _criar_materiais_concreteproperties(
+        self, deps: Dict[str, Any]
+    ) -> Tuple[Any, Any]:
         parametros = self._parametros_calculados()
         ssp = deps["ssp"]
         concreto = deps["Concrete"](
@@ -540,7 +2339,7 @@ class DimensionadorFlexoCompressaoObliqua:
                 ),
                 ultimate_strain=parametros["deformacao_ultima_concreto"],
                 n=parametros["expoente_parabola_concreto"],
-                n_points=20,
+                n_points=self._discretizacao()[0],
             ),
             flexural_tensile_strength=parametros["fctm_mpa"],
             colour="lightgrey",
@@ -565,7 +2364,10 @@ class DimensionadorFlexoCompressaoObliqua:
         quantidade: int,
         bitola_mm: float,
         incluir_diagrama: bool,
+        refinar: bool = False,
     ) -> Dict[str, Any]:
+        self._verificar_prazo()
+        inicio = perf_counter()
         geometria = avaliar_geometria_armadura_circular(
             diametro_secao_mm=self.secao.diametro_m * 1_000.0,
             cobrimento_nominal_mm=self.secao.cobrimento_nominal_mm,
@@ -596,78 +2398,131 @@ class DimensionadorFlexoCompressaoObliqua:
             "fator_reserva_radial": None,
             "momento_resistente_direcao_tf_m": None,
             "ponto_resistente_direcao_tf_m": None,
+            "combinacao_determinante": None,
+            "combinacoes_verificadas": 0,
+            "combinacoes_por_superficie": 0,
+            "combinacoes_por_decisao_antecipada": 0,
+            "segunda_ordem": None,
             "erro_analise": None,
+            "tempo_analise_s": None,
         }
 
         if not geometria["viavel_geometricamente"]:
             base["status"] = "inviavel_geometricamente"
             if incluir_diagrama:
                 base["diagrama_mx_my_tf_m"] = []
+            base["tempo_analise_s"] = perf_counter() - inicio
             return base
 
         try:
-            secao_geometrica = deps["circular_section"](
-                d=self.secao.diametro_m * 1_000.0,
-                n=self.catalogo.pontos_contorno_secao,
-                material=material_concreto,
-            ).align_center()
-            secao_geometrica = deps["add_bar_circular_array"](
-                geometry=secao_geometrica,
-                area=area_barra_mm2,
-                material=material_aco,
-                n_bar=quantidade,
-                r_array=geometria["raio_eixo_barras_mm"],
-                theta_0=math.radians(self.secao.angulo_inicial_barras_graus),
-                ctr=(0.0, 0.0),
-                n=8,
+            secao_concreto = self._obter_secao_concreto(
+                deps=deps,
+                material_concreto=material_concreto,
+                material_aco=material_aco,
+                quantidade=quantidade,
+                bitola_mm=bitola_mm,
+                raio_eixo_barras_mm=geometria["raio_eixo_barras_mm"],
             )
-            secao_concreto = deps["ConcreteSection"](secao_geometrica)
-            demanda_n_mm = (
-                self.esforcos.momento_x_sd_tf_m * TF_M_PARA_N_MM,
-                self.esforcos.momento_y_sd_tf_m * TF_M_PARA_N_MM,
+            lista_esforcos = self._lista_esforcos()
+            quantidade_por_normal = Counter(
+                esforcos.normal_compressao_sd_tf for esforcos in lista_esforcos
             )
-            normal_n = self.esforcos.normal_compressao_sd_tf * TF_PARA_N
-
-            if self.catalogo.modo_verificacao == "direcional":
-                avaliacao = avaliar_capacidade_direcional(
+            # Tabelas de setor (direcional) ou diagramas biaxiais
+            # (diagrama_completo) compartilhados pelas combinacoes de mesma N.
+            compartilhados: Dict[float, Any] = {}
+            avaliacoes: Dict[int, Dict[str, Any]] = {}
+            segunda_ordem: Dict[int, Dict[str, Any]] = {}
+            determinante: Optional[int] = None
+            for indice in self._ordem_combinacoes_carga(
+                bitola_mm, geometria["raio_eixo_barras_mm"]
+            ):
+                esforcos = lista_esforcos[indice]
+                if (
+                    self.esbeltez is not None
+                    and self.esbeltez.metodo == "momento_curvatura"
+                    and not self._efeitos_segunda_ordem()[indice]["dispensada"]
+                ):
+                    esforcos, segunda_ordem[indice] = (
+                        self._esforcos_momento_curvatura(
+                            indice=indice,
+                            esforcos=esforcos,
+                            quantidade=quantidade,
+                            bitola_mm=bitola_mm,
+                            raio_eixo_barras_mm=geometria[
+                                "raio_eixo_barras_mm"
+                            ],
+                        )
+                    )
+                    if esforcos is None:
+                        avaliacoes[indice] = resultado_instabilidade()
+                        determinante = indice
+                        break
+                avaliacoes[indice] = self._avaliar_combinacao(
+                    deps=deps,
                     secao_concreto=secao_concreto,
-                    normal_n=normal_n,
-                    demanda_n_mm=demanda_n_mm,
-                    tolerancia_angular_rad=math.radians(
-                        self.catalogo.tolerancia_angular_graus
+                    indice=indice,
+                    esforcos=esforcos,
+                    quantidade=quantidade,
+                    bitola_mm=bitola_mm,
+                    compartilhar=(
+                        quantidade_por_normal[esforcos.normal_compressao_sd_tf]
+                        > 1
                     ),
-                    max_iteracoes=self.catalogo.max_iteracoes_angulo,
+                    compartilhados=compartilhados,
+                    refinar=refinar,
                 )
-                if not avaliacao["convergiu"]:
-                    raise FalhaAnaliseSecao(
-                        "A busca direcional nao convergiu: erro angular final "
-                        f"de {avaliacao['erro_angular_graus']:.6f} grau(s). "
-                        "Tente aumentar max_iteracoes_angulo ou use "
-                        "modo_verificacao='diagrama_completo'."
-                    )
-                erro_diagrama = None
-                contorno_n_mm: List[Tuple[float, float]] = []
-                if incluir_diagrama:
-                    try:
-                        contorno_n_mm = gerar_diagrama_biaxial_por_simetria(
-                            secao_concreto=secao_concreto,
-                            normal_n=normal_n,
-                            quantidade_barras=quantidade,
-                            pontos_desejados=self.catalogo.pontos_diagrama,
-                        )
-                    except Exception as exc_diagrama:
-                        # A verificacao direcional continua valida mesmo se a
-                        # construcao opcional do contorno visual falhar.
-                        erro_diagrama = str(exc_diagrama)
-            else:
-                erro_diagrama = None
-                avaliacao = avaliar_por_diagrama_completo(
-                    secao_concreto=secao_concreto,
-                    normal_n=normal_n,
-                    demanda_n_mm=demanda_n_mm,
-                    pontos_diagrama=self.catalogo.pontos_diagrama,
+                if not avaliacoes[indice]["atende"]:
+                    # Uma combinacao reprovada ja reprova a alternativa.
+                    determinante = indice
+                    break
+            if determinante is None:
+                determinante = max(
+                    avaliacoes,
+                    key=lambda item: (
+                        avaliacoes[item]["utilizacao"] or 0.0,
+                        -item,
+                    ),
+                )
+            avaliacao = avaliacoes[determinante]
+            ordem = (base["area_aco_total_cm2"], quantidade, bitola_mm)
+            if (
+                avaliacao["atende"]
+                and not self._grosseiro
+                and (
+                    self._secao_recomendada is None
+                    or ordem <= self._secao_recomendada[0]
                 )
-                contorno_n_mm = avaliacao.pop("contorno_n_mm")
+            ):
+                self._secao_recomendada = (ordem, base["id"], secao_concreto)
+            if self.catalogo.usar_superficie_interacao and avaliacao["atende"]:
+                chave_superficie = self._chave_superficie_interacao(
+                    deps, quantidade, bitola_mm
+                )
+                CACHE_PEDIDOS_SUPERFICIES_FCO.obter_ou_criar(
+                    chave_superficie, lambda: True, custo=1.0
+                )
+            normal_n = (
+                lista_esforcos[determinante].normal_compressao_sd_tf * TF_PARA_N
+            )
+
+            erro_diagrama = None
+            amostragem_diagrama = None
+            contorno_n_mm: List[Tuple[float, float]] = []
+            if self.catalogo.modo_verificacao == "direcional":
+                if incluir_diagrama:
+                    (
+                        contorno_n_mm,
+                        erro_diagrama,
+                        amostragem_diagrama,
+                    ) = self._contorno_direcional(
+                        secao_concreto=secao_concreto,
+                        normal_n=normal_n,
+                        quantidade=quantidade,
+                        bitola_mm=bitola_mm,
+                        tabela=compartilhados.get(normal_n),
+                    )
+            else:
+                contorno_n_mm = avaliacao["contorno_n_mm"]
 
             ponto_resistente_n_mm = avaliacao["ponto_resistente_n_mm"]
             ponto_resistente = (
@@ -688,53 +2543,1151 @@ class DimensionadorFlexoCompressaoObliqua:
                 else None
             )
 
-            base.update(
-                {
-                    "status": "atende" if avaliacao["atende"] else "nao_atende",
-                    "atende": avaliacao["atende"],
-                    "utilizacao": avaliacao["utilizacao"],
-                    "fator_reserva_radial": avaliacao["fator_reserva"],
-                    "momento_resistente_direcao_tf_m": momento_resistente,
-                    "ponto_resistente_direcao_tf_m": ponto_resistente,
-                    "angulo_linha_neutra_graus": avaliacao.get(
-                        "angulo_linha_neutra_graus"
-                    ),
-                    "angulo_momento_resistente_graus": avaliacao.get(
-                        "angulo_momento_resistente_graus"
-                    ),
-                    "erro_angular_graus": avaliacao.get(
-                        "erro_angular_graus"
-                    ),
-                    "iteracoes_angulo": avaliacao.get("iteracoes_angulo"),
-                    "erro_diagrama_recomendacao": erro_diagrama,
-                }
+            base.update(
+                {
+                    "status": "atende" if avaliacao["atende"] else "nao_atende",
+                    "atende": avaliacao["atende"],
+                    "utilizacao": avaliacao["utilizacao"],
+                    "fator_reserva_radial": avaliacao["fator_reserva"],
+                    "momento_resistente_direcao_tf_m": momento_resistente,
+                    "ponto_resistente_direcao_tf_m": ponto_resistente,
+                    "angulo_linha_neutra_graus": avaliacao.get(
+                        "angulo_linha_neutra_graus"
+                    ),
+                    "angulo_momento_resistente_graus": avaliacao.get(
+                        "angulo_momento_resistente_graus"
+                    ),
+                    "erro_angular_graus": avaliacao.get(
+                        "erro_angular_graus"
+                    ),
+                    "iteracoes_angulo": avaliacao.get("iteracoes_angulo"),
+                    "combinacao_determinante": determinante,
+                    "nome_combinacao_determinante": (
+                        lista_esforcos[determinante].nome
+                    ),
+                    "combinacoes_verificadas": len(avaliacoes),
+                    "combinacoes_por_superficie": sum(
+                        1
+                        for item in avaliacoes.values()
+                        if item.get("origem") == "superficie_interacao"
+                    ),
+                    "combinacoes_por_decisao_antecipada": sum(
+                        1
+                        for item in avaliacoes.values()
+                        if item.get("decisao_antecipada")
+                    ),
+                    "erro_diagrama_recomendacao": erro_diagrama,
+                    "segunda_ordem": segunda_ordem.get(determinante),
+                }
+            )
+            if incluir_diagrama:
+                base["diagrama_mx_my_tf_m"] = contorno_em_tf_m(contorno_n_mm)
+                base["amostragem_diagrama"] = amostragem_diagrama
+            base["tempo_analise_s"] = perf_counter() - inicio
+            return base
+        except Exception as exc:
+            base.update(
+                {
+                    "status": "erro_analise",
+                    "erro_analise": str(exc),
+                }
+            )
+            if incluir_diagrama:
+                base["diagrama_mx_my_tf_m"] = []
+            base["tempo_analise_s"] = perf_counter() - inicio
+            return base
+
+    def _contorno_direcional(
+        self,
+        secao_concreto: Any,
+        normal_n: float,
+        quantidade: int,
+        bitola_mm: float,
+        tabela: Optional[TabelaSetorCapacidadeFCO] = None,
+    ) -> Tuple[
+        List[Tuple[float, float]], Optional[str], Optional[Dict[str, Any]]
+    ]:
+        """Contorno Mx-My (N.mm), a mensagem de falha e a amostragem usada.
+
+        Quando a tabela ja orientou a busca direcional, ela vem do cache e
+        nenhuma analise nova e feita. Com ``tolerancia_contorno_tf_m``, o
+        contorno vem da tabela adaptativa, que a busca nao usa.
+        """
+
+        try:
+            if self.catalogo.tolerancia_contorno_tf_m is not None:
+                tabela = self._obter_tabela_setor_adaptativa(
+                    secao_concreto=secao_concreto,
+                    normal_n=normal_n,
+                    quantidade=quantidade,
+                    bitola_mm=bitola_mm,
+                )
+            elif tabela is None:
+                compartilhada = (
+                    sum(
+                        1
+                        for esforcos in self._lista_esforcos()
+                        if esforcos.normal_compressao_sd_tf * TF_PARA_N
+                        == normal_n
+                    )
+                    > 1
+                )
+                tabela = self._obter_tabela_setor(
+                    secao_concreto=secao_concreto,
+                    normal_n=normal_n,
+                    quantidade=quantidade,
+                    bitola_mm=bitola_mm,
+                    orientar_busca=(
+                        self.catalogo.usar_tabela_setor or compartilhada
+                    ),
+                )
+            return tabela.contorno(), None, self._amostragem_contorno(tabela)
+        except Exception as exc:
+            # A verificacao direcional continua valida mesmo se a construcao
+            # opcional do contorno visual falhar.
+            return [], str(exc), None
+
+    def _amostragem_contorno(
+        self, tabela: TabelaSetorCapacidadeFCO
+    ) -> Dict[str, Any]:
+        return {
+            "modo": (
+                "uniforme" if tabela.erro_corda_n_mm is None else "adaptativa"
+            ),
+            "analises_secao": tabela.analises,
+            "pontos_contorno": len(tabela.momentos_n_mm),
+            "tolerancia_corda_tf_m": self.catalogo.tolerancia_contorno_tf_m,
+            "erro_corda_estimado_tf_m": (
+                tabela.erro_corda_n_mm / TF_M_PARA_N_MM
+                if tabela.erro_corda_n_mm is not None
+                else None
+            ),
+        }
+
+    def _diagrama_recomendacao(
+        self,
+        deps: Dict[str, Any],
+        material_concreto: Any,
+        material_aco: Any,
+        opcao: Dict[str, Any],
+    ) -> Tuple[
+        List[Dict[str, float]], Optional[str], Optional[Dict[str, Any]]
+    ]:
+        """Contorno da recomendacao sem refazer a busca direcional.
+
+        Usa a secao guardada na passada do catalogo (com execucao por
+        processos ela vem do cache ou e reconstruida) e a forca normal da
+        combinacao determinante.
+        """
+
+        esforcos = self._lista_esforcos()[opcao["combinacao_determinante"]]
+        if "abaco" in deps:
+            argumentos = self._argumentos_abaco(
+                normal_n=esforcos.normal_compressao_sd_tf * TF_PARA_N,
+                quantidade=opcao["quantidade_barras"],
+                bitola_mm=opcao["diametro_barra_mm"],
+            )
+            escala = argumentos.pop("escala_momento_n_mm")
+            try:
+                contorno = deps["abaco"].contorno(
+                    **argumentos,
+                    angulo_inicial_barras_rad=math.radians(
+                        self.secao.angulo_inicial_barras_graus
+                    ),
+                    escala_momento=escala,
+                    pontos=self.catalogo.pontos_diagrama,
+                )
+            except ForaDoAbacoFCO as exc:
+                return [], str(exc), None
+            return contorno_em_tf_m(fechar_poligono(contorno)), None, None
+
+        secao_concreto = None
+        if (
+            self._secao_recomendada is not None
+            and self._secao_recomendada[1] == opcao["id"]
+        ):
+            secao_concreto = self._secao_recomendada[2]
+        if secao_concreto is None:
+            secao_concreto = self._obter_secao_concreto(
+                deps=deps,
+                material_concreto=material_concreto,
+                material_aco=material_aco,
+                quantidade=opcao["quantidade_barras"],
+                bitola_mm=opcao["diametro_barra_mm"],
+                raio_eixo_barras_mm=opcao["raio_eixo_barras_mm"],
+            )
+        contorno_n_mm, erro, amostragem = self._contorno_direcional(
+            secao_concreto=secao_concreto,
+            normal_n=esforcos.normal_compressao_sd_tf * TF_PARA_N,
+            quantidade=opcao["quantidade_barras"],
+            bitola_mm=opcao["diametro_barra_mm"],
+        )
+        return contorno_em_tf_m(contorno_n_mm), erro, amostragem
+
+    def _argumentos_abaco(
+        self, normal_n: float, quantidade: int, bitola_mm: float
+    ) -> Dict[str, Any]:
+        """Grandezas reduzidas da alternativa e a escala ``Ac D fcd`` (N.mm)."""
+
+        parametros = self._parametros_calculados()
+        fcd = parametros["fcd_diagrama_mpa"]
+        fyd = parametros["fyd_mpa"]
+        diametro_mm = self.secao.diametro_m * 1_000.0
+        area_bruta = math.pi * diametro_mm**2 / 4.0
+        raio_eixo = (
+            diametro_mm / 2.0
+            - self.secao.cobrimento_nominal_mm
+            - self.secao.diametro_armadura_transversal_mm
+            - bitola_mm / 2.0
+        )
+        return {
+            "razao_fcd_fyd": fcd / fyd,
+            "razao_raio_barras": raio_eixo / (diametro_mm / 2.0),
+            "quantidade_barras": int(quantidade),
+            "taxa_mecanica": (
+                quantidade * math.pi * bitola_mm**2 / 4.0 * fyd
+                / (area_bruta * fcd)
+            ),
+            "normal_reduzida": normal_n / (area_bruta * fcd),
+            "escala_momento_n_mm": area_bruta * diametro_mm * fcd,
+        }
+
+    def _avaliar_por_abaco(
+        self,
+        abaco: AbacoFCO,
+        normal_n: float,
+        demanda_n_mm: Tuple[float, float],
+        quantidade: int,
+        bitola_mm: float,
+    ) -> Dict[str, Any]:
+        """Verifica a combinacao por interpolacao no abaco adimensional."""
+
+        argumentos = self._argumentos_abaco(normal_n, quantidade, bitola_mm)
+        escala = argumentos.pop("escala_momento_n_mm")
+        # O abaco mede a direcao pelo vetor geometrico (m_y, m_x), a partir
+        # do eixo da primeira barra.
+        angulo_geometrico = math.atan2(
+            demanda_n_mm[0], demanda_n_mm[1]
+        ) - math.radians(self.secao.angulo_inicial_barras_graus)
+        try:
+            momento_resistente = escala * abaco.momento_reduzido_resistente(
+                **argumentos,
+                angulo_geometrico=angulo_geometrico,
+            )
+        except ForaDoAbacoFCO as exc:
+            raise FalhaAnaliseSecao(str(exc)) from exc
+
+        modulo = math.hypot(*demanda_n_mm)
+        if momento_resistente <= TOLERANCIA:
+            # Normal fora do dominio de compressao do abaco: como no
+            # diagrama completo sem intersecao, a utilizacao fica indefinida.
+            utilizacao = None
+            fator_reserva = None
+            ponto_resistente = None
+        elif modulo <= TOLERANCIA:
+            utilizacao = 0.0
+            fator_reserva = None
+            ponto_resistente = None
+        else:
+            utilizacao = modulo / momento_resistente
+            fator_reserva = momento_resistente / modulo
+            ponto_resistente = (
+                demanda_n_mm[0] * fator_reserva,
+                demanda_n_mm[1] * fator_reserva,
+            )
+        return {
+            "convergiu": True,
+            "atende": utilizacao is not None and utilizacao <= 1.0,
+            "utilizacao": utilizacao,
+            "fator_reserva": fator_reserva,
+            "momento_resistente_n_mm": momento_resistente,
+            "ponto_resistente_n_mm": ponto_resistente,
+            "angulo_linha_neutra_graus": None,
+            "angulo_momento_resistente_graus": (
+                math.degrees(math.atan2(demanda_n_mm[1], demanda_n_mm[0]))
+                if modulo > TOLERANCIA
+                else None
+            ),
+            "erro_angular_graus": None,
+            "iteracoes_angulo": 0,
+            "origem": "abaco",
+        }
+
+    def _confirmar_abaco(self, opcao: Dict[str, Any]) -> Dict[str, Any]:
+        """Refaz a recomendacao do abaco com o concreteproperties."""
+
+        referencia = replace(
+            self,
+            catalogo=replace(
+                self.catalogo,
+                motor="concreteproperties",
+                confirmar_abaco=False,
+            ),
+        )
+        referencia._estatisticas_cache = self._estatisticas_cache
+        try:
+            deps = referencia._carregar_dependencias()
+        except DependenciaConcretePropertiesAusente as exc:
+            return {"realizada": False, "motivo": str(exc)}
+        material_concreto, material_aco = referencia._criar_materiais(deps)
+        confirmada = referencia._analisar_opcao(
+            deps=deps,
+            material_concreto=material_concreto,
+            material_aco=material_aco,
+            quantidade=opcao["quantidade_barras"],
+            bitola_mm=opcao["diametro_barra_mm"],
+            incluir_diagrama=False,
+        )
+        utilizacao = confirmada["utilizacao"]
+        return {
+            "realizada": True,
+            "opcao": opcao["id"],
+            "versao_concreteproperties": deps["versao"],
+            "status": confirmada["status"],
+            "atende": confirmada["atende"],
+            "utilizacao_abaco": opcao["utilizacao"],
+            "utilizacao_concreteproperties": utilizacao,
+            "desvio_relativo_utilizacao": (
+                opcao["utilizacao"] / utilizacao - 1.0
+                if utilizacao and opcao["utilizacao"] is not None
+                else None
+            ),
+            "erro_analise": confirmada["erro_analise"],
+        }
+
+    def _avaliar_combinacao(
+        self,
+        deps: Dict[str, Any],
+        secao_concreto: Any,
+        indice: int,
+        esforcos: EsforcosFCO,
+        quantidade: int,
+        bitola_mm: float,
+        compartilhar: bool,
+        compartilhados: Dict[float, Any],
+        refinar: bool = False,
+    ) -> Dict[str, Any]:
+        """Verifica uma combinacao de carga na alternativa.
+
+        Com ``compartilhar``, outras combinacoes tem a mesma N: a tabela de
+        setor (ou o diagrama biaxial) dessa N e calculada uma vez e guardada
+        em ``compartilhados``. Com ``decisao_antecipada``, a busca direcional
+        para assim que os limites de capacidade decidem a verificacao, exceto
+        com ``refinar``: a recomendacao e refinada pela tabela de setor, para
+        que uma opcao aprovada pelos limites nao falhe na convergencia.
+
+        Sem tabela, a busca parte do angulo da linha neutra e da inclinacao
+        da secante obtidos na alternativa anterior (ver ``_partida_angulo``).
+        """
+
+        demanda_n_mm = (
+            esforcos.momento_x_sd_tf_m * TF_M_PARA_N_MM,
+            esforcos.momento_y_sd_tf_m * TF_M_PARA_N_MM,
+        )
+        normal_n = esforcos.normal_compressao_sd_tf * TF_PARA_N
+
+        if "abaco" in deps:
+            return self._avaliar_por_abaco(
+                abaco=deps["abaco"],
+                normal_n=normal_n,
+                demanda_n_mm=demanda_n_mm,
+                quantidade=quantidade,
+                bitola_mm=bitola_mm,
+            )
+
+        if self.catalogo.modo_verificacao != "direcional":
+            if normal_n not in compartilhados:
+                with medir("biaxial_bending_diagram"):
+                    compartilhados[normal_n] = (
+                        secao_concreto.biaxial_bending_diagram(
+                            n=normal_n,
+                            n_points=self.catalogo.pontos_diagrama,
+                            progress_bar=False,
+                        )
+                    )
+            return avaliar_por_diagrama_completo(
+                secao_concreto=secao_concreto,
+                normal_n=normal_n,
+                demanda_n_mm=demanda_n_mm,
+                pontos_diagrama=self.catalogo.pontos_diagrama,
+                diagrama=compartilhados[normal_n],
+            )
+
+        superficie = (
+            self._obter_superficie_interacao(
+                deps=deps,
+                secao_concreto=secao_concreto,
+                quantidade=quantidade,
+                bitola_mm=bitola_mm,
+            )
+            if self.catalogo.usar_superficie_interacao
+            else None
+        )
+        if superficie is not None:
+            avaliacao = superficie.avaliar(
+                normal_n=normal_n,
+                demanda_n_mm=demanda_n_mm,
+                margem=MARGEM_SUPERFICIE_INTERACAO,
+            )
+            if avaliacao is not None:
+                return avaliacao
+
+        decidir = self.catalogo.decisao_antecipada and not refinar
+        tabela = compartilhados.get(normal_n)
+        if tabela is None and (
+            self.catalogo.usar_tabela_setor
+            or compartilhar
+            or (refinar and self.catalogo.decisao_antecipada)
+        ):
+            tabela = self._obter_tabela_setor(
+                secao_concreto=secao_concreto,
+                normal_n=normal_n,
+                quantidade=quantidade,
+                bitola_mm=bitola_mm,
+                orientar_busca=True,
+            )
+            compartilhados[normal_n] = tabela
+        avaliacao = avaliar_capacidade_direcional(
+            secao_concreto=secao_concreto,
+            normal_n=normal_n,
+            demanda_n_mm=demanda_n_mm,
+            tolerancia_angular_rad=math.radians(
+                self.catalogo.tolerancia_angular_graus
+            ),
+            max_iteracoes=self.catalogo.max_iteracoes_angulo,
+            tabela=tabela,
+            partida=self._partida_angulo(indice),
+            apenas_decisao=decidir,
+            simetria=(
+                quantidade,
+                math.radians(self.secao.angulo_inicial_barras_graus),
+            ),
+        )
+        if not avaliacao["convergiu"]:
+            raise FalhaAnaliseSecao(
+                "A busca direcional nao convergiu: erro angular final "
+                f"de {avaliacao['erro_angular_graus']:.6f} grau(s). "
+                "Tente aumentar max_iteracoes_angulo ou use "
+                "modo_verificacao='diagrama_completo'."
+            )
+        if avaliacao["angulo_linha_neutra_graus"] is not None:
+            _, inclinacao = self._partidas_angulo.get(
+                indice, (0.0, INCLINACAO_PARTIDA_FRIA)
+            )
+            if (
+                INCLINACAO_PARTIDA_MINIMA
+                <= abs(avaliacao["inclinacao_angulo"])
+                <= INCLINACAO_PARTIDA_MAXIMA
+            ):
+                inclinacao = avaliacao["inclinacao_angulo"]
+            self._partidas_angulo[indice] = (
+                math.radians(avaliacao["angulo_linha_neutra_graus"]),
+                inclinacao,
+            )
+        return avaliacao
+
+    def _partida_angulo(self, indice: int) -> Optional[Tuple[float, float]]:
+        """Angulo inicial e inclinacao da busca direcional da combinacao.
+
+        Alternativas vizinhas convergem para quase o mesmo angulo da linha
+        neutra na mesma combinacao. Sem historico para ``indice``, parte-se
+        da combinacao ja resolvida de direcao mais proxima, transladada pela
+        sua inclinacao: na secao circular o angulo da linha neutra gira com
+        o da demanda, em sentido oposto (inclinacao proxima de -1).
+        """
+
+        if indice in self._partidas_angulo:
+            return self._partidas_angulo[indice]
+        if not self._partidas_angulo:
+            return None
+        lista_esforcos = self._lista_esforcos()
+
+        def angulo_demanda(posicao: int) -> float:
+            esforcos = lista_esforcos[posicao]
+            return math.atan2(
+                esforcos.momento_y_sd_tf_m, esforcos.momento_x_sd_tf_m
+            )
+
+        alvo = angulo_demanda(indice)
+        vizinha = min(
+            self._partidas_angulo,
+            key=lambda posicao: abs(
+                normalizar_angulo_rad(alvo - angulo_demanda(posicao))
+            ),
+        )
+        theta, inclinacao = self._partidas_angulo[vizinha]
+        return (
+            theta
+            + inclinacao
+            * normalizar_angulo_rad(alvo - angulo_demanda(vizinha)),
+            inclinacao,
+        )
+
+    def _obter_superficie_interacao(
+        self,
+        deps: Dict[str, Any],
+        secao_concreto: Any,
+        quantidade: int,
+        bitola_mm: float,
+    ) -> Optional[SuperficieInteracaoFCO]:
+        """Superficie N-Mx-My da alternativa, em cache entre requisicoes.
+
+        A chave inclui a versao da biblioteca de ``_carregar_dependencias`` e
+        ``VERSAO_SUPERFICIE_INTERACAO``: uma atualizacao de qualquer uma
+        invalida as superficies ja calculadas. A superficie custa dezenas de
+        analises da secao e so compensa na alternativa verificada de novo:
+        devolve ``None`` ate que a alternativa tenha atendido uma vez na
+        analise da secao (``CACHE_PEDIDOS_SUPERFICIES_FCO``).
+        """
+
+        parametros = self._parametros_calculados()
+        area_bruta = math.pi * (self.secao.diametro_m * 1_000.0) ** 2 / 4.0
+        area_aco = quantidade * math.pi * bitola_mm**2 / 4.0
+        # Compressao centrada com todo o aco escoado: niveis acima dela nao
+        # tem equilibrio e encerram a grade.
+        normal_maxima_n = (
+            parametros["fcd_diagrama_mpa"] * (area_bruta - area_aco)
+            + parametros["fyd_mpa"] * area_aco
+        )
+        pontos_setor = pontos_tabela_setor(
+            quantidade,
+            self.catalogo.pontos_diagrama,
+            minimo=PONTOS_TABELA_SETOR_MINIMO,
+        )
+        chave = self._chave_superficie_interacao(deps, quantidade, bitola_mm)
+        if (
+            chave not in CACHE_PEDIDOS_SUPERFICIES_FCO
+            and chave not in CACHE_SUPERFICIES_FCO
+        ):
+            return None
+        return self._consultar_cache(
+            "superficies_interacao",
+            chave,
+            lambda: construir_superficie_interacao(
+                secao_concreto=secao_concreto,
+                quantidade_barras=quantidade,
+                angulo_inicial_barras_rad=math.radians(
+                    self.secao.angulo_inicial_barras_graus
+                ),
+                normal_maxima_n=normal_maxima_n,
+                niveis=NIVEIS_SUPERFICIE_INTERACAO,
+                direcoes=DIRECOES_SUPERFICIE_INTERACAO,
+                pontos_setor=pontos_setor,
+                falhas_equilibrio=(
+                    (FalhaEquilibrioFibras, deps["AnalysisError"])
+                    if "AnalysisError" in deps
+                    else (FalhaEquilibrioFibras,)
+                ),
+            ),
+            custo=NIVEIS_SUPERFICIE_INTERACAO * DIRECOES_SUPERFICIE_INTERACAO,
+        )
+
+    def _chave_superficie_interacao(
+        self, deps: Dict[str, Any], quantidade: int, bitola_mm: float
+    ) -> Tuple[Any, ...]:
+        return (
+            VERSAO_SUPERFICIE_INTERACAO,
+            deps["versao"],
+            self.catalogo.motor,
+            astuple(self.secao),
+            astuple(self.materiais),
+            self.catalogo.pontos_contorno_secao,
+            int(quantidade),
+            float(bitola_mm),
+            pontos_tabela_setor(
+                quantidade,
+                self.catalogo.pontos_diagrama,
+                minimo=PONTOS_TABELA_SETOR_MINIMO,
+            ),
+        )
+
+    def _lista_esforcos(self) -> List[EsforcosFCO]:
+        """Esforcos de calculo de cada combinacao.
+
+        Com ``esbeltez``, os momentos ja incluem o momento minimo e, nos
+        metodos aproximados, o momento de segunda ordem. No metodo
+        ``momento_curvatura`` o acrescimo depende da armadura e e aplicado
+        por alternativa em ``_analisar_opcao``; como so aumenta o momento,
+        os limites inferiores de armadura calculados com esta lista
+        continuam validos.
+        """
+
+        if self.esbeltez is None:
+            return self._lista_esforcos_primeira_ordem()
+        if self._esforcos_calculo is None:
+            esforcos_calculo = []
+            for esforcos, efeito in zip(
+                self._lista_esforcos_primeira_ordem(),
+                self._efeitos_segunda_ordem(),
+            ):
+                momento = efeito["momento_total_tf_m"]
+                if momento is None:
+                    momento = efeito["momento_primeira_ordem_tf_m"]
+                if math.isclose(
+                    momento,
+                    math.hypot(
+                        esforcos.momento_x_sd_tf_m, esforcos.momento_y_sd_tf_m
+                    ),
+                ):
+                    esforcos_calculo.append(esforcos)
+                    continue
+                angulo = math.radians(efeito["angulo_momento_graus"])
+                esforcos_calculo.append(
+                    replace(
+                        esforcos,
+                        momento_x_sd_tf_m=momento * math.cos(angulo),
+                        momento_y_sd_tf_m=momento * math.sin(angulo),
+                    )
+                )
+            self._esforcos_calculo = esforcos_calculo
+        return list(self._esforcos_calculo)
+
+    def _lista_esforcos_primeira_ordem(self) -> List[EsforcosFCO]:
+        if self.combinacoes_carga:
+            return list(self.combinacoes_carga)
+        return [self.esforcos] if self.esforcos is not None else []
+
+    def _indice_esbeltez(self) -> float:
+        # Secao circular: raio de giracao D/4.
+        return 4.0 * self.esbeltez.comprimento_flambagem_m / self.secao.diametro_m
+
+    def _efeitos_segunda_ordem(self) -> List[Dict[str, Any]]:
+        """Pilar-padrao de cada combinacao (NBR 6118, 11.3.3.4.3 e 15.8).
+
+        ``M1`` e o momento resultante de primeira ordem, elevado a
+        ``M1d,min = Nd (0,015 + 0,03 h)`` quando menor. Na secao circular
+        toda direcao e principal, e o momento total fica na direcao de
+        ``M1``. No metodo ``momento_curvatura``, ``momento_total_tf_m`` e
+        ``None``: o valor sai da curva de cada alternativa.
+        """
+
+        if self._segunda_ordem is not None:
+            return self._segunda_ordem
+        metodo = self.esbeltez.metodo
+        diametro = self.secao.diametro_m
+        comprimento = self.esbeltez.comprimento_flambagem_m
+        esbeltez = self._indice_esbeltez()
+        normal_resistente_concreto_tf = (
+            math.pi * (diametro * 1_000.0) ** 2 / 4.0
+            * self._parametros_calculados()["fcd_base_mpa"]
+            / TF_PARA_N
+        )
+
+        efeitos: List[Dict[str, Any]] = []
+        for indice, esforcos in enumerate(
+            self._lista_esforcos_primeira_ordem()
+        ):
+            normal = esforcos.normal_compressao_sd_tf
+            momento = math.hypot(
+                esforcos.momento_x_sd_tf_m, esforcos.momento_y_sd_tf_m
+            )
+            angulo = (
+                math.atan2(esforcos.momento_y_sd_tf_m, esforcos.momento_x_sd_tf_m)
+                if momento > TOLERANCIA
+                else 0.0
+            )
+            momento_minimo = normal * (0.015 + 0.03 * diametro)
+            alfa_b = self.esbeltez.alfa_b
+            momento_minimo_aplicado = momento < momento_minimo
+            if momento_minimo_aplicado:
+                momento, alfa_b = momento_minimo, 1.0
+            excentricidade = momento / normal if normal > TOLERANCIA else 0.0
+            esbeltez_limite = min(
+                max((25.0 + 12.5 * excentricidade / diametro) / alfa_b, 35.0),
+                90.0,
+            )
+            normal_reduzida = normal / normal_resistente_concreto_tf
+            dispensada = esbeltez <= esbeltez_limite or normal <= TOLERANCIA
+
+            curvatura = None
+            rigidez = None
+            momento_total: Optional[float] = momento
+            if dispensada:
+                pass
+            elif metodo == "curvatura_aproximada":
+                curvatura = min(
+                    0.005 / (diametro * (normal_reduzida + 0.5)),
+                    0.005 / diametro,
+                )
+                momento_total = max(
+                    alfa_b * momento
+                    + normal * comprimento**2 / 10.0 * curvatura,
+                    momento,
+                )
+            elif metodo == "rigidez_kappa":
+                # kappa = 32 (1 + 5 M / (h N)) nu na expressao de M_tot
+                # resulta em a M^2 + b M + c = 0, com uma unica raiz positiva.
+                a = 5.0 / (diametro * normal)
+                b = 1.0 - esbeltez**2 / 3_840.0 - a * alfa_b * momento
+                c = -alfa_b * momento
+                momento_total = max(
+                    (-b + math.sqrt(b * b - 4.0 * a * c)) / (2.0 * a), momento
+                )
+                rigidez = 32.0 * (1.0 + a * momento_total) * normal_reduzida
+            else:
+                momento_total = None
+
+            efeitos.append(
+                {
+                    "indice": indice,
+                    "nome": esforcos.nome,
+                    "forca_normal_reduzida": normal_reduzida,
+                    "esbeltez_limite": esbeltez_limite,
+                    "dispensada": dispensada,
+                    "alfa_b": alfa_b,
+                    "momento_minimo_tf_m": momento_minimo,
+                    "momento_minimo_aplicado": momento_minimo_aplicado,
+                    "momento_primeira_ordem_tf_m": momento,
+                    "angulo_momento_graus": math.degrees(angulo),
+                    "curvatura_1_m": curvatura,
+                    "rigidez_adimensional_kappa": rigidez,
+                    "momento_total_tf_m": momento_total,
+                }
+            )
+        self._segunda_ordem = efeitos
+        return efeitos
+
+    def _esforcos_momento_curvatura(
+        self,
+        indice: int,
+        esforcos: EsforcosFCO,
+        quantidade: int,
+        bitola_mm: float,
+        raio_eixo_barras_mm: float,
+    ) -> Tuple[Optional[EsforcosFCO], Dict[str, Any]]:
+        """Pilar-padrao acoplado a curva momento-curvatura da alternativa.
+
+        Retorna os esforcos com o momento total e o resumo do equilibrio;
+        os esforcos sao ``None`` quando nao ha equilibrio estavel ate a
+        curvatura ultima.
+        """
+
+        efeito = self._efeitos_segunda_ordem()[indice]
+        momento_primeira_ordem = efeito["momento_primeira_ordem_tf_m"]
+        angulo = math.radians(efeito["angulo_momento_graus"])
+        curva = self._obter_curva_momento_curvatura(
+            normal_n=esforcos.normal_compressao_sd_tf * TF_PARA_N,
+            angulo_momento_rad=angulo,
+            quantidade=quantidade,
+            bitola_mm=bitola_mm,
+            raio_eixo_barras_mm=raio_eixo_barras_mm,
+        )
+        equilibrio = (
+            curva.pilar_padrao(
+                efeito["alfa_b"] * momento_primeira_ordem * TF_M_PARA_N_MM,
+                self.esbeltez.comprimento_flambagem_m * 1_000.0,
+            )
+            if curva is not None
+            else None
+        )
+        resumo: Dict[str, Any] = {
+            "combinacao": indice,
+            "estavel": equilibrio is not None,
+            "momento_primeira_ordem_tf_m": momento_primeira_ordem,
+            "momento_total_tf_m": None,
+            "curvatura_1_m": None,
+            "momento_maximo_curva_tf_m": (
+                curva.momento_maximo / TF_M_PARA_N_MM
+                if curva is not None
+                else None
+            ),
+        }
+        if equilibrio is None:
+            return None, resumo
+        momento_total = max(
+            equilibrio[0] / TF_M_PARA_N_MM, momento_primeira_ordem
+        )
+        resumo["momento_total_tf_m"] = momento_total
+        resumo["curvatura_1_m"] = equilibrio[1] * 1_000.0
+        return (
+            replace(
+                esforcos,
+                momento_x_sd_tf_m=momento_total * math.cos(angulo),
+                momento_y_sd_tf_m=momento_total * math.sin(angulo),
+            ),
+            resumo,
+        )
+
+    def _obter_curva_momento_curvatura(
+        self,
+        normal_n: float,
+        angulo_momento_rad: float,
+        quantidade: int,
+        bitola_mm: float,
+        raio_eixo_barras_mm: float,
+    ) -> Optional[CurvaMomentoCurvaturaFCO]:
+        """Curva ``M(kappa)`` da alternativa, em cache; ``None`` sem equilibrio.
+
+        A curva usa o pico ``FATOR_PICO_CONCRETO_CURVA * fcd`` e fibras
+        nativas, qualquer que seja o motor da verificacao. Pela simetria das
+        barras, a direcao e reduzida ao meio setor a partir do eixo de
+        reflexao ``pi/2 - theta_0`` (em ``(m_x, m_y)`` o eixo de uma barra
+        aparece girado), e a mesma curva serve a todas as direcoes
+        equivalentes.
+        """
+
+        passo = 2.0 * math.pi / quantidade
+        relativo = (
+            angulo_momento_rad
+            - math.pi / 2.0
+            + math.radians(self.secao.angulo_inicial_barras_graus)
+        ) % passo
+        relativo = round(min(relativo, passo - relativo), 12)
+        chave_secao = (
+            "momento_curvatura",
+            ANEIS_CURVA_MOMENTO_CURVATURA,
+            self.secao.diametro_m,
+            raio_eixo_barras_mm,
+            int(quantidade),
+            float(bitola_mm),
+            astuple(self.materiais),
+        )
+
+        def construir() -> Optional[CurvaMomentoCurvaturaFCO]:
+            parametros = self._parametros_calculados()
+            parametros["fcd_diagrama_mpa"] = (
+                FATOR_PICO_CONCRETO_CURVA * parametros["fcd_base_mpa"]
+            )
+            secao = self._consultar_cache(
+                "secoes",
+                chave_secao,
+                lambda: SecaoFibrasCircularFCO(
+                    diametro_mm=self.secao.diametro_m * 1_000.0,
+                    raio_eixo_barras_mm=raio_eixo_barras_mm,
+                    quantidade_barras=quantidade,
+                    area_barra_mm2=math.pi * bitola_mm**2 / 4.0,
+                    angulo_inicial_rad=0.0,
+                    parametros=parametros,
+                    aneis=ANEIS_CURVA_MOMENTO_CURVATURA,
+                ),
+                custo=FIBRAS_NO_ANEL_CENTRAL * ANEIS_CURVA_MOMENTO_CURVATURA**2
+                + quantidade,
+            )
+            try:
+                with medir("curva_momento_curvatura"):
+                    return construir_curva_momento_curvatura(
+                        secao,
+                        normal_n=normal_n,
+                        angulo_momento_rad=math.pi / 2.0 + relativo,
+                        deformacao_ultima_aco=(
+                            self.materiais.deformacao_ultima_aco
+                        ),
+                    )
+            except FalhaEquilibrioFibras:
+                # N acima da compressao centrada resistente.
+                return None
+
+        return self._consultar_cache(
+            "curvas_momento_curvatura",
+            chave_secao[2:] + (normal_n, relativo),
+            construir,
+            custo=PONTOS_CURVA_MOMENTO_CURVATURA,
+        )
+
+    def _resumir_segunda_ordem(self) -> Optional[Dict[str, Any]]:
+        if self.esbeltez is None:
+            return None
+        return {
+            "metodo": self.esbeltez.metodo,
+            "comprimento_flambagem_m": self.esbeltez.comprimento_flambagem_m,
+            "raio_giracao_m": self.secao.diametro_m / 4.0,
+            "indice_esbeltez": self._indice_esbeltez(),
+            "alfa_b": self.esbeltez.alfa_b,
+            "fator_pico_concreto_curva": (
+                FATOR_PICO_CONCRETO_CURVA
+                if self.esbeltez.metodo == "momento_curvatura"
+                else None
+            ),
+            "combinacoes": self._efeitos_segunda_ordem(),
+        }
+
+    def _ordem_combinacoes_carga(
+        self, bitola_mm: float, raio_eixo_barras_mm: float
+    ) -> List[int]:
+        """Indices das combinacoes, da mais para a menos exigente.
+
+        A exigencia e a area de aco de ``estimar_area_aco_necessaria_mm2``.
+        Como a alternativa deixa de ser verificada na primeira combinacao que
+        nao atende, comecar pela provavel determinante poupa analises. A ordem
+        depende apenas dos dados, e a execucao por processos reproduz a serial.
+        """
+
+        lista_esforcos = self._lista_esforcos()
+        if len(lista_esforcos) == 1:
+            return [0]
+        chave = float(bitola_mm)
+        if chave not in self._ordem_combinacoes:
+            parametros = self._parametros_calculados()
+            areas = [
+                estimar_area_aco_necessaria_mm2(
+                    diametro_secao_mm=self.secao.diametro_m * 1_000.0,
+                    raio_eixo_barras_mm=raio_eixo_barras_mm,
+                    fcd_mpa=parametros["fcd_diagrama_mpa"],
+                    fyd_mpa=parametros["fyd_mpa"],
+                    modulo_elasticidade_aco_mpa=(
+                        parametros["modulo_elasticidade_aco_mpa"]
+                    ),
+                    deformacao_ultima_concreto=(
+                        parametros["deformacao_ultima_concreto"]
+                    ),
+                    normal_n=esforcos.normal_compressao_sd_tf * TF_PARA_N,
+                    momento_n_mm=math.hypot(
+                        esforcos.momento_x_sd_tf_m,
+                        esforcos.momento_y_sd_tf_m,
+                    )
+                    * TF_M_PARA_N_MM,
+                )
+                for esforcos in lista_esforcos
+            ]
+            self._ordem_combinacoes[chave] = sorted(
+                range(len(lista_esforcos)),
+                key=lambda indice: (-areas[indice], indice),
+            )
+        return self._ordem_combinacoes[chave]
+
+    def _obter_secao_concreto(
+        self,
+        deps: Dict[str, Any],
+        material_concreto: Any,
+        material_aco: Any,
+        quantidade: int,
+        bitola_mm: float,
+        raio_eixo_barras_mm: float,
+    ) -> Any:
+        """Retorna a ``ConcreteSection`` da alternativa, reaproveitando o cache.
+
+        A chave reune tudo o que define a secao: geometria, disposicao das
+        barras, discretizacao e parametros dos materiais.
+        """
+
+        if "abaco" in deps:
+            # O abaco dispensa a secao: ver ``_avaliar_por_abaco``.
+            return None
+        _, aneis, pontos_gauss = self._discretizacao()
+        if "ConcreteSection" not in deps:
+            if self.catalogo.motor == "analitico":
+                classe_secao = SecaoSegmentosCircularFCO
+                discretizacao = {"pontos_gauss": pontos_gauss}
+                custo = 2 * pontos_gauss + quantidade
+            else:
+                classe_secao = SecaoFibrasCircularFCO
+                discretizacao = {"aneis": aneis}
+                custo = FIBRAS_NO_ANEL_CENTRAL * aneis**2 + quantidade
+            def construir_nativa() -> Any:
+                with medir("construcao_secao"):
+                    return classe_secao(
+                        diametro_mm=self.secao.diametro_m * 1_000.0,
+                        raio_eixo_barras_mm=raio_eixo_barras_mm,
+                        quantidade_barras=quantidade,
+                        area_barra_mm2=math.pi * bitola_mm**2 / 4.0,
+                        angulo_inicial_rad=math.radians(
+                            self.secao.angulo_inicial_barras_graus
+                        ),
+                        parametros=self._parametros_calculados(),
+                        **discretizacao,
+                    )
+
+            return self._consultar_cache(
+                "secoes",
+                (
+                    deps["versao"],
+                    self.catalogo.motor,
+                    tuple(discretizacao.items()),
+                    self.secao.diametro_m,
+                    raio_eixo_barras_mm,
+                    self.secao.angulo_inicial_barras_graus,
+                    int(quantidade),
+                    float(bitola_mm),
+                    astuple(self.materiais),
+                ),
+                construir_nativa,
+                custo=custo,
+            )
+
+        chave_disco = (
+            deps["versao"],
+            self.secao.diametro_m,
+            self.catalogo.pontos_contorno_secao,
+            self._discretizacao()[0],
+            astuple(self.materiais),
+        )
+        chave = chave_disco + (
+            self.secao.cobrimento_nominal_mm,
+            self.secao.diametro_armadura_transversal_mm,
+            self.secao.angulo_inicial_barras_graus,
+            int(quantidade),
+            float(bitola_mm),
+        )
+
+        def construir() -> Any:
+            with medir("geometria"):
+                geometria = construir_geometria()
+            with medir("construcao_secao"):
+                return deps["ConcreteSection"](geometria)
+
+        def construir_geometria() -> Any:
+            disco = self._consultar_cache(
+                "geometrias_concreto",
+                chave_disco,
+                lambda: deps["circular_section"](
+                    d=self.secao.diametro_m * 1_000.0,
+                    n=self.catalogo.pontos_contorno_secao,
+                    material=material_concreto,
+                ).align_center(),
+                custo=self.catalogo.pontos_contorno_secao,
             )
-            if incluir_diagrama:
-                base["diagrama_mx_my_tf_m"] = [
-                    {
-                        "mx_rd_tf_m": mx / TF_M_PARA_N_MM,
-                        "my_rd_tf_m": my / TF_M_PARA_N_MM,
-                    }
-                    for mx, my in contorno_n_mm
+            barra = deps["circular_section_by_area"](
+                area=math.pi * bitola_mm**2 / 4.0,
+                n=PONTOS_CONTORNO_BARRA,
+                material=material_aco,
+            )
+            theta_0 = math.radians(self.secao.angulo_inicial_barras_graus)
+            passo = 2.0 * math.pi / quantidade
+            barras = deps["CompoundGeometry"](
+                [
+                    barra.shift_section(
+                        x_offset=raio_eixo_barras_mm
+                        * math.cos(theta_0 + indice * passo),
+                        y_offset=raio_eixo_barras_mm
+                        * math.sin(theta_0 + indice * passo),
+                    )
+                    for indice in range(quantidade)
                 ]
-            return base
-        except Exception as exc:
-            base.update(
-                {
-                    "status": "erro_analise",
-                    "erro_analise": str(exc),
-                }
             )
-            if incluir_diagrama:
-                base["diagrama_mx_my_tf_m"] = []
-            return base
+            # Equivale a add_bar_circular_array, mas abre todos os furos do
+            # disco em uma unica operacao booleana.
+            return (disco - barras) + barras
+
+        return self._consultar_cache(
+            "secoes",
+            chave,
+            construir,
+            custo=(
+                self.catalogo.pontos_contorno_secao
+                + 2 * quantidade * PONTOS_CONTORNO_BARRA
+            ),
+        )
+
+    def _obter_tabela_setor(
+        self,
+        secao_concreto: Any,
+        normal_n: float,
+        quantidade: int,
+        bitola_mm: float,
+        orientar_busca: bool,
+    ) -> TabelaSetorCapacidadeFCO:
+        """Tabela de capacidade por simetria da alternativa, em cache.
+
+        A mesma tabela orienta a busca direcional e fornece o contorno da
+        recomendacao. Com ``orientar_busca`` ela e mais fina, para que a
+        interpolacao ja caia dentro da tolerancia angular.
+        """
+
+        pontos_setor = pontos_tabela_setor(
+            quantidade,
+            self.catalogo.pontos_diagrama,
+            minimo=PONTOS_TABELA_SETOR_MINIMO if orientar_busca else 1,
+        )
+        return self._consultar_cache(
+            "tabelas_setor",
+            (
+                self.catalogo.motor,
+                astuple(self.secao),
+                astuple(self.materiais),
+                self.catalogo.pontos_contorno_secao,
+                self._discretizacao(),
+                int(quantidade),
+                float(bitola_mm),
+                normal_n,
+                pontos_setor,
+            ),
+            lambda: construir_tabela_setor_capacidade(
+                secao_concreto=secao_concreto,
+                normal_n=normal_n,
+                quantidade_barras=quantidade,
+                angulo_inicial_barras_rad=math.radians(
+                    self.secao.angulo_inicial_barras_graus
+                ),
+                pontos_setor=pontos_setor,
+            ),
+            custo=2 * quantidade * (pontos_setor + 1),
+        )
+
+    def _obter_tabela_setor_adaptativa(
+        self,
+        secao_concreto: Any,
+        normal_n: float,
+        quantidade: int,
+        bitola_mm: float,
+    ) -> TabelaSetorCapacidadeFCO:
+        """Tabela por erro de corda para o contorno da recomendacao, em cache."""
+
+        tolerancia_n_mm = (
+            self.catalogo.tolerancia_contorno_tf_m * TF_M_PARA_N_MM
+        )
+        analises_maximas = (
+            INTERVALOS_INICIAIS_CONTORNO_ADAPTATIVO
+            * 2**PROFUNDIDADE_MAXIMA_CONTORNO_ADAPTATIVO
+            + 1
+        )
+        return self._consultar_cache(
+            "tabelas_setor",
+            (
+                self.catalogo.motor,
+                astuple(self.secao),
+                astuple(self.materiais),
+                self.catalogo.pontos_contorno_secao,
+                self._discretizacao(),
+                int(quantidade),
+                float(bitola_mm),
+                normal_n,
+                ("adaptativa", tolerancia_n_mm),
+            ),
+            lambda: construir_tabela_setor_adaptativa(
+                secao_concreto=secao_concreto,
+                normal_n=normal_n,
+                quantidade_barras=quantidade,
+                angulo_inicial_barras_rad=math.radians(
+                    self.secao.angulo_inicial_barras_graus
+                ),
+                tolerancia_n_mm=tolerancia_n_mm,
+            ),
+            custo=2 * quantidade * analises_maximas,
+        )
+
+    def _consultar_cache(
+        self,
+        nome: str,
+        chave: Hashable,
+        fabrica: Callable[[], Any],
+        custo: float,
+    ) -> Any:
+        valor, acertou = CACHES_FCO[nome].obter_ou_criar(chave, fabrica, custo)
+        estatisticas = self._estatisticas_cache.setdefault(
+            nome, {"acertos": 0, "falhas": 0}
+        )
+        estatisticas["acertos" if acertou else "falhas"] += 1
+        return valor
+
+    def _resumir_caches(self) -> Dict[str, Any]:
+        return {
+            nome: {
+                **self._estatisticas_cache.get(
+                    nome, {"acertos": 0, "falhas": 0}
+                ),
+                **cache.estatisticas(),
+            }
+            for nome, cache in CACHES_FCO.items()
+        }
 
     def _resumir_por_bitola(
         self,
         opcoes: Sequence[Dict[str, Any]],
         combinacoes: Sequence[Tuple[int, float]],
         nao_avaliadas: Dict[float, int],
+        busca_por_bitola: Optional[Dict[float, Dict[str, Any]]] = None,
     ) -> List[Dict[str, Any]]:
+        busca_por_bitola = busca_por_bitola or {}
         bitolas = sorted({bitola for _, bitola in combinacoes})
         resumo: List[Dict[str, Any]] = []
         for bitola in bitolas:
@@ -749,8 +3702,13 @@ class DimensionadorFlexoCompressaoObliqua:
                 key=lambda item: item["quantidade_barras"],
                 default=None,
             )
+            busca = busca_por_bitola.get(bitola) or {}
             if menor:
                 situacao = "opcao_encontrada"
+            elif busca.get("bitola_podada_pelo_limite_inferior"):
+                situacao = "podada_pelo_limite_inferior_de_area"
+            elif busca.get("podadas_pela_incumbente"):
+                situacao = "podada_por_opcao_com_menor_area"
             elif any(
                 opcao["status"] == "erro_analise" for opcao in opcoes_bitola
             ):
@@ -774,15 +3732,135 @@ class DimensionadorFlexoCompressaoObliqua:
                     "quantidade_opcoes_nao_avaliadas_apos_atendimento": (
                         nao_avaliadas.get(bitola, 0)
                     ),
+                    "busca": busca or None,
                 }
             )
         return resumo
 
 
-def normalizar_angulo_rad(angulo: float) -> float:
-    """Normaliza um angulo para o intervalo [-pi, pi)."""
+_POOL_PROCESSOS_FCO: Optional[ProcessPoolExecutor] = None
+_TRAVA_POOL_FCO = threading.Lock()
+
+
+def obter_pool_processos_fco() -> ProcessPoolExecutor:
+    """Retorna o pool de processos compartilhado, criando-o sob demanda.
+
+    Os processos sao iniciados por ``spawn`` (seguro com as threads do
+    servidor) e importam o concreteproperties uma unica vez na partida.
+    """
+
+    global _POOL_PROCESSOS_FCO
+    with _TRAVA_POOL_FCO:
+        if _POOL_PROCESSOS_FCO is None:
+            _POOL_PROCESSOS_FCO = ProcessPoolExecutor(
+                max_workers=PROCESSOS_FCO_MAXIMO,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_inicializar_processo_fco,
+            )
+        return _POOL_PROCESSOS_FCO
+
+
+def encerrar_pool_processos_fco() -> None:
+    global _POOL_PROCESSOS_FCO
+    with _TRAVA_POOL_FCO:
+        if _POOL_PROCESSOS_FCO is not None:
+            _POOL_PROCESSOS_FCO.shutdown(wait=False, cancel_futures=True)
+            _POOL_PROCESSOS_FCO = None
+
+
+def _inicializar_processo_fco() -> None:
+    try:
+        import concreteproperties  # noqa: F401
+        import sectionproperties.pre.library  # noqa: F401
+    except ImportError:
+        # A falha e reportada pela propria tarefa, com a mensagem usual.
+        pass
+
+
+def _avaliar_cadeia_em_processo(
+    servico: "DimensionadorFlexoCompressaoObliqua",
+    bitola_mm: float,
+    quantidades: Sequence[int],
+    parar_ao_atender: bool,
+    incluir_diagrama: bool,
+) -> Tuple[
+    Dict[str, Any], Dict[str, Dict[str, int]], Optional[Dict[str, Any]]
+]:
+    servico._estatisticas_cache = {
+        nome: {"acertos": 0, "falhas": 0} for nome in CACHES_FCO
+    }
+
+    def avaliar() -> Dict[str, Any]:
+        deps = servico._carregar_dependencias()
+        material_concreto, material_aco = servico._criar_materiais(deps)
+        return servico._avaliar_cadeia(
+            deps=deps,
+            material_concreto=material_concreto,
+            material_aco=material_aco,
+            bitola_mm=bitola_mm,
+            quantidades=quantidades,
+            parar_ao_atender=parar_ao_atender,
+            incluir_diagrama=incluir_diagrama,
+        )
+
+    if not servico.catalogo.instrumentar:
+        return avaliar(), servico._estatisticas_cache, None
+    with instrumentar_fco() as instrumentacao:
+        resultado = avaliar()
+    return resultado, servico._estatisticas_cache, instrumentacao.exportar()
+
+
+def carregar_concreteproperties() -> Dict[str, Any]:
+    """Importa sob demanda os objetos usados do concreteproperties."""
+
+    try:
+        import concreteproperties.stress_strain_profile as ssp
+        from concreteproperties import Concrete, ConcreteSection, SteelBar
+        from concreteproperties.utils import AnalysisError
+        from sectionproperties.pre.geometry import CompoundGeometry
+        from sectionproperties.pre.library import (
+            circular_section,
+            circular_section_by_area,
+        )
+    except ImportError as exc:
+        raise DependenciaConcretePropertiesAusente(
+            "Pacote concreteproperties nao instalado. Execute: "
+            "pip install concreteproperties==0.8.0"
+        ) from exc
+
+    return {
+        "ssp": ssp,
+        "Concrete": Concrete,
+        "ConcreteSection": ConcreteSection,
+        "SteelBar": SteelBar,
+        "CompoundGeometry": CompoundGeometry,
+        "circular_section": circular_section,
+        "circular_section_by_area": circular_section_by_area,
+        "AnalysisError": AnalysisError,
+        "versao": versao_pacote("concreteproperties"),
+    }
+
 
-    return (angulo + math.pi) % (2.0 * math.pi) - math.pi
+def versao_pacote(nome: str) -> str:
+    try:
+        return importlib.metadata.version(nome)
+    except importlib.metadata.PackageNotFoundError:
+        return "desconhecida"
+
+
+def resumir_esforcos(esforcos: EsforcosFCO) -> Dict[str, float]:
+    return {
+        "normal_compressao_sd_tf": esforcos.normal_compressao_sd_tf,
+        "momento_x_sd_tf_m": esforcos.momento_x_sd_tf_m,
+        "momento_y_sd_tf_m": esforcos.momento_y_sd_tf_m,
+        "momento_resultante_sd_tf_m": math.hypot(
+            esforcos.momento_x_sd_tf_m,
+            esforcos.momento_y_sd_tf_m,
+        ),
+        "angulo_momento_graus": math.degrees(
+            math.atan2(esforcos.momento_y_sd_tf_m, esforcos.momento_x_sd_tf_m)
+        ),
+    }
 
 
 def avaliar_capacidade_direcional(
@@ -792,19 +3870,34 @@ def avaliar_capacidade_direcional(
     demanda_n_mm: Tuple[float, float],
     tolerancia_angular_rad: float,
     max_iteracoes: int,
+    tabela: Optional[TabelaSetorCapacidadeFCO] = None,
+    partida: Optional[Tuple[float, float]] = None,
+    apenas_decisao: bool = False,
+    simetria: Optional[Tuple[int, float]] = None,
 ) -> Dict[str, Any]:
     """Busca a capacidade com vetor de momento paralelo ao vetor solicitante.
 
     ``ultimate_bending_capacity`` recebe o angulo da linha neutra, que nao e,
     em geral, exatamente o angulo do momento resistente. A busca abaixo ajusta
     esse angulo por secante, evitando gerar o contorno biaxial completo para
-    cada alternativa comercial.
+    cada alternativa comercial. Com ``tabela``, o angulo inicial e o primeiro
+    passo vem da interpolacao e, em geral, basta a analise de confirmacao.
+    Sem tabela, ``partida = (theta, d(theta)/d(angulo do momento))`` pode
+    trazer o resultado de uma alternativa vizinha; a inclinacao final da
+    secante volta em ``inclinacao_angulo``.
+
+    Com ``apenas_decisao``, cada iteracao limita a capacidade radial (ver
+    ``limites_capacidade_radial``) e a busca para assim que a demanda fica
+    abaixo do limite inferior ou acima do superior. So utilizacoes proximas
+    de 1 refinam o angulo ate a tolerancia. ``simetria`` e ``(quantidade de
+    barras, angulo da primeira barra)`` e reforca o limite inferior.
     """
 
     demanda_modulo = math.hypot(*demanda_n_mm)
     if demanda_modulo <= TOLERANCIA:
         # A chamada ainda valida se a forca normal pertence ao dominio da secao.
-        secao_concreto.ultimate_bending_capacity(theta=0.0, n=normal_n)
+        with medir("ultimate_bending_capacity"):
+            secao_concreto.ultimate_bending_capacity(theta=0.0, n=normal_n)
         return {
             "convergiu": True,
             "atende": True,
@@ -816,21 +3909,38 @@ def avaliar_capacidade_direcional(
             "angulo_momento_resistente_graus": None,
             "erro_angular_graus": 0.0,
             "iteracoes_angulo": 1,
+            "inclinacao_angulo": None,
         }
 
     angulo_demanda = math.atan2(demanda_n_mm[1], demanda_n_mm[0])
-    theta = angulo_demanda
+    # Sem historico, a busca parte do espelho da demanda (ver
+    # ``INCLINACAO_PARTIDA_FRIA``).
+    theta = -angulo_demanda
+    inclinacao_inicial = INCLINACAO_PARTIDA_FRIA
+    if tabela is not None:
+        theta, inclinacao_inicial = tabela.estimar_theta(angulo_demanda)
+    elif partida is not None:
+        theta, inclinacao_inicial = partida
+    inclinacao = inclinacao_inicial
     theta_anterior: Optional[float] = None
     erro_anterior: Optional[float] = None
     melhor: Optional[Dict[str, Any]] = None
     convergiu = False
+    versor = (
+        demanda_n_mm[0] / demanda_modulo,
+        demanda_n_mm[1] / demanda_modulo,
+    )
+    avaliados: List[Tuple[float, float, float]] = []
+    limites: Optional[Tuple[float, float]] = None
 
     for indice in range(1, max_iteracoes + 1):
         theta_avaliado = normalizar_angulo_rad(theta)
-        resultado = secao_concreto.ultimate_bending_capacity(
-            theta=theta_avaliado,
-            n=normal_n,
-        )
+        with medir("ultimate_bending_capacity"):
+            resultado = secao_concreto.ultimate_bending_capacity(
+                theta=theta_avaliado,
+                n=normal_n,
+            )
+        contar("iteracoes_secante")
         mx = float(resultado.m_x)
         my = float(resultado.m_y)
         angulo_resistente = math.atan2(my, mx)
@@ -858,18 +3968,33 @@ def avaliar_capacidade_direcional(
             convergiu = True
             break
 
+        if apenas_decisao:
+            avaliados.append((theta_avaliado, mx, my))
+            limite_inferior, limite_superior = limites_capacidade_radial(
+                versor=versor,
+                theta=theta_avaliado,
+                momento_n_mm=(mx, my),
+                avaliados=avaliados,
+                simetria=simetria,
+            )
+            if (
+                demanda_modulo <= limite_inferior
+                or demanda_modulo > limite_superior
+            ):
+                limites = (limite_inferior, limite_superior)
+                break
+
         if (
             theta_anterior is not None
             and erro_anterior is not None
             and abs(erro - erro_anterior) > 1e-12
         ):
-            passo = -erro * (theta - theta_anterior) / (
-                erro - erro_anterior
-            )
+            inclinacao = (theta - theta_anterior) / (erro - erro_anterior)
+            passo = -erro * inclinacao
         else:
-            # Para uma secao circular, d(angulo_momento)/d(theta) fica
-            # proximo de 1. Este e um bom primeiro passo para a secante.
-            passo = -erro
+            # Para uma secao circular, d(theta)/d(angulo_momento) fica
+            # proximo de -1. Este e um bom primeiro passo para a secante.
+            passo = -erro * inclinacao_inicial
 
         limite_passo = math.pi / 3.0
         passo = max(-limite_passo, min(limite_passo, passo))
@@ -877,6 +4002,16 @@ def avaliar_capacidade_direcional(
         erro_anterior = erro
         theta += passo
 
+    if limites is not None:
+        return {
+            **resultado_decisao_antecipada(
+                demanda_n_mm=demanda_n_mm,
+                limites_n_mm=limites,
+                ultimo=candidato,
+            ),
+            "inclinacao_angulo": inclinacao,
+        }
+
     if melhor is None:
         return {
             "convergiu": False,
@@ -896,10 +4031,6 @@ def avaliar_capacidade_direcional(
             "iteracoes_angulo": melhor["iteracoes"],
         }
 
-    versor = (
-        demanda_n_mm[0] / demanda_modulo,
-        demanda_n_mm[1] / demanda_modulo,
-    )
     ponto_resistente = (
         versor[0] * momento_resistente,
         versor[1] * momento_resistente,
@@ -920,50 +4051,176 @@ def avaliar_capacidade_direcional(
         ),
         "erro_angular_graus": math.degrees(erro_final),
         "iteracoes_angulo": melhor["iteracoes"],
+        "inclinacao_angulo": inclinacao,
+    }
+
+
+def resultado_instabilidade() -> Dict[str, Any]:
+    """Combinacao reprovada sem equilibrio estavel de segunda ordem."""
+
+    return {
+        "convergiu": True,
+        "atende": False,
+        "utilizacao": None,
+        "fator_reserva": None,
+        "momento_resistente_n_mm": None,
+        "ponto_resistente_n_mm": None,
+        "angulo_linha_neutra_graus": None,
+        "angulo_momento_resistente_graus": None,
+        "erro_angular_graus": None,
+        "iteracoes_angulo": 0,
+        "origem": "instabilidade_segunda_ordem",
     }
 
 
-def gerar_diagrama_biaxial_por_simetria(
+def resultado_decisao_antecipada(
     *,
-    secao_concreto: Any,
-    normal_n: float,
-    quantidade_barras: int,
-    pontos_desejados: int,
-) -> List[Tuple[float, float]]:
-    """Gera o contorno usando a simetria da estaca e da camada circular.
+    demanda_n_mm: Tuple[float, float],
+    limites_n_mm: Tuple[float, float],
+    ultimo: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Monta a avaliacao direcional de uma decisao por limites.
 
-    Uma camada de ``n`` barras iguais e uniformemente espacadas repete sua
-    resposta a cada 2*pi/n. Calculam-se apenas os pontos de um setor e os demais
-    sao obtidos por rotacao vetorial.
+    A capacidade informada e o limite que decidiu: o inferior quando a opcao
+    atende, o superior quando nao atende. A utilizacao fica, portanto, do
+    lado conservador da decisao.
     """
 
-    repeticoes = max(3, int(quantidade_barras))
-    pontos_setor = max(2, math.ceil(pontos_desejados / repeticoes))
-    angulo_setor = 2.0 * math.pi / repeticoes
-    pontos: List[Tuple[float, float]] = []
+    demanda_modulo = math.hypot(*demanda_n_mm)
+    limite_inferior, limite_superior = limites_n_mm
+    atende = demanda_modulo <= limite_inferior
+    momento_resistente = limite_inferior if atende else limite_superior
+    versor = (
+        demanda_n_mm[0] / demanda_modulo,
+        demanda_n_mm[1] / demanda_modulo,
+    )
+    fator_reserva = momento_resistente / demanda_modulo
+    return {
+        "convergiu": True,
+        "atende": atende,
+        "utilizacao": 1.0 / fator_reserva,
+        "fator_reserva": fator_reserva,
+        "momento_resistente_n_mm": momento_resistente,
+        "ponto_resistente_n_mm": (
+            versor[0] * momento_resistente,
+            versor[1] * momento_resistente,
+        ),
+        "angulo_linha_neutra_graus": math.degrees(ultimo["theta"]),
+        "angulo_momento_resistente_graus": math.degrees(
+            ultimo["angulo_resistente"]
+        ),
+        "erro_angular_graus": math.degrees(abs(ultimo["erro"])),
+        "iteracoes_angulo": ultimo["iteracoes"],
+        "decisao_antecipada": True,
+        "limites_momento_resistente_n_mm": (
+            limite_inferior,
+            limite_superior,
+        ),
+    }
+
 
-    for indice in range(pontos_setor):
-        theta = indice * angulo_setor / pontos_setor
-        resultado = secao_concreto.ultimate_bending_capacity(
-            theta=theta,
-            n=normal_n,
+def limites_capacidade_radial(
+    *,
+    versor: Tuple[float, float],
+    theta: float,
+    momento_n_mm: Tuple[float, float],
+    avaliados: Sequence[Tuple[float, float, float]],
+    simetria: Optional[Tuple[int, float]] = None,
+) -> Tuple[float, float]:
+    """Limita a capacidade radial na direcao ``versor`` sem convergir o angulo.
+
+    O limite superior usa a reta de apoio do contorno no ponto avaliado: pela
+    normalidade, a normal ao contorno em ``theta`` e ``(cos theta, -sin
+    theta)``. O inferior e a intersecao do raio com o poligono estrelado dos
+    pontos ja avaliados (e das imagens por simetria), contido no contorno
+    convexo. Os dois limites recebem a folga ``FOLGA_LIMITES_CAPACIDADE``,
+    pois a normalidade do dominio discreto nao e exata.
+    """
+
+    normal = (math.cos(theta), -math.sin(theta))
+    alinhamento = versor[0] * normal[0] + versor[1] * normal[1]
+    apoio = momento_n_mm[0] * normal[0] + momento_n_mm[1] * normal[1]
+    limite_superior = math.inf
+    if alinhamento > TOLERANCIA and apoio > 0:
+        limite_superior = (
+            apoio / alinhamento * (1.0 + FOLGA_LIMITES_CAPACIDADE)
         )
-        mx_base = float(resultado.m_x)
-        my_base = float(resultado.m_y)
 
-        for repeticao in range(repeticoes):
-            giro = repeticao * angulo_setor
-            cos_giro = math.cos(giro)
-            sin_giro = math.sin(giro)
-            pontos.append(
-                (
-                    mx_base * cos_giro - my_base * sin_giro,
-                    mx_base * sin_giro + my_base * cos_giro,
-                )
+    pontos: List[Tuple[float, float, float]] = []
+    for theta_avaliado, mx, my in avaliados:
+        if simetria is None:
+            pontos.append((math.atan2(my, mx), mx, my))
+            continue
+        for angulo, _, mx_imagem, my_imagem in imagens_simetricas_momento(
+            theta=theta_avaliado,
+            momento_n_mm=(mx, my),
+            quantidade_barras=simetria[0],
+            angulo_inicial_barras_rad=simetria[1],
+        ):
+            pontos.append((angulo, mx_imagem, my_imagem))
+    pontos.sort()
+
+    limite_inferior = 0.0
+    if len(pontos) >= 3:
+        intersecao = intersecao_raio_poligono(
+            demanda=versor,
+            poligono=[(mx, my) for _, mx, my in pontos],
+        )
+        if intersecao is not None:
+            limite_inferior = intersecao["fator_escala"] * (
+                1.0 - FOLGA_LIMITES_CAPACIDADE
             )
+    return limite_inferior, limite_superior
+
+
+def construir_superficie_interacao(
+    *,
+    secao_concreto: Any,
+    quantidade_barras: int,
+    angulo_inicial_barras_rad: float,
+    normal_maxima_n: float,
+    niveis: int,
+    direcoes: int,
+    pontos_setor: int,
+    falhas_equilibrio: Tuple[Type[BaseException], ...] = (
+        FalhaEquilibrioFibras,
+    ),
+) -> SuperficieInteracaoFCO:
+    """Empilha os contornos de niveis de N igualmente espacados.
+
+    Cada contorno vem de ``construir_tabela_setor_capacidade`` e e
+    reamostrado por intersecao de raios em ``direcoes`` angulos fixos. A
+    grade termina no primeiro nivel sem equilibrio (uma das
+    ``falhas_equilibrio`` do motor) ou com contorno que nao envolve a origem,
+    proximo da compressao centrada; outras excecoes se propagam.
+    """
+
+    angulos = -math.pi + 2.0 * math.pi * np.arange(direcoes) / direcoes
+    normais: List[float] = []
+    raios: List[List[float]] = []
+    for normal_n in np.linspace(0.0, normal_maxima_n, niveis):
+        try:
+            contorno = construir_tabela_setor_capacidade(
+                secao_concreto=secao_concreto,
+                normal_n=float(normal_n),
+                quantidade_barras=quantidade_barras,
+                angulo_inicial_barras_rad=angulo_inicial_barras_rad,
+                pontos_setor=pontos_setor,
+            ).contorno()
+        except falhas_equilibrio:
+            break
+        linha = intersecoes_raios_poligonos(
+            np.column_stack([np.cos(angulos), np.sin(angulos)]), contorno
+        )["fator_escala"]
+        if np.isnan(linha).any():
+            break
+        normais.append(float(normal_n))
+        raios.append(linha.tolist())
 
-    pontos.sort(key=lambda ponto: math.atan2(ponto[1], ponto[0]))
-    return fechar_poligono(pontos)
+    return SuperficieInteracaoFCO(
+        normais_n=np.asarray(normais, dtype=np.float32),
+        raios_n_mm=np.asarray(raios, dtype=np.float32).reshape(-1, direcoes),
+    )
 
 
 def avaliar_por_diagrama_completo(
@@ -972,43 +4229,47 @@ def avaliar_por_diagrama_completo(
     normal_n: float,
     demanda_n_mm: Tuple[float, float],
     pontos_diagrama: int,
+    diagrama: Any = None,
 ) -> Dict[str, Any]:
-    """Mantem o algoritmo original como modo de auditoria mais demorado."""
+    """Mantem o algoritmo original como modo de auditoria mais demorado.
+
+    ``diagrama`` permite reaproveitar o resultado de
+    ``biaxial_bending_diagram`` ja calculado para a mesma ``normal_n``. A
+    pertinencia da demanda sai do teste par-impar sobre o mesmo contorno do
+    raio (``intersecoes_raios_poligonos``), igual para todos os motores.
+    """
 
-    resultado = secao_concreto.biaxial_bending_diagram(
-        n=normal_n,
-        n_points=pontos_diagrama,
-        progress_bar=False,
+    resultado = (
+        diagrama
+        if diagrama is not None
+        else _diagrama_biaxial_medido(
+            secao_concreto, normal_n, pontos_diagrama
+        )
     )
     mx_n_mm, my_n_mm = resultado.get_results_lists()
     contorno_n_mm = fechar_poligono(
         [(float(mx), float(my)) for mx, my in zip(mx_n_mm, my_n_mm)]
     )
-    intersecao = intersecao_raio_poligono(
-        demanda=demanda_n_mm,
-        poligono=contorno_n_mm,
-    )
-    atende = bool(
-        resultado.point_in_diagram(
-            m_x=demanda_n_mm[0],
-            m_y=demanda_n_mm[1],
-        )
-    )
+    # Intersecao do raio e pertinencia (par-impar) na mesma passada.
+    intersecao = intersecoes_raios_poligonos([demanda_n_mm], contorno_n_mm)
+    atende = bool(intersecao["dentro"][0])
+    fator_reserva = float(intersecao["fator_escala"][0])
 
     if math.hypot(*demanda_n_mm) <= TOLERANCIA:
         utilizacao = 0.0
         fator_reserva = None
         momento_resistente = None
         ponto_resistente = None
-    elif intersecao is None:
+    elif math.isnan(fator_reserva):
         utilizacao = None
         fator_reserva = None
         momento_resistente = None
         ponto_resistente = None
     else:
-        fator_reserva = intersecao["fator_escala"]
-        utilizacao = 1.0 / fator_reserva if fator_reserva > 0 else None
-        ponto_resistente = intersecao["ponto"]
+        utilizacao = 1.0 / fator_reserva
+        ponto_resistente = tuple(
+            float(valor) for valor in intersecao["pontos"][0]
+        )
         momento_resistente = math.hypot(*ponto_resistente)
 
     return {
@@ -1026,6 +4287,221 @@ def avaliar_por_diagrama_completo(
     }
 
 
+def _diagrama_biaxial_medido(
+    secao_concreto: Any, normal_n: float, pontos_diagrama: int
+) -> Any:
+    with medir("biaxial_bending_diagram"):
+        return secao_concreto.biaxial_bending_diagram(
+            n=normal_n,
+            n_points=pontos_diagrama,
+            progress_bar=False,
+        )
+
+
+def buscar_primeiro_aprovado_galopante(
+    atende: Callable[[int], Optional[bool]], quantidade: int
+) -> Optional[int]:
+    """Menor indice em ``range(quantidade)`` com ``atende`` verdadeiro.
+
+    Supoe predicado monotono. Testam-se os indices 0, 1, 3, 7... ate o primeiro
+    aprovado e a fronteira e refinada por bissecao no intervalo encontrado.
+    ``atende`` igual a ``None`` (falha de analise) e desconhecido: o intervalo
+    entre o ultimo reprovado e o primeiro aprovado conhecidos e entao varrido
+    em ordem, como na busca linear.
+    """
+
+    def varrer(inicio: int, fim: int) -> Optional[int]:
+        return next(
+            (indice for indice in range(inicio, fim) if atende(indice)), None
+        )
+
+    # Invariante: ``reprovado`` nao atende e ``aprovado`` atende.
+    reprovado = -1
+    aprovado: Optional[int] = None
+    passo = 1
+    while quantidade:
+        indice = min(reprovado + passo, quantidade - 1)
+        estado = atende(indice)
+        if estado:
+            aprovado = indice
+            break
+        if estado is False:
+            reprovado = indice
+        if indice == quantidade - 1:
+            return varrer(reprovado + 1, quantidade)
+        passo *= 2
+    if aprovado is None:
+        return None
+    while aprovado - reprovado > 1:
+        meio = (reprovado + aprovado) // 2
+        estado = atende(meio)
+        if estado is None:
+            primeiro = varrer(reprovado + 1, aprovado)
+            return aprovado if primeiro is None else primeiro
+        if estado:
+            aprovado = meio
+        else:
+            reprovado = meio
+    return aprovado
+
+
+def estimar_area_aco_necessaria_mm2(
+    *,
+    diametro_secao_mm: float,
+    raio_eixo_barras_mm: float,
+    fcd_mpa: float,
+    fyd_mpa: float,
+    modulo_elasticidade_aco_mpa: float,
+    deformacao_ultima_concreto: float,
+    normal_n: float,
+    momento_n_mm: float,
+) -> float:
+    """Estimativa fechada da area de aco para (N, |M|) em secao circular.
+
+    O concreto e representado pelo bloco retangular de profundidade 0,8x com
+    tensao ``fcd`` sobre o segmento circular. A armadura e um anel continuo
+    elastoplastico, com ``deformacao_ultima_concreto`` na fibra mais
+    comprimida. As duas parcelas tem expressao fechada em funcao da
+    profundidade x da linha neutra. A estimativa so escolhe o ponto de
+    partida da busca e nao substitui a analise da secao.
+    """
+
+    raio = diametro_secao_mm / 2.0
+    raio_eixo = max(raio_eixo_barras_mm, TOLERANCIA)
+
+    def esforcos(area_aco: float, profundidade: float) -> Tuple[float, float]:
+        altura_bloco = min(FATOR_BLOCO_RETANGULAR * profundidade, 2.0 * raio)
+        beta = math.acos(1.0 - altura_bloco / raio)
+        forca_concreto = fcd_mpa * raio**2 * (
+            beta - math.sin(beta) * math.cos(beta)
+        )
+        momento_concreto = fcd_mpa * 2.0 / 3.0 * raio**3 * math.sin(beta) ** 3
+
+        # Tensao no anel: clamp(c + k cos(phi), -fyd, fyd), com phi medido a
+        # partir da direcao da fibra mais comprimida.
+        curvatura_e = (
+            modulo_elasticidade_aco_mpa * deformacao_ultima_concreto
+            / profundidade
+        )
+        c = curvatura_e * (profundidade - raio)
+        k = curvatura_e * raio_eixo
+        phi_1 = math.acos(max(-1.0, min(1.0, (fyd_mpa - c) / k)))
+        phi_2 = math.acos(max(-1.0, min(1.0, (-fyd_mpa - c) / k)))
+        sin_1, sin_2 = math.sin(phi_1), math.sin(phi_2)
+        forca = (
+            fyd_mpa * phi_1
+            + c * (phi_2 - phi_1)
+            + k * (sin_2 - sin_1)
+            - fyd_mpa * (math.pi - phi_2)
+        )
+        momento = raio_eixo * (
+            fyd_mpa * sin_1
+            + c * (sin_2 - sin_1)
+            + k
+            * (
+                (phi_2 - phi_1) / 2.0
+                + (math.sin(2.0 * phi_2) - math.sin(2.0 * phi_1)) / 4.0
+            )
+            + fyd_mpa * sin_2
+        )
+        return (
+            forca_concreto + area_aco / math.pi * forca,
+            momento_concreto + area_aco / math.pi * momento,
+        )
+
+    def momento_resistente(area_aco: float) -> float:
+        maximo = math.pi * raio**2 * fcd_mpa + area_aco * fyd_mpa
+        if normal_n >= maximo:
+            return -math.inf
+        inferior, superior = 1e-9 * raio, 2.0 * raio
+        while esforcos(area_aco, superior)[0] < normal_n:
+            superior *= 2.0
+            if superior > 1e6 * raio:
+                return -math.inf
+        for _ in range(60):
+            meio = 0.5 * (inferior + superior)
+            if esforcos(area_aco, meio)[0] < normal_n:
+                inferior = meio
+            else:
+                superior = meio
+        return esforcos(area_aco, 0.5 * (inferior + superior))[1]
+
+    if momento_resistente(0.0) >= momento_n_mm:
+        return 0.0
+    area_maxima = math.pi * raio**2
+    if momento_resistente(area_maxima) < momento_n_mm:
+        return math.inf
+    inferior, superior = 0.0, area_maxima
+    for _ in range(50):
+        meio = 0.5 * (inferior + superior)
+        if momento_resistente(meio) >= momento_n_mm:
+            superior = meio
+        else:
+            inferior = meio
+    return superior
+
+
+def area_aco_minima_necessaria_mm2(
+    *,
+    diametro_secao_mm: float,
+    raio_eixo_barras_mm: float,
+    fcd_mpa: float,
+    fyd_mpa: float,
+    normal_n: float,
+    momento_n_mm: float,
+) -> float:
+    """Limite inferior da area de aco necessaria para resistir a (N, M).
+
+    Vale para qualquer estado com compressao no concreto limitada a ``fcd`` e
+    tensao no aco limitada a ``fyd``: o concreto contribui no maximo com o
+    momento do segmento circular comprimido que equilibra sua parcela de N, e
+    o aco com ``As * fyd * raio_eixo``. Retorna ``inf`` se nem 100 % de taxa
+    geometrica satisfaz a condicao.
+    """
+
+    raio = diametro_secao_mm / 2.0
+    area_bruta = math.pi * raio**2
+
+    def momento_segmento(forca_concreto: float) -> float:
+        # Segmento de meio-angulo beta: area = R^2 (beta - sen beta cos beta)
+        # e momento estatico em relacao ao centro = 2/3 R^3 sen^3 beta.
+        area = forca_concreto / fcd_mpa
+        inferior, superior = 0.0, math.pi
+        for _ in range(60):
+            beta = 0.5 * (inferior + superior)
+            if raio**2 * (beta - math.sin(beta) * math.cos(beta)) < area:
+                inferior = beta
+            else:
+                superior = beta
+        beta = 0.5 * (inferior + superior)
+        return fcd_mpa * 2.0 / 3.0 * raio**3 * math.sin(beta) ** 3
+
+    def momento_maximo(area_aco: float) -> float:
+        forca_aco = area_aco * fyd_mpa
+        minimo = max(0.0, normal_n - forca_aco)
+        maximo = min(area_bruta * fcd_mpa, normal_n + forca_aco)
+        if minimo > maximo:
+            return -math.inf
+        forca_concreto = min(max(area_bruta * fcd_mpa / 2.0, minimo), maximo)
+        return (
+            momento_segmento(forca_concreto)
+            + forca_aco * max(raio_eixo_barras_mm, 0.0)
+        )
+
+    if momento_maximo(0.0) >= momento_n_mm:
+        return 0.0
+    if momento_maximo(area_bruta) < momento_n_mm:
+        return math.inf
+    inferior, superior = 0.0, area_bruta
+    for _ in range(60):
+        meio = 0.5 * (inferior + superior)
+        if momento_maximo(meio) >= momento_n_mm:
+            superior = meio
+        else:
+            inferior = meio
+    return inferior
+
+
 def avaliar_geometria_armadura_circular(
     *,
     diametro_secao_mm: float,
@@ -1066,63 +4542,16 @@ def avaliar_geometria_armadura_circular(
     }
 
 
-def intersecao_raio_poligono(
-    *,
-    demanda: Tuple[float, float],
-    poligono: Sequence[Tuple[float, float]],
-) -> Optional[Dict[str, Any]]:
-    """Intersecta o raio ``t * demanda`` com o contorno resistente.
-
-    Retorna a primeira interseção positiva. Para um contorno que contém a
-    origem, ``t >= 1`` significa que a demanda está no interior do diagrama.
-    """
-
-    dx, dy = demanda
-    if math.hypot(dx, dy) <= TOLERANCIA:
-        return None
-    pontos = fechar_poligono(poligono)
-    if len(pontos) < 4:
-        return None
-
-    candidatos: List[Tuple[float, float, Tuple[float, float]]] = []
-    for p, q in zip(pontos, pontos[1:]):
-        sx = q[0] - p[0]
-        sy = q[1] - p[1]
-        denominador = produto_vetorial_2d((dx, dy), (sx, sy))
-        if abs(denominador) <= TOLERANCIA:
-            continue
-        t = produto_vetorial_2d(p, (sx, sy)) / denominador
-        u = produto_vetorial_2d(p, (dx, dy)) / denominador
-        if t >= -TOLERANCIA and -TOLERANCIA <= u <= 1.0 + TOLERANCIA:
-            t = max(0.0, t)
-            candidatos.append((t, u, (t * dx, t * dy)))
-
-    positivos = [item for item in candidatos if item[0] > TOLERANCIA]
-    if not positivos:
-        return None
-    t, u, ponto = min(positivos, key=lambda item: item[0])
-    return {
-        "fator_escala": t,
-        "parametro_segmento": u,
-        "ponto": ponto,
-    }
-
-
-def fechar_poligono(
-    pontos: Iterable[Tuple[float, float]],
-) -> List[Tuple[float, float]]:
-    saida = [(float(x), float(y)) for x, y in pontos]
-    if not saida:
-        return saida
-    if saida[0] != saida[-1]:
-        saida.append(saida[0])
-    return saida
-
-
-def produto_vetorial_2d(
-    a: Tuple[float, float], b: Tuple[float, float]
-) -> float:
-    return a[0] * b[1] - a[1] * b[0]
+def contorno_em_tf_m(
+    contorno_n_mm: Iterable[Tuple[float, float]],
+) -> List[Dict[str, float]]:
+    return [
+        {
+            "mx_rd_tf_m": mx / TF_M_PARA_N_MM,
+            "my_rd_tf_m": my / TF_M_PARA_N_MM,
+        }
+        for mx, my in contorno_n_mm
+    ]
 
 
 def formatar_numero(valor: float) -> str:
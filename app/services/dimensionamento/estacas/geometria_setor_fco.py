@@ -0,0 +1,497 @@
+"""Tabela de capacidade por simetria e interseções raio-contorno do FCO.
+
+Uma camada de ``n`` barras iguais e uniformemente espaçadas só exige a
+análise de meio setor (``pi / n``) para cobrir a volta completa do contorno
+Mx-My; ``TabelaSetorCapacidadeFCO`` guarda o resultado expandido e
+interpola dele o ângulo da linha neutra para cada direção de momento. As
+funções de raio e contorno servem à verificação pelo diagrama, ao ábaco e à
+compactação do contorno, que importam daqui sem passar pelo serviço.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.dimensionamento.estacas.instrumentacao_fco import medir
+
+
+TOLERANCIA = 1e-9
+# Contorno adaptativo: intervalos iniciais por meio setor e quantas vezes
+# cada um pode ser dividido ao meio.
+INTERVALOS_INICIAIS_CONTORNO_ADAPTATIVO = 2
+PROFUNDIDADE_MAXIMA_CONTORNO_ADAPTATIVO = 6
+
+
+@dataclass(frozen=True)
+class TabelaSetorCapacidadeFCO:
+    """Momentos resistentes na volta completa para uma força normal.
+
+    Só os pontos de meio setor (pi/n) são calculados; os demais vêm da
+    reflexão e da rotação da camada de barras. Os pontos ficam ordenados pelo
+    ângulo do momento resistente. ``erro_corda_n_mm`` só existe na tabela
+    adaptativa: é o maior afastamento entre o contorno e a corda medido
+    durante a amostragem.
+    """
+
+    normal_n: float
+    thetas: Tuple[float, ...]
+    angulos_momento: Tuple[float, ...]
+    momentos_n_mm: Tuple[Tuple[float, float], ...]
+    analises: int
+    erro_corda_n_mm: Optional[float] = None
+
+    def contorno(self) -> List[Tuple[float, float]]:
+        return fechar_poligono(list(self.momentos_n_mm))
+
+    def estimar_theta(self, angulo_momento: float) -> Tuple[float, float]:
+        """Interpola ``(theta, d theta / d angulo_momento)`` para a direcao."""
+
+        quantidade = len(self.angulos_momento)
+        indice = bisect.bisect_right(self.angulos_momento, angulo_momento)
+        anterior = (indice - 1) % quantidade
+        seguinte = indice % quantidade
+        abertura = (
+            self.angulos_momento[seguinte] - self.angulos_momento[anterior]
+        ) % (2.0 * math.pi)
+        if abertura <= TOLERANCIA:
+            return self.thetas[anterior], 1.0
+        inclinacao = (
+            normalizar_angulo_rad(
+                self.thetas[seguinte] - self.thetas[anterior]
+            )
+            / abertura
+        )
+        avanco = (angulo_momento - self.angulos_momento[anterior]) % (
+            2.0 * math.pi
+        )
+        return (
+            normalizar_angulo_rad(
+                self.thetas[anterior] + inclinacao * avanco
+            ),
+            inclinacao,
+        )
+
+
+def normalizar_angulo_rad(angulo: float) -> float:
+    """Normaliza um angulo para o intervalo [-pi, pi)."""
+
+    return (angulo + math.pi) % (2.0 * math.pi) - math.pi
+
+
+def imagens_simetricas_momento(
+    *,
+    theta: float,
+    momento_n_mm: Tuple[float, float],
+    quantidade_barras: int,
+    angulo_inicial_barras_rad: float,
+) -> List[Tuple[float, float, float, float]]:
+    """Leva um ponto do contorno a todas as posicoes equivalentes da camada.
+
+    Retorna ``(angulo_momento, theta, m_x, m_y)`` para as ``n`` rotacoes do
+    ponto e da sua reflexao no eixo da primeira barra.
+    """
+
+    repeticoes = max(1, int(quantidade_barras))
+    angulo_setor = 2.0 * math.pi / repeticoes
+    alfa = angulo_inicial_barras_rad
+    mx_base, my_base = momento_n_mm
+    cos_2alfa = math.cos(2.0 * alfa)
+    sin_2alfa = math.sin(2.0 * alfa)
+    simetricos = (
+        (theta, mx_base, my_base),
+        (
+            2.0 * alfa - theta - math.pi,
+            sin_2alfa * my_base - cos_2alfa * mx_base,
+            cos_2alfa * my_base + sin_2alfa * mx_base,
+        ),
+    )
+    imagens: List[Tuple[float, float, float, float]] = []
+    for repeticao in range(repeticoes):
+        giro = repeticao * angulo_setor
+        cos_giro = math.cos(giro)
+        sin_giro = math.sin(giro)
+        for theta_simetrico, mx, my in simetricos:
+            # Girar (m_y, m_x) de +giro equivale a girar (m_x, m_y) de -giro.
+            mx_girado = mx * cos_giro + my * sin_giro
+            my_girado = -mx * sin_giro + my * cos_giro
+            imagens.append(
+                (
+                    math.atan2(my_girado, mx_girado),
+                    normalizar_angulo_rad(theta_simetrico + giro),
+                    mx_girado,
+                    my_girado,
+                )
+            )
+    return imagens
+
+
+def construir_tabela_setor_capacidade(
+    *,
+    secao_concreto: Any,
+    normal_n: float,
+    quantidade_barras: int,
+    angulo_inicial_barras_rad: float,
+    pontos_setor: int,
+) -> TabelaSetorCapacidadeFCO:
+    """Calcula a capacidade em meio setor e a expande para a volta completa.
+
+    Uma camada de ``n`` barras iguais e uniformemente espacadas e simetrica
+    por rotacao de 2*pi/n e por reflexao no eixo de cada barra. A reflexao no
+    eixo de angulo ``alfa`` leva ``theta`` em ``2*alfa - theta - pi``, que
+    tem ponto fixo em ``alfa - pi/2``. Basta entao calcular ``theta`` entre
+    esse ponto e o da reflexao seguinte, em ``alfa - pi/2 + pi/n``.
+
+    Pela convencao ``m_x = soma(F*y)`` e ``m_y = soma(F*x)``, o vetor
+    ``(m_y, m_x)`` acompanha a geometria: gira e reflete com a armadura.
+    """
+
+    repeticoes = max(1, int(quantidade_barras))
+    angulo_setor = 2.0 * math.pi / repeticoes
+    theta_inicial = angulo_inicial_barras_rad - math.pi / 2.0
+
+    amostras: List[Tuple[float, float, float]] = []
+    for indice in range(pontos_setor + 1):
+        theta = normalizar_angulo_rad(
+            theta_inicial + indice * angulo_setor / (2.0 * pontos_setor)
+        )
+        with medir("ultimate_bending_capacity"):
+            resultado = secao_concreto.ultimate_bending_capacity(
+                theta=theta,
+                n=normal_n,
+            )
+        amostras.append((theta, float(resultado.m_x), float(resultado.m_y)))
+
+    return _expandir_meio_setor(
+        normal_n=normal_n,
+        amostras=amostras,
+        quantidade_barras=repeticoes,
+        angulo_inicial_barras_rad=angulo_inicial_barras_rad,
+    )
+
+
+def construir_tabela_setor_adaptativa(
+    *,
+    secao_concreto: Any,
+    normal_n: float,
+    quantidade_barras: int,
+    angulo_inicial_barras_rad: float,
+    tolerancia_n_mm: float,
+    intervalos_iniciais: int = INTERVALOS_INICIAIS_CONTORNO_ADAPTATIVO,
+    profundidade_maxima: int = PROFUNDIDADE_MAXIMA_CONTORNO_ADAPTATIVO,
+) -> TabelaSetorCapacidadeFCO:
+    """Tabela de setor com pontos so onde o contorno se afasta da corda.
+
+    O meio setor comeca com ``intervalos_iniciais`` intervalos iguais em
+    ``theta``. Cada intervalo recebe a analise do ``theta`` medio; se esse
+    ponto fica a mais de ``tolerancia_n_mm`` da corda entre os extremos, as
+    duas metades sao examinadas da mesma forma, ate ``profundidade_maxima``
+    divisoes. O ponto medio entra na tabela de qualquer modo, de modo que o
+    maior afastamento medido, em ``erro_corda_n_mm``, e um limite
+    conservador do erro do contorno final. Os trechos retos gastam duas
+    analises por intervalo inicial e os cantos recebem o resto.
+    """
+
+    repeticoes = max(1, int(quantidade_barras))
+    meio_setor = math.pi / repeticoes
+    theta_inicial = angulo_inicial_barras_rad - math.pi / 2.0
+
+    def amostrar(theta: float) -> Tuple[float, float, float]:
+        with medir("ultimate_bending_capacity"):
+            resultado = secao_concreto.ultimate_bending_capacity(
+                theta=normalizar_angulo_rad(theta),
+                n=normal_n,
+            )
+        return theta, float(resultado.m_x), float(resultado.m_y)
+
+    extremos = [
+        amostrar(theta_inicial + indice * meio_setor / intervalos_iniciais)
+        for indice in range(intervalos_iniciais + 1)
+    ]
+    amostras = [extremos[0]]
+    erro_corda = 0.0
+    # Pilha em ordem inversa: as amostras saem ordenadas por theta.
+    pendentes = [
+        (extremos[indice], extremos[indice + 1], 0)
+        for indice in reversed(range(intervalos_iniciais))
+    ]
+    while pendentes:
+        inicio, fim, profundidade = pendentes.pop()
+        meio = amostrar(0.5 * (inicio[0] + fim[0]))
+        afastamento = distancia_ponto_segmento(
+            meio[1:], inicio[1:], fim[1:]
+        )
+        if (
+            afastamento > tolerancia_n_mm
+            and profundidade < profundidade_maxima
+        ):
+            pendentes.append((meio, fim, profundidade + 1))
+            pendentes.append((inicio, meio, profundidade + 1))
+            continue
+        erro_corda = max(erro_corda, afastamento)
+        amostras.extend((meio, fim))
+
+    tabela = _expandir_meio_setor(
+        normal_n=normal_n,
+        amostras=[
+            (normalizar_angulo_rad(theta), mx, my)
+            for theta, mx, my in amostras
+        ],
+        quantidade_barras=repeticoes,
+        angulo_inicial_barras_rad=angulo_inicial_barras_rad,
+    )
+    return replace(tabela, erro_corda_n_mm=erro_corda)
+
+
+def _expandir_meio_setor(
+    *,
+    normal_n: float,
+    amostras: Sequence[Tuple[float, float, float]],
+    quantidade_barras: int,
+    angulo_inicial_barras_rad: float,
+) -> TabelaSetorCapacidadeFCO:
+    """Leva as amostras ``(theta, m_x, m_y)`` do meio setor a volta completa."""
+
+    repeticoes = max(1, int(quantidade_barras))
+    alfa = angulo_inicial_barras_rad
+    pontos: List[Tuple[float, float, float, float]] = []
+    for theta, mx_base, my_base in amostras:
+        pontos.extend(
+            imagens_simetricas_momento(
+                theta=theta,
+                momento_n_mm=(mx_base, my_base),
+                quantidade_barras=repeticoes,
+                angulo_inicial_barras_rad=alfa,
+            )
+        )
+
+    pontos.sort()
+    # Os extremos do meio setor sao pontos fixos de reflexao e aparecem
+    # duplicados.
+    unicos = [pontos[0]]
+    for ponto in pontos[1:]:
+        if ponto[0] - unicos[-1][0] > TOLERANCIA:
+            unicos.append(ponto)
+    if len(unicos) > 1 and (
+        unicos[0][0] + 2.0 * math.pi - unicos[-1][0] <= TOLERANCIA
+    ):
+        unicos.pop()
+
+    return TabelaSetorCapacidadeFCO(
+        normal_n=normal_n,
+        thetas=tuple(ponto[1] for ponto in unicos),
+        angulos_momento=tuple(ponto[0] for ponto in unicos),
+        momentos_n_mm=tuple((ponto[2], ponto[3]) for ponto in unicos),
+        analises=len(amostras),
+    )
+
+
+def pontos_tabela_setor(
+    quantidade_barras: int, pontos_desejados: int, minimo: int = 1
+) -> int:
+    """Intervalos por meio setor para cerca de ``pontos_desejados`` na volta."""
+
+    return max(
+        minimo,
+        math.ceil(pontos_desejados / (2 * max(1, int(quantidade_barras)))),
+    )
+
+
+def gerar_diagrama_biaxial_por_simetria(
+    *,
+    secao_concreto: Any,
+    normal_n: float,
+    quantidade_barras: int,
+    pontos_desejados: int,
+    angulo_inicial_barras_rad: float = 0.0,
+    tolerancia_n_mm: Optional[float] = None,
+) -> List[Tuple[float, float]]:
+    """Gera o contorno usando a simetria da estaca e da camada circular.
+
+    Calculam-se apenas os pontos de meio setor; os demais sao obtidos por
+    reflexao e rotacao (ver ``construir_tabela_setor_capacidade``). Com
+    ``tolerancia_n_mm``, o meio setor e amostrado pelo erro de corda
+    (``construir_tabela_setor_adaptativa``) e ``pontos_desejados`` e
+    ignorado.
+    """
+
+    if tolerancia_n_mm is not None:
+        return construir_tabela_setor_adaptativa(
+            secao_concreto=secao_concreto,
+            normal_n=normal_n,
+            quantidade_barras=quantidade_barras,
+            angulo_inicial_barras_rad=angulo_inicial_barras_rad,
+            tolerancia_n_mm=tolerancia_n_mm,
+        ).contorno()
+    return construir_tabela_setor_capacidade(
+        secao_concreto=secao_concreto,
+        normal_n=normal_n,
+        quantidade_barras=quantidade_barras,
+        angulo_inicial_barras_rad=angulo_inicial_barras_rad,
+        pontos_setor=pontos_tabela_setor(quantidade_barras, pontos_desejados),
+    ).contorno()
+
+
+def intersecao_raio_poligono(
+    *,
+    demanda: Tuple[float, float],
+    poligono: Sequence[Tuple[float, float]],
+) -> Optional[Dict[str, Any]]:
+    """Intersecta o raio ``t * demanda`` com o contorno resistente.
+
+    Retorna a primeira interseção positiva. Para um contorno que contém a
+    origem, ``t >= 1`` significa que a demanda está no interior do diagrama.
+    """
+
+    dx, dy = demanda
+    if math.hypot(dx, dy) <= TOLERANCIA:
+        return None
+    pontos = fechar_poligono(poligono)
+    if len(pontos) < 4:
+        return None
+
+    candidatos: List[Tuple[float, float, Tuple[float, float]]] = []
+    for p, q in zip(pontos, pontos[1:]):
+        sx = q[0] - p[0]
+        sy = q[1] - p[1]
+        denominador = produto_vetorial_2d((dx, dy), (sx, sy))
+        if abs(denominador) <= TOLERANCIA:
+            continue
+        t = produto_vetorial_2d(p, (sx, sy)) / denominador
+        u = produto_vetorial_2d(p, (dx, dy)) / denominador
+        if t >= -TOLERANCIA and -TOLERANCIA <= u <= 1.0 + TOLERANCIA:
+            t = max(0.0, t)
+            candidatos.append((t, u, (t * dx, t * dy)))
+
+    positivos = [item for item in candidatos if item[0] > TOLERANCIA]
+    if not positivos:
+        return None
+    t, u, ponto = min(positivos, key=lambda item: item[0])
+    return {
+        "fator_escala": t,
+        "parametro_segmento": u,
+        "ponto": ponto,
+    }
+
+
+def intersecoes_raios_poligonos(
+    demandas: Any,
+    poligonos: Any,
+) -> Dict[str, np.ndarray]:
+    """Versao vetorizada de ``intersecao_raio_poligono`` e do teste par-impar.
+
+    ``demandas`` e um array ``(n, 2)``. ``poligonos`` e um contorno
+    ``(m, 2)`` usado por todas as demandas ou uma sequencia de ``n``
+    contornos, um por demanda; os menores sao completados repetindo o
+    ultimo vertice, o que cria lados nulos ignorados. Retorna, por demanda:
+
+    - ``fator_escala``: menor ``t > 0`` com ``t * demanda`` no contorno, ou
+      ``nan`` sem intersecao (demanda nula ou contorno degenerado);
+    - ``pontos``: ``t * demanda``, ``nan`` sem intersecao;
+    - ``dentro``: pertinencia pelo teste par-impar de ``ponto_no_poligono``.
+    """
+
+    demandas = np.asarray(demandas, dtype=float).reshape(-1, 2)
+    # Um contorno comeca por um ponto; um contorno vazio, como qualquer
+    # degenerado, fica para ``_vertices_fechados``.
+    if len(poligonos) == 0 or (
+        np.ndim(poligonos[0]) == 1 and np.size(poligonos[0]) == 2
+    ):
+        vertices = _vertices_fechados(poligonos)[None]
+    else:
+        fechados = [_vertices_fechados(poligono) for poligono in poligonos]
+        if len(fechados) != len(demandas):
+            raise ValueError(
+                "Informe um contorno ou um contorno por demanda."
+            )
+        tamanho = max(len(poligono) for poligono in fechados)
+        vertices = np.stack(
+            [
+                np.concatenate(
+                    [
+                        poligono,
+                        np.repeat(poligono[-1:], tamanho - len(poligono), 0),
+                    ]
+                )
+                for poligono in fechados
+            ]
+        )
+
+    # Lados (c, k) contra demandas (n, 1): c = 1 ou c = n.
+    x1, y1 = vertices[:, :-1, 0], vertices[:, :-1, 1]
+    x2, y2 = vertices[:, 1:, 0], vertices[:, 1:, 1]
+    sx, sy = x2 - x1, y2 - y1
+    dx, dy = demandas[:, 0:1], demandas[:, 1:2]
+    denominador = dx * sy - dy * sx
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (x1 * sy - y1 * sx) / denominador
+        u = (x1 * dy - y1 * dx) / denominador
+        validos = (
+            (np.abs(denominador) > TOLERANCIA)
+            & (t > TOLERANCIA)
+            & (u >= -TOLERANCIA)
+            & (u <= 1.0 + TOLERANCIA)
+        )
+        fator = np.where(validos, t, np.inf).min(axis=1)
+        fator[~np.isfinite(fator)] = np.nan
+        fator[np.hypot(dx[:, 0], dy[:, 0]) <= TOLERANCIA] = np.nan
+
+        cruza = (y1 > dy) != (y2 > dy)
+        x_corte = x1 + (dy - y1) * sx / sy
+        dentro = np.count_nonzero(cruza & (dx < x_corte), axis=1) % 2 == 1
+
+    return {
+        "fator_escala": fator,
+        "pontos": fator[:, None] * demandas,
+        "dentro": dentro,
+    }
+
+
+def _vertices_fechados(poligono: Any) -> np.ndarray:
+    vertices = np.asarray(poligono, dtype=float).reshape(-1, 2)
+    if len(vertices) and not np.array_equal(vertices[0], vertices[-1]):
+        vertices = np.vstack([vertices, vertices[:1]])
+    if len(vertices) < 4:
+        # Como em intersecao_raio_poligono: sem area, sem intersecao.
+        return np.zeros((4, 2))
+    return vertices
+
+
+def fechar_poligono(
+    pontos: Iterable[Tuple[float, float]],
+) -> List[Tuple[float, float]]:
+    saida = [(float(x), float(y)) for x, y in pontos]
+    if not saida:
+        return saida
+    if saida[0] != saida[-1]:
+        saida.append(saida[0])
+    return saida
+
+
+def produto_vetorial_2d(
+    a: Tuple[float, float], b: Tuple[float, float]
+) -> float:
+    return a[0] * b[1] - a[1] * b[0]
+
+
+def distancia_ponto_segmento(
+    ponto: Sequence[float],
+    inicio: Sequence[float],
+    fim: Sequence[float],
+) -> float:
+    sx = fim[0] - inicio[0]
+    sy = fim[1] - inicio[1]
+    comprimento2 = sx * sx + sy * sy
+    if comprimento2 <= TOLERANCIA:
+        return math.hypot(ponto[0] - inicio[0], ponto[1] - inicio[1])
+    u = (
+        (ponto[0] - inicio[0]) * sx + (ponto[1] - inicio[1]) * sy
+    ) / comprimento2
+    u = min(1.0, max(0.0, u))
+    return math.hypot(
+        ponto[0] - inicio[0] - u * sx, ponto[1] - inicio[1] - u * sy
+    )
@@ -0,0 +1,133 @@
+"""Instrumentação por requisição da verificação FCO.
+
+``instrumentar_fco`` ativa um ``InstrumentacaoFCO`` no contexto corrente
+(``contextvars``), de modo que requisições em threads diferentes não se
+misturam. Os módulos do serviço marcam as etapas com ``medir`` e os eventos
+com ``contar``; sem instrumentação ativa, ``medir`` devolve um gerenciador
+nulo compartilhado e ``contar`` retorna em seguida, e o custo fica em uma
+leitura de ``ContextVar`` por chamada.
+
+As etapas podem se sobrepor: o tempo de ``reanalise_recomendacao`` inclui as
+chamadas de ``ultimate_bending_capacity`` feitas nela. Os processos do pool
+medem com a própria instrumentação, somada à do processo principal.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class InstrumentacaoFCO:
+    """Chamadas e tempo acumulado por etapa, e contagens de eventos."""
+
+    __slots__ = ("etapas", "contagens")
+
+    def __init__(self) -> None:
+        self.etapas: Dict[str, List[float]] = {}
+        self.contagens: Dict[str, int] = {}
+
+    def registrar(self, nome: str, tempo_s: float) -> None:
+        etapa = self.etapas.get(nome)
+        if etapa is None:
+            self.etapas[nome] = [1, tempo_s]
+        else:
+            etapa[0] += 1
+            etapa[1] += tempo_s
+
+    def combinar(self, dados: Dict[str, Any]) -> None:
+        """Soma o ``exportar`` de outra instrumentação, p. ex. de um processo."""
+
+        for nome, (chamadas, tempo_s) in dados["etapas"].items():
+            etapa = self.etapas.setdefault(nome, [0, 0.0])
+            etapa[0] += chamadas
+            etapa[1] += tempo_s
+        for nome, quantidade in dados["contagens"].items():
+            self.contagens[nome] = self.contagens.get(nome, 0) + quantidade
+
+    def exportar(self) -> Dict[str, Any]:
+        return {
+            "etapas": {
+                nome: tuple(etapa) for nome, etapa in self.etapas.items()
+            },
+            "contagens": dict(self.contagens),
+        }
+
+    def resumo(self) -> Dict[str, Any]:
+        return {
+            "etapas": {
+                nome: {"chamadas": int(chamadas), "tempo_s": tempo_s}
+                for nome, (chamadas, tempo_s) in sorted(self.etapas.items())
+            },
+            "contagens": dict(sorted(self.contagens.items())),
+        }
+
+
+_INSTRUMENTACAO: ContextVar[Optional[InstrumentacaoFCO]] = ContextVar(
+    "instrumentacao_fco", default=None
+)
+
+
+class _Medicao:
+    __slots__ = ("_instrumentacao", "_nome", "_inicio")
+
+    def __init__(self, instrumentacao: InstrumentacaoFCO, nome: str) -> None:
+        self._instrumentacao = instrumentacao
+        self._nome = nome
+
+    def __enter__(self) -> None:
+        self._inicio = perf_counter()
+
+    def __exit__(self, *_: Any) -> bool:
+        self._instrumentacao.registrar(
+            self._nome, perf_counter() - self._inicio
+        )
+        return False
+
+
+class _MedicaoNula:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *_: Any) -> bool:
+        return False
+
+
+_MEDICAO_NULA = _MedicaoNula()
+
+
+def instrumentacao_ativa() -> Optional[InstrumentacaoFCO]:
+    return _INSTRUMENTACAO.get()
+
+
+@contextmanager
+def instrumentar_fco() -> Iterator[InstrumentacaoFCO]:
+    """Ativa uma instrumentação nova até o fim do bloco."""
+
+    instrumentacao = InstrumentacaoFCO()
+    token = _INSTRUMENTACAO.set(instrumentacao)
+    try:
+        yield instrumentacao
+    finally:
+        _INSTRUMENTACAO.reset(token)
+
+
+def medir(nome: str) -> Any:
+    """Gerenciador que soma o tempo do bloco à etapa ``nome``."""
+
+    instrumentacao = _INSTRUMENTACAO.get()
+    if instrumentacao is None:
+        return _MEDICAO_NULA
+    return _Medicao(instrumentacao, nome)
+
+
+def contar(nome: str, quantidade: int = 1) -> None:
+    instrumentacao = _INSTRUMENTACAO.get()
+    if instrumentacao is not None:
+        instrumentacao.contagens[nome] = (
+            instrumentacao.contagens.get(nome, 0) + quantidade
+        )
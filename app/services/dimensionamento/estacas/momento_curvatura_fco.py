@@ -0,0 +1,247 @@
+"""Relação momento-curvatura da seção circular da verificação FCO.
+
+A curva usa as leis de material de ``SecaoFibrasCircularFCO`` sob o plano
+de deformações ``eps(v) = eps_0 + kappa v``, com ``v`` medido do centro na
+direção da fibra mais comprimida. Para cada curvatura, ``eps_0`` equilibra a
+força normal; o último ponto é a curvatura em que a fibra extrema atinge
+``deformacao_ultima_concreto`` ou a barra mais tracionada atinge
+``deformacao_ultima_aco``. O momento é a componente na direção pedida; a
+pequena parcela ortogonal criada pelas barras discretas é desprezada.
+
+Com a curva em mãos, o pilar-padrão (NBR 6118, 15.8.3.3) fica
+
+    M_tot = M_1 + N le² / 10 * kappa(M_tot)
+
+e é resolvido sobre a própria curva, sem novas análises da seção.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from app.services.dimensionamento.estacas.instrumentacao_fco import medir
+from app.services.dimensionamento.estacas.secao_fibras_fco import (
+    FalhaEquilibrioFibras,
+    SecaoFibrasCircularFCO,
+)
+
+
+PONTOS_CURVA_MOMENTO_CURVATURA = 40
+# Tensao de pico do concreto na curva, sobre fcd = fck / gamma_c
+# (NBR 6118, 15.3.1).
+FATOR_PICO_CONCRETO_CURVA = 1.10
+# Bissecao em eps_0 (intervalo de ~1e-2): 32 passos levam a ~1e-12.
+ITERACOES_EQUILIBRIO_CURVA = 32
+ITERACOES_PIVO_ACO = 50
+
+
+@dataclass(frozen=True, eq=False)
+class CurvaMomentoCurvaturaFCO:
+    """Ramo crescente de ``M(kappa)`` para uma força normal e uma direção.
+
+    ``curvaturas`` em 1/mm e ``momentos`` em N.mm, do ponto ``(0, 0)`` até
+    a curvatura última ``curvaturas[-1]``.
+    """
+
+    normal_n: float
+    angulo_momento_rad: float
+    curvaturas: np.ndarray
+    momentos: np.ndarray
+
+    @property
+    def curvatura_ultima(self) -> float:
+        return float(self.curvaturas[-1])
+
+    @property
+    def momento_maximo(self) -> float:
+        return float(self.momentos.max())
+
+    def curvatura(self, momento_n_mm: float) -> Optional[float]:
+        """Menor curvatura com ``M(kappa) = momento``; ``None`` acima do pico."""
+
+        if momento_n_mm > self.momento_maximo:
+            return None
+        indice = int(np.argmax(self.momentos >= momento_n_mm))
+        if indice == 0:
+            return 0.0
+        m0, m1 = self.momentos[indice - 1], self.momentos[indice]
+        k0, k1 = self.curvaturas[indice - 1], self.curvaturas[indice]
+        return float(k0 + (momento_n_mm - m0) * (k1 - k0) / (m1 - m0))
+
+    def pilar_padrao(
+        self, momento_primeira_ordem_n_mm: float, comprimento_mm: float
+    ) -> Optional[Tuple[float, float]]:
+        """``(M_tot, kappa)`` do pilar-padrão, ou ``None`` se instável.
+
+        A excentricidade de segunda ordem é ``le² / 10 * kappa``. O
+        equilíbrio é o primeiro ponto da curva com
+        ``M(kappa) - N le² kappa / 10 >= M_1``; sem ele não há configuração
+        de equilíbrio até a curvatura última.
+        """
+
+        rigidez_externa = self.normal_n * comprimento_mm**2 / 10.0
+        folga = self.momentos - rigidez_externa * self.curvaturas
+        alcancados = np.nonzero(folga >= momento_primeira_ordem_n_mm)[0]
+        if alcancados.size == 0:
+            return None
+        indice = int(alcancados[0])
+        if indice == 0:
+            return momento_primeira_ordem_n_mm, 0.0
+        f0, f1 = folga[indice - 1], folga[indice]
+        k0, k1 = self.curvaturas[indice - 1], self.curvaturas[indice]
+        curvatura = float(
+            k0 + (momento_primeira_ordem_n_mm - f0) * (k1 - k0) / (f1 - f0)
+        )
+        return (
+            momento_primeira_ordem_n_mm + rigidez_externa * curvatura,
+            curvatura,
+        )
+
+
+def construir_curva_momento_curvatura(
+    secao: SecaoFibrasCircularFCO,
+    *,
+    normal_n: float,
+    angulo_momento_rad: float,
+    deformacao_ultima_aco: float,
+    pontos: int = PONTOS_CURVA_MOMENTO_CURVATURA,
+) -> CurvaMomentoCurvaturaFCO:
+    """Curva ``M(kappa)`` com momento na direção ``angulo_momento_rad``.
+
+    ``angulo_momento_rad`` é o ângulo do vetor ``(m_x, m_y)``. O vetor de
+    momento do concreto é ``m_v (cos theta, -sen theta)``, de modo que a
+    linha neutra fica em ``theta = -angulo_momento_rad``.
+    """
+
+    theta = -angulo_momento_rad
+    seno, cosseno = math.sin(theta), math.cos(theta)
+    v_concreto = -secao.x_concreto * seno + secao.y_concreto * cosseno
+    v_barras = -secao.x_barras * seno + secao.y_barras * cosseno
+    direcao = (math.cos(angulo_momento_rad), math.sin(angulo_momento_rad))
+    raio = secao.raio_mm
+    deformacao_ultima = secao.deformacao_ultima
+
+    def esforcos(
+        deformacao_centro: np.ndarray, curvatura: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        deformacao = (
+            deformacao_centro[:, None] + curvatura[:, None] * v_concreto
+        )
+        forca_concreto = secao.tensao_concreto(deformacao) * secao.area_concreto
+        deformacao = deformacao_centro[:, None] + curvatura[:, None] * v_barras
+        forca_barras = (
+            secao.tensao_aco(deformacao) - secao.tensao_concreto(deformacao)
+        ) * secao.area_barras
+        normal = forca_concreto.sum(axis=1) + forca_barras.sum(axis=1)
+        m_x = forca_concreto @ secao.y_concreto + forca_barras @ secao.y_barras
+        m_y = forca_concreto @ secao.x_concreto + forca_barras @ secao.x_barras
+        return normal, m_x * direcao[0] + m_y * direcao[1]
+
+    def equilibrar(curvatura: np.ndarray) -> np.ndarray:
+        # N cresce com eps_0: bissecao vetorizada em um intervalo que deixa
+        # a secao inteira tracionada ou comprimida alem dos limites.
+        inferior = -deformacao_ultima_aco - curvatura * raio
+        superior = deformacao_ultima + curvatura * raio
+        normal_inferior, _ = esforcos(inferior, curvatura)
+        normal_superior, _ = esforcos(superior, curvatura)
+        if np.any(normal_inferior > normal_n) or np.any(
+            normal_superior < normal_n
+        ):
+            raise FalhaEquilibrioFibras(
+                "Nao ha plano de deformacoes que equilibre a forca normal "
+                "na curva momento-curvatura."
+            )
+        for _ in range(ITERACOES_EQUILIBRIO_CURVA):
+            meio = 0.5 * (inferior + superior)
+            normal, _ = esforcos(meio, curvatura)
+            abaixo = normal < normal_n
+            inferior = np.where(abaixo, meio, inferior)
+            superior = np.where(abaixo, superior, meio)
+        return 0.5 * (inferior + superior)
+
+    v_barra_tracionada = float(v_barras.min())
+    curvatura_ultima = curvatura_ultima_secao(
+        secao,
+        theta=theta,
+        normal_n=normal_n,
+        v_barra_tracionada=v_barra_tracionada,
+        deformacao_ultima_aco=deformacao_ultima_aco,
+    )
+
+    curvaturas = np.linspace(0.0, curvatura_ultima, pontos)
+    _, momentos = esforcos(equilibrar(curvaturas), curvaturas)
+    # Ramo crescente: o trecho apos o pico nao tem equilibrio estavel.
+    pico = int(np.argmax(momentos))
+    return CurvaMomentoCurvaturaFCO(
+        normal_n=normal_n,
+        angulo_momento_rad=angulo_momento_rad,
+        curvaturas=curvaturas[: pico + 1],
+        momentos=np.maximum.accumulate(momentos[: pico + 1]),
+    )
+
+
+def curvatura_ultima_secao(
+    secao: SecaoFibrasCircularFCO,
+    *,
+    theta: float,
+    normal_n: float,
+    v_barra_tracionada: float,
+    deformacao_ultima_aco: float,
+) -> float:
+    """Curvatura no estado limite último para a linha neutra ``theta``.
+
+    Parte do pivô no concreto, com a profundidade de
+    ``ultimate_bending_capacity``. Se a barra mais tracionada passar de
+    ``deformacao_ultima_aco``, o pivô passa ao aço: ``eps_0`` fica preso a
+    essa barra e a curvatura que equilibra N é achada por bissecção.
+    """
+
+    raio = secao.raio_mm
+    deformacao_ultima = secao.deformacao_ultima
+    with medir("ultimate_bending_capacity"):
+        resultado = secao.ultimate_bending_capacity(theta=theta, n=normal_n)
+    profundidade = resultado.d_n
+    curvatura = deformacao_ultima / profundidade
+    if (
+        deformacao_ultima - curvatura * (raio - v_barra_tracionada)
+        >= -deformacao_ultima_aco
+    ):
+        return curvatura
+
+    def normal_pivo_aco(curvatura: float) -> float:
+        deformacao_centro = -deformacao_ultima_aco - curvatura * v_barra_tracionada
+        return _normal_plano(secao, theta, deformacao_centro, curvatura)
+
+    # N cresce com a curvatura no pivo do aco; o pivo do concreto limita.
+    inferior, superior = 0.0, curvatura
+    for _ in range(ITERACOES_PIVO_ACO):
+        meio = 0.5 * (inferior + superior)
+        if normal_pivo_aco(meio) < normal_n:
+            inferior = meio
+        else:
+            superior = meio
+    return inferior
+
+
+def _normal_plano(
+    secao: SecaoFibrasCircularFCO,
+    theta: float,
+    deformacao_centro: float,
+    curvatura: float,
+) -> float:
+    seno, cosseno = math.sin(theta), math.cos(theta)
+    deformacao = deformacao_centro + curvatura * (
+        -secao.x_concreto * seno + secao.y_concreto * cosseno
+    )
+    normal = float(secao.tensao_concreto(deformacao) @ secao.area_concreto)
+    deformacao = deformacao_centro + curvatura * (
+        -secao.x_barras * seno + secao.y_barras * cosseno
+    )
+    return normal + float(
+        (secao.tensao_aco(deformacao) - secao.tensao_concreto(deformacao))
+        @ secao.area_barras
+    )
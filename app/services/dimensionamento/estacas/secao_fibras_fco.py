@@ -0,0 +1,409 @@
+"""Motor seccional nativo por fibras para a verificação FCO.
+
+Alternativas ao ``concreteproperties`` para seções circulares maciças. As
+barras são pontuais e o concreto é tratado de duas formas:
+
+* ``SecaoFibrasCircularFCO`` discretiza o disco em fibras de mesma área
+  dispostas em anéis;
+* ``SecaoSegmentosCircularFCO`` integra o bloco de tensões sobre segmentos
+  circulares, sem malha: o trecho retangular em forma fechada e o trecho
+  parabólico por quadratura de Gauss.
+
+As convenções reproduzem as da ``ConcreteSection``:
+
+* compressão positiva;
+* ``theta`` é o ângulo da linha neutra com o eixo X, com a fibra mais
+  comprimida no lado de ``v = -x sen(theta) + y cos(theta)`` máximo;
+* ``m_x = soma(F * y)`` e ``m_y = soma(F * x)`` em relação ao centro;
+* deformação ``deformacao_ultima_concreto`` na fibra mais comprimida.
+
+Por isso os objetos deste módulo podem substituir a ``ConcreteSection`` nas
+funções de busca direcional e de diagrama do serviço FCO.
+
+O disco é o círculo exato, enquanto o ``concreteproperties`` usa o polígono
+de ``pontos_contorno_secao`` lados. Comparado ao ``concreteproperties``, os
+momentos resistentes ficam dentro de ``TOLERANCIA_RELATIVA_MOTOR_NATIVO``.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+TOLERANCIA_RELATIVA_MOTOR_NATIVO = 0.01
+ANEIS_PADRAO = 24
+FIBRAS_NO_ANEL_CENTRAL = 6
+PONTOS_GAUSS_SEGMENTO = 12
+MAXIMO_ITERACOES_EQUILIBRIO = 60
+TOLERANCIA_EQUILIBRIO_MM = 1e-4
+
+
+class FalhaEquilibrioFibras(RuntimeError):
+    """Indica força normal fora do domínio resistente da seção."""
+
+
+@dataclass(frozen=True)
+class ResultadoCapacidadeFibras:
+    theta: float
+    n: float
+    d_n: float
+    m_x: float
+    m_y: float
+
+    @property
+    def m_xy(self) -> float:
+        return math.hypot(self.m_x, self.m_y)
+
+
+@dataclass
+class ResultadoDiagramaBiaxialFibras:
+    n: float
+    results: List[ResultadoCapacidadeFibras]
+
+    def get_results_lists(self) -> Tuple[List[float], List[float]]:
+        return (
+            [resultado.m_x for resultado in self.results],
+            [resultado.m_y for resultado in self.results],
+        )
+
+    def point_in_diagram(self, m_x: float, m_y: float) -> bool:
+        mx_lista, my_lista = self.get_results_lists()
+        return ponto_no_poligono(
+            (m_x, m_y), list(zip(mx_lista, my_lista))
+        )
+
+
+class SecaoCircularComBarrasFCO:
+    """Base dos motores nativos: disco maciço e uma camada circular de barras.
+
+    As subclasses implementam ``esforcos_concreto``. As barras são pontuais e
+    o concreto deslocado por elas é descontado na própria barra.
+    """
+
+    def __init__(
+        self,
+        *,
+        diametro_mm: float,
+        raio_eixo_barras_mm: float,
+        quantidade_barras: int,
+        area_barra_mm2: float,
+        angulo_inicial_rad: float,
+        parametros: Dict[str, float],
+    ) -> None:
+        self.raio_mm = diametro_mm / 2.0
+        self.fcd = parametros["fcd_diagrama_mpa"]
+        self.fyd = parametros["fyd_mpa"]
+        self.modulo_aco = parametros["modulo_elasticidade_aco_mpa"]
+        self.deformacao_patamar = parametros["deformacao_concreto_inicio_patamar"]
+        self.deformacao_ultima = parametros["deformacao_ultima_concreto"]
+        self.expoente = parametros["expoente_parabola_concreto"]
+
+        angulos = angulo_inicial_rad + 2.0 * math.pi * np.arange(
+            quantidade_barras
+        ) / quantidade_barras
+        self.x_barras = raio_eixo_barras_mm * np.cos(angulos)
+        self.y_barras = raio_eixo_barras_mm * np.sin(angulos)
+        self.area_barras = np.full(quantidade_barras, float(area_barra_mm2))
+
+    def tensao_concreto(self, deformacao: np.ndarray) -> np.ndarray:
+        complemento = 1.0 - np.clip(
+            deformacao / self.deformacao_patamar, 0.0, 1.0
+        )
+        if self.expoente == 2.0:
+            return self.fcd * (1.0 - complemento * complemento)
+        return self.fcd * (1.0 - complemento**self.expoente)
+
+    def tensao_aco(self, deformacao: np.ndarray) -> np.ndarray:
+        return np.clip(self.modulo_aco * deformacao, -self.fyd, self.fyd)
+
+    def esforcos_concreto(
+        self, theta: float, profundidades: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        raise NotImplementedError
+
+    def esforcos(
+        self, theta: float, profundidades: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Retorna (N, Mx, My) para cada profundidade de linha neutra."""
+
+        profundidades = np.asarray(profundidades, dtype=float)
+        normal, m_x, m_y = self.esforcos_concreto(theta, profundidades)
+        seno, cosseno = math.sin(theta), math.cos(theta)
+        v_barras = -self.x_barras * seno + self.y_barras * cosseno
+        # A fibra extrema do disco fica em v = R para qualquer theta.
+        deformacao_barras = (
+            self.deformacao_ultima
+            / profundidades[:, None]
+            * (v_barras[None, :] - self.raio_mm + profundidades[:, None])
+        )
+        forca_barras = (
+            self.tensao_aco(deformacao_barras)
+            - self.tensao_concreto(deformacao_barras)
+        ) * self.area_barras
+        return (
+            normal + forca_barras.sum(axis=1),
+            m_x + forca_barras @ self.y_barras,
+            m_y + forca_barras @ self.x_barras,
+        )
+
+    def normal(self, theta: float, profundidade: float) -> float:
+        return float(self.esforcos(theta, np.array([profundidade]))[0][0])
+
+    def ultimate_bending_capacity(
+        self, theta: float = 0.0, n: float = 0.0
+    ) -> ResultadoCapacidadeFibras:
+        profundidade = resolver_profundidade_linha_neutra(
+            lambda profundidade: self.normal(theta, profundidade),
+            normal_alvo=n,
+            altura_total=2.0 * self.raio_mm,
+        )
+        normal, m_x, m_y = self.esforcos(theta, np.array([profundidade]))
+        return ResultadoCapacidadeFibras(
+            theta=theta,
+            n=float(normal[0]),
+            d_n=profundidade,
+            m_x=float(m_x[0]),
+            m_y=float(m_y[0]),
+        )
+
+    def biaxial_bending_diagram(
+        self,
+        n: float = 0.0,
+        n_points: int = 48,
+        progress_bar: bool = False,
+    ) -> ResultadoDiagramaBiaxialFibras:
+        resultados = [
+            self.ultimate_bending_capacity(theta=float(theta), n=n)
+            for theta in np.linspace(-math.pi, math.pi, n_points, endpoint=False)
+        ]
+        resultados.append(resultados[0])
+        return ResultadoDiagramaBiaxialFibras(n=n, results=resultados)
+
+
+class SecaoFibrasCircularFCO(SecaoCircularComBarrasFCO):
+    """Concreto discretizado em fibras de mesma área."""
+
+    def __init__(self, *, aneis: int = ANEIS_PADRAO, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.x_concreto, self.y_concreto, self.area_concreto = (
+            discretizar_disco(self.raio_mm, aneis)
+        )
+
+    def esforcos_concreto(
+        self, theta: float, profundidades: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        seno, cosseno = math.sin(theta), math.cos(theta)
+        v_concreto = -self.x_concreto * seno + self.y_concreto * cosseno
+        deformacao = (
+            self.deformacao_ultima
+            / profundidades[:, None]
+            * (v_concreto[None, :] - self.raio_mm + profundidades[:, None])
+        )
+        forca = self.tensao_concreto(deformacao) * self.area_concreto
+        return (
+            forca.sum(axis=1),
+            forca @ self.y_concreto,
+            forca @ self.x_concreto,
+        )
+
+
+class SecaoSegmentosCircularFCO(SecaoCircularComBarrasFCO):
+    """Concreto integrado sobre segmentos circulares, sem discretização.
+
+    No sistema girado ``(u, v)`` a tensão só depende de ``v``. O trecho com
+    tensão ``fcd`` é um segmento circular, com área e momento estático em
+    forma fechada. O trecho parabólico, entre a linha neutra e o início do
+    patamar, é integrado por Gauss-Legendre na variável ``v = R sen(phi)``,
+    que remove a singularidade da largura da corda nas bordas do disco.
+    """
+
+    def __init__(
+        self, *, pontos_gauss: int = PONTOS_GAUSS_SEGMENTO, **kwargs: Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self.nos_gauss, self.pesos_gauss = np.polynomial.legendre.leggauss(
+            pontos_gauss
+        )
+
+    def esforcos_concreto(
+        self, theta: float, profundidades: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        raio = self.raio_mm
+        linha_neutra = raio - profundidades
+        inicio_patamar = raio - profundidades * (
+            1.0 - self.deformacao_patamar / self.deformacao_ultima
+        )
+
+        # Segmento acima de ``inicio_patamar``: tensao constante.
+        corte = np.clip(inicio_patamar, -raio, raio)
+        meia_corda = np.sqrt(raio * raio - corte * corte)
+        normal = self.fcd * (
+            raio * raio * np.arccos(corte / raio) - corte * meia_corda
+        )
+        momento_v = self.fcd * 2.0 / 3.0 * meia_corda**3
+
+        # Faixa parabolica entre a linha neutra e o inicio do patamar.
+        phi_inferior = np.arcsin(np.clip(linha_neutra, -raio, raio) / raio)
+        phi_superior = np.arcsin(corte / raio)
+        meio = 0.5 * (phi_superior + phi_inferior)[:, None]
+        meia_abertura = 0.5 * (phi_superior - phi_inferior)[:, None]
+        phi = meio + meia_abertura * self.nos_gauss[None, :]
+        v = raio * np.sin(phi)
+        deformacao = (
+            self.deformacao_ultima
+            / profundidades[:, None]
+            * (v - linha_neutra[:, None])
+        )
+        # dA = 2 sqrt(R^2 - v^2) dv = 2 R^2 cos^2(phi) dphi
+        forca = (
+            self.tensao_concreto(deformacao)
+            * (2.0 * raio * raio * np.cos(phi) ** 2)
+            * (meia_abertura * self.pesos_gauss[None, :])
+        )
+        normal = normal + forca.sum(axis=1)
+        momento_v = momento_v + (forca * v).sum(axis=1)
+
+        # A resultante fica sobre o eixo v, de direcao (-sen, cos).
+        return (
+            normal,
+            momento_v * math.cos(theta),
+            -momento_v * math.sin(theta),
+        )
+
+
+def discretizar_disco(
+    raio: float, aneis: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fibras de areas iguais em anéis concêntricos.
+
+    O anel ``i`` recebe ``FIBRAS_NO_ANEL_CENTRAL * (2i + 1)`` fibras, o que
+    mantém as fibras aproximadamente quadradas. Cada fibra fica no centróide
+    do seu setor anular, de modo que área e momentos estáticos do disco são
+    exatos.
+    """
+
+    xs: List[np.ndarray] = []
+    ys: List[np.ndarray] = []
+    areas: List[np.ndarray] = []
+    for indice in range(aneis):
+        interno = raio * indice / aneis
+        externo = raio * (indice + 1) / aneis
+        quantidade = FIBRAS_NO_ANEL_CENTRAL * (2 * indice + 1)
+        abertura = 2.0 * math.pi / quantidade
+        # Centroide de um setor anular de abertura ``abertura``.
+        raio_centroide = (
+            2.0
+            * (externo**3 - interno**3)
+            / (3.0 * (externo**2 - interno**2))
+            * math.sin(abertura / 2.0)
+            / (abertura / 2.0)
+        )
+        angulos = abertura * (np.arange(quantidade) + 0.5)
+        xs.append(raio_centroide * np.cos(angulos))
+        ys.append(raio_centroide * np.sin(angulos))
+        areas.append(
+            np.full(
+                quantidade,
+                math.pi * (externo**2 - interno**2) / quantidade,
+            )
+        )
+    return np.concatenate(xs), np.concatenate(ys), np.concatenate(areas)
+
+
+def resolver_profundidade_linha_neutra(
+    normal_por_profundidade: Callable[[float], float],
+    *,
+    normal_alvo: float,
+    altura_total: float,
+) -> float:
+    """Encontra a profundidade da linha neutra que equilibra ``normal_alvo``.
+
+    A força normal cresce com a profundidade. Usa-se o método de Illinois
+    (falsa posição modificada) sobre o logaritmo da profundidade, que mantém
+    o intervalo de confiança e converge em poucas avaliações. Os limites
+    reproduzem os do ``concreteproperties`` (1e-6 a 6 vezes a altura).
+    """
+
+    a = math.log(1e-6 * altura_total)
+    b = math.log(6.0 * altura_total)
+    fa = normal_por_profundidade(math.exp(a)) - normal_alvo
+    fb = normal_por_profundidade(math.exp(b)) - normal_alvo
+    if fa > 0 or fb < 0:
+        raise FalhaEquilibrioFibras(
+            "Nao ha linha neutra que equilibre a forca normal: ela excede a "
+            "capacidade de tracao ou de compressao da secao."
+        )
+    lado = 0
+    c = b
+    for _ in range(MAXIMO_ITERACOES_EQUILIBRIO):
+        c = b - fb * (b - a) / (fb - fa) if fb != fa else 0.5 * (a + b)
+        fc = normal_por_profundidade(math.exp(c)) - normal_alvo
+        if fc == 0 or math.exp(b) - math.exp(a) < TOLERANCIA_EQUILIBRIO_MM:
+            break
+        if fc > 0:
+            b, fb = c, fc
+            if lado == 1:
+                fa *= 0.5
+            lado = 1
+        else:
+            a, fa = c, fc
+            if lado == -1:
+                fb *= 0.5
+            lado = -1
+    return math.exp(c)
+
+
+def ponto_no_poligono(
+    ponto: Tuple[float, float], poligono: List[Tuple[float, float]]
+) -> bool:
+    """Teste par-ímpar de pertinência de um ponto a um polígono fechado."""
+
+    x, y = ponto
+    dentro = False
+    for (x1, y1), (x2, y2) in zip(poligono, poligono[1:] + poligono[:1]):
+        if (y1 > y) != (y2 > y):
+            x_corte = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+            if x < x_corte:
+                dentro = not dentro
+    return dentro
+
+
+def comparar_capacidades(
+    secao_referencia: Any,
+    secao_nativa: Any,
+    *,
+    normal_n: float,
+    angulos_rad: Optional[List[float]] = None,
+) -> Dict[str, Any]:
+    """Compara os momentos resistentes de dois motores nos mesmos ângulos."""
+
+    angulos = angulos_rad or [
+        indice * math.pi / 6.0 for indice in range(-6, 6)
+    ]
+    desvio_maximo = 0.0
+    for theta in angulos:
+        referencia = secao_referencia.ultimate_bending_capacity(
+            theta=theta, n=normal_n
+        )
+        nativo = secao_nativa.ultimate_bending_capacity(theta=theta, n=normal_n)
+        modulo_referencia = math.hypot(
+            float(referencia.m_x), float(referencia.m_y)
+        )
+        diferenca = math.hypot(
+            float(referencia.m_x) - nativo.m_x,
+            float(referencia.m_y) - nativo.m_y,
+        )
+        if modulo_referencia > 0:
+            desvio_maximo = max(desvio_maximo, diferenca / modulo_referencia)
+    return {
+        "angulos_comparados": len(angulos),
+        "desvio_relativo_maximo": desvio_maximo,
+        "tolerancia_relativa": TOLERANCIA_RELATIVA_MOTOR_NATIVO,
+        "dentro_da_tolerancia": (
+            desvio_maximo <= TOLERANCIA_RELATIVA_MOTOR_NATIVO
+        ),
+    }
@@ -0,0 +1,321 @@
+"""Varredura de diâmetros (e fck) de estaca na flexocompressão oblíqua.
+
+Cada par diâmetro × fck é um ``DimensionadorFlexoCompressaoObliqua`` com o
+mesmo catálogo e as mesmas solicitações. Os pares compartilham os caches do
+módulo, o pool de processos e, por fck, os materiais do motor. Antes de
+montar qualquer seção, descartam-se os pares que não resistem à força normal
+nem com a maior armadura do catálogo, cuja esbeltez passa do limite do
+método de segunda ordem ou cuja armadura máxima fica abaixo de
+``area_aco_minima_necessaria_mm2``. Os demais são analisados em ordem
+crescente de custo mínimo estimado, e a análise para quando esse custo já
+não pode vencer o melhor par encontrado.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.services.dimensionamento.estacas.flexo_compressao_obliqua import (
+    TF_PARA_N,
+    DimensionadorFlexoCompressaoObliqua,
+    ErroFlexoCompressaoObliqua,
+    avaliar_geometria_armadura_circular,
+)
+
+
+MAXIMO_DIAMETROS_VARREDURA = 12
+MAXIMO_FCKS_VARREDURA = 4
+MASSA_ESPECIFICA_ACO_KG_M3 = 7_850.0
+
+
+@dataclass(frozen=True)
+class CustosFCO:
+    """Custo por metro de estaca: volume bruto de concreto e massa de aço."""
+
+    preco_concreto_m3: float = 650.0
+    preco_aco_kg: float = 9.0
+    # Pares (fck_mpa, preco_m3) que substituem ``preco_concreto_m3``.
+    precos_concreto_m3_por_fck: Tuple[Tuple[float, float], ...] = ()
+
+    def preco_concreto(self, fck_mpa: float) -> float:
+        for fck, preco in self.precos_concreto_m3_por_fck:
+            if math.isclose(fck, fck_mpa):
+                return preco
+        return self.preco_concreto_m3
+
+    def custo_por_metro(
+        self, diametro_m: float, fck_mpa: float, area_aco_cm2: float
+    ) -> Dict[str, float]:
+        concreto = math.pi * diametro_m**2 / 4.0 * self.preco_concreto(fck_mpa)
+        aco = (
+            area_aco_cm2 * 1e-4 * MASSA_ESPECIFICA_ACO_KG_M3 * self.preco_aco_kg
+        )
+        return {"concreto": concreto, "aco": aco, "total": concreto + aco}
+
+
+@dataclass
+class VarreduraDiametrosFCO:
+    """Escolhe o par diâmetro + armadura de menor custo por metro.
+
+    ``base`` fornece seção (cobrimento, estribo, ângulo das barras),
+    materiais, solicitações e catálogo; ``diametros_m`` e ``fcks_mpa``
+    substituem o diâmetro e o fck. Sem ``fcks_mpa``, usa o fck da base.
+    """
+
+    base: DimensionadorFlexoCompressaoObliqua
+    diametros_m: Sequence[float]
+    fcks_mpa: Sequence[float] = ()
+    custos: CustosFCO = CustosFCO()
+
+    def analisar(self) -> Dict[str, Any]:
+        diametros, fcks = self._validar_entradas()
+        combinacoes, _ = self.base._combinacoes()
+        esforcos = self.base._lista_esforcos_primeira_ordem()
+        normal_maxima_sd_n = max(
+            item.normal_compressao_sd_tf for item in esforcos
+        ) * TF_PARA_N
+
+        candidatos: List[Dict[str, Any]] = []
+        servicos: Dict[
+            Tuple[float, float], DimensionadorFlexoCompressaoObliqua
+        ] = {}
+        for fck in fcks:
+            for diametro in diametros:
+                servico = replace(
+                    self.base,
+                    secao=replace(self.base.secao, diametro_m=diametro),
+                    materiais=replace(self.base.materiais, fck_mpa=fck),
+                )
+                servicos[(diametro, fck)] = servico
+                candidatos.append(
+                    self._triar_candidato(
+                        servico, combinacoes, normal_maxima_sd_n
+                    )
+                )
+
+        # Materiais do motor por fck: nao dependem do diametro.
+        materiais_por_fck: Dict[float, Tuple[Any, Any]] = {}
+        estatisticas_cache: Dict[str, Dict[str, int]] = {}
+        resultado_melhor: Optional[Dict[str, Any]] = None
+        melhor: Optional[Dict[str, Any]] = None
+        pendentes = sorted(
+            (item for item in candidatos if item["status"] == "pendente"),
+            key=lambda item: (
+                item["custo_minimo_estimado"],
+                item["diametro_m"],
+                item["fck_mpa"],
+            ),
+        )
+        for candidato in pendentes:
+            if (
+                melhor is not None
+                and candidato["custo_minimo_estimado"]
+                >= melhor["custo"]["total"]
+            ):
+                candidato["status"] = "podado_pelo_custo"
+                continue
+            servico = servicos[(candidato["diametro_m"], candidato["fck_mpa"])]
+            fck = candidato["fck_mpa"]
+            if fck not in materiais_por_fck:
+                materiais_por_fck[fck] = servico._criar_materiais(
+                    servico._carregar_dependencias()
+                )
+            servico._materiais_compartilhados = materiais_por_fck[fck]
+            resultado = servico.analisar()
+            for nome, contagem in servico._estatisticas_cache.items():
+                acumulado = estatisticas_cache.setdefault(
+                    nome, {"acertos": 0, "falhas": 0}
+                )
+                acumulado["acertos"] += contagem["acertos"]
+                acumulado["falhas"] += contagem["falhas"]
+
+            recomendacao = resultado["recomendacao"]
+            if recomendacao is None:
+                candidato["status"] = "sem_alternativa_que_atende"
+                continue
+            candidato["status"] = "avaliado"
+            candidato["recomendacao"] = {
+                chave: recomendacao[chave]
+                for chave in (
+                    "id",
+                    "rotulo",
+                    "quantidade_barras",
+                    "diametro_barra_mm",
+                    "area_aco_total_cm2",
+                    "taxa_geometrica_aco_pct",
+                    "utilizacao",
+                )
+            }
+            candidato["custo"] = self.custos.custo_por_metro(
+                candidato["diametro_m"],
+                fck,
+                recomendacao["area_aco_total_cm2"],
+            )
+            if melhor is None or (
+                candidato["custo"]["total"],
+                candidato["diametro_m"],
+            ) < (melhor["custo"]["total"], melhor["diametro_m"]):
+                melhor = candidato
+                resultado_melhor = resultado
+
+        contagem_status: Dict[str, int] = {}
+        for candidato in candidatos:
+            contagem_status[candidato["status"]] = (
+                contagem_status.get(candidato["status"], 0) + 1
+            )
+        avisos = [
+            "O custo considera apenas o volume bruto de concreto e a massa "
+            "da armadura longitudinal por metro de estaca; nao inclui "
+            "estribos, escavacao, formas ou mao de obra."
+        ]
+        if melhor is None:
+            avisos.append(
+                "Nenhum par diametro + armadura do catalogo atende as "
+                "solicitacoes."
+            )
+        return {
+            "sistema_unidades": {
+                "diametro": "m",
+                "area_aco": "cm²",
+                "custo": "unidade monetaria por metro de estaca",
+            },
+            "metodo": {
+                "criterio": (
+                    "menor custo por metro entre os pares diametro + "
+                    "armadura recomendada que atendem"
+                ),
+                "motor": self.base.catalogo.motor,
+                "estrategia_busca": self.base.catalogo.estrategia_busca,
+                "execucao": self.base.catalogo.execucao,
+                "candidatos": len(candidatos),
+                "analises_de_catalogo": contagem_status.get("avaliado", 0)
+                + contagem_status.get("sem_alternativa_que_atende", 0),
+                "status": contagem_status,
+                "materiais_compartilhados_por_fck": len(materiais_por_fck),
+                "caches": estatisticas_cache,
+            },
+            "custos": {
+                "preco_concreto_m3": self.custos.preco_concreto_m3,
+                "preco_aco_kg": self.custos.preco_aco_kg,
+                "precos_concreto_m3_por_fck": [
+                    {"fck_mpa": fck, "preco_m3": preco}
+                    for fck, preco in self.custos.precos_concreto_m3_por_fck
+                ],
+                "massa_especifica_aco_kg_m3": MASSA_ESPECIFICA_ACO_KG_M3,
+            },
+            "candidatos": candidatos,
+            "melhor": melhor,
+            "resultado_melhor": resultado_melhor,
+            "avisos": avisos,
+        }
+
+    def _validar_entradas(self) -> Tuple[List[float], List[float]]:
+        diametros = sorted({float(diametro) for diametro in self.diametros_m})
+        fcks = sorted(
+            {float(fck) for fck in self.fcks_mpa}
+            or {float(self.base.materiais.fck_mpa)}
+        )
+        if not diametros:
+            raise ErroFlexoCompressaoObliqua("Informe ao menos um diametro.")
+        if len(diametros) > MAXIMO_DIAMETROS_VARREDURA:
+            raise ErroFlexoCompressaoObliqua(
+                f"A varredura aceita ate {MAXIMO_DIAMETROS_VARREDURA} "
+                "diametros."
+            )
+        if len(fcks) > MAXIMO_FCKS_VARREDURA:
+            raise ErroFlexoCompressaoObliqua(
+                f"A varredura aceita ate {MAXIMO_FCKS_VARREDURA} valores de "
+                "fck."
+            )
+        if diametros[0] <= 0 or fcks[0] <= 0:
+            raise ErroFlexoCompressaoObliqua(
+                "Diametros e fck devem ser positivos."
+            )
+        if self.custos.preco_concreto_m3 < 0 or self.custos.preco_aco_kg < 0:
+            raise ErroFlexoCompressaoObliqua(
+                "Os precos de concreto e aco nao podem ser negativos."
+            )
+        return diametros, fcks
+
+    def _triar_candidato(
+        self,
+        servico: DimensionadorFlexoCompressaoObliqua,
+        combinacoes: Sequence[Tuple[int, float]],
+        normal_maxima_sd_n: float,
+    ) -> Dict[str, Any]:
+        """Poda o par sem montar secoes; senao estima o custo minimo."""
+
+        diametro = servico.secao.diametro_m
+        fck = servico.materiais.fck_mpa
+        candidato: Dict[str, Any] = {
+            "diametro_m": diametro,
+            "fck_mpa": fck,
+            "status": "pendente",
+            "area_aco_maxima_catalogo_cm2": None,
+            "area_aco_minima_necessaria_cm2": None,
+            "custo_minimo_estimado": None,
+            "recomendacao": None,
+            "custo": None,
+        }
+        areas_por_bitola: Dict[float, List[float]] = {}
+        for quantidade, bitola in combinacoes:
+            geometria = avaliar_geometria_armadura_circular(
+                diametro_secao_mm=diametro * 1_000.0,
+                cobrimento_nominal_mm=servico.secao.cobrimento_nominal_mm,
+                diametro_armadura_transversal_mm=(
+                    servico.secao.diametro_armadura_transversal_mm
+                ),
+                quantidade_barras=quantidade,
+                diametro_barra_mm=bitola,
+                espacamento_livre_minimo_mm=(
+                    servico.catalogo.espacamento_livre_minimo_mm
+                ),
+            )
+            if geometria["viavel_geometricamente"]:
+                areas_por_bitola.setdefault(bitola, []).append(
+                    quantidade * math.pi * bitola**2 / 4.0
+                )
+        if not areas_por_bitola:
+            candidato["status"] = "sem_alternativa_geometrica"
+            return candidato
+        try:
+            # O indice de esbeltez depende do diametro.
+            servico._validar_esbeltez()
+        except ErroFlexoCompressaoObliqua:
+            candidato["status"] = "esbeltez_acima_do_limite"
+            return candidato
+
+        area_maxima = max(max(areas) for areas in areas_por_bitola.values())
+        candidato["area_aco_maxima_catalogo_cm2"] = area_maxima / 100.0
+        parametros = servico._parametros_calculados()
+        # Limite superior da compressao centrada: concreto todo a fcd e aco
+        # a fyd, sem descontar o concreto deslocado pelas barras.
+        normal_resistente_maxima = (
+            math.pi * (diametro * 1_000.0) ** 2 / 4.0
+            * parametros["fcd_diagrama_mpa"]
+            + area_maxima * parametros["fyd_mpa"]
+        )
+        if normal_maxima_sd_n > normal_resistente_maxima:
+            candidato["status"] = "podado_pela_normal"
+            return candidato
+
+        limites = servico._limites_area_aco_por_bitola(areas_por_bitola)
+        viaveis = [
+            area
+            for bitola, areas in areas_por_bitola.items()
+            for area in areas
+            if area >= limites[bitola]
+        ]
+        finitos = [limite for limite in limites.values() if math.isfinite(limite)]
+        candidato["area_aco_minima_necessaria_cm2"] = (
+            min(finitos) / 100.0 if finitos else None
+        )
+        if not viaveis:
+            candidato["status"] = "podado_pelo_limite_inferior"
+            return candidato
+        candidato["custo_minimo_estimado"] = self.custos.custo_por_metro(
+            diametro, fck, min(viaveis) / 100.0
+        )["total"]
+        return candidato
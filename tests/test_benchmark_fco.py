@@ -0,0 +1,98 @@
+"""Casos do corpus de benchmark FCO como verificações de comportamento."""
+
+from app.services.dimensionamento.estacas.benchmark_fco import (
+    CORPUS_BENCHMARK_FCO,
+    executar_benchmark_fco,
+    verificar_regressoes,
+)
+
+# Um caso de grade com pequena excentricidade, um explicito e o de grande
+# excentricidade em que a busca direcional ja falhou.
+CASOS_RAPIDOS = ("d025_fck20_e005", "d040_fck25_e020_explicito", "d050")
+
+
+def test_casos_rapidos_do_corpus_passam_sem_referencia():
+    casos = [
+        caso
+        for caso in CORPUS_BENCHMARK_FCO
+        if caso.nome.startswith(CASOS_RAPIDOS)
+    ]
+    relatorio = executar_benchmark_fco(
+        casos=casos, motor="nativo", medir_memoria=False
+    )
+
+    assert len(relatorio["casos"]) == len(CASOS_RAPIDOS)
+    assert verificar_regressoes(relatorio) == []
+    for caso in relatorio["casos"]:
+        recomendacoes = {
+            medicao["recomendacao"] for medicao in caso["modos"].values()
+        }
+        assert len(recomendacoes) == 1 and None not in recomendacoes
+        assert caso["desvio_utilizacao"]["opcoes_comparadas"] > 0
+
+
+def _relatorio(direcional, diagrama_completo, comparacao):
+    return {
+        "configuracao": {"motor": "nativo", "execucao": "serial"},
+        "casos": [
+            {
+                "nome": "caso",
+                "modos": {
+                    "direcional": direcional,
+                    "diagrama_completo": diagrama_completo,
+                },
+                "desvio_utilizacao": comparacao,
+            }
+        ],
+    }
+
+
+def _medicao(opcoes_com_erro=0):
+    return {
+        "tempo_s": 0.01,
+        "memoria_pico_mb": None,
+        "chamadas": {},
+        "opcoes_com_erro": opcoes_com_erro,
+    }
+
+
+def _comparacao(opcoes_comparadas=3, divergencias_status=()):
+    return {
+        "opcoes_comparadas": opcoes_comparadas,
+        "maximo_absoluto": 0.01 if opcoes_comparadas else None,
+        "medio": 0.0 if opcoes_comparadas else None,
+        "maximo_relativo": 0.01 if opcoes_comparadas else None,
+        "divergencias_status": list(divergencias_status),
+    }
+
+
+def test_relatorio_saudavel_nao_tem_regressoes():
+    relatorio = _relatorio(_medicao(), _medicao(), _comparacao())
+
+    assert verificar_regressoes(relatorio) == []
+
+
+def test_erros_de_alternativa_sao_regressao_sem_referencia():
+    relatorio = _relatorio(
+        _medicao(opcoes_com_erro=12),
+        _medicao(),
+        _comparacao(opcoes_comparadas=0),
+    )
+
+    regressoes = verificar_regressoes(relatorio)
+
+    assert len(regressoes) == 2
+    assert "12 alternativa(s) com erro de analise" in regressoes[0]
+    assert "nenhuma alternativa" in regressoes[1]
+
+
+def test_divergencia_de_status_e_regressao_sem_referencia():
+    relatorio = _relatorio(
+        _medicao(),
+        _medicao(),
+        _comparacao(divergencias_status=["8x16"]),
+    )
+
+    assert verificar_regressoes(relatorio) == [
+        "caso: status diferente entre os modos em 8x16"
+    ]
@@ -0,0 +1,85 @@
+"""Verificações de comportamento da busca direcional FCO."""
+
+import pytest
+
+from app.services.dimensionamento.estacas.benchmark_fco import (
+    CORPUS_BENCHMARK_FCO,
+)
+from app.services.dimensionamento.estacas.flexo_compressao_obliqua import (
+    CatalogoArmadurasFCO,
+    DimensionadorFlexoCompressaoObliqua,
+    EsforcosFCO,
+    MateriaisFCO,
+    SecaoCircularFCO,
+    limpar_caches_fco,
+)
+
+
+@pytest.fixture(autouse=True)
+def caches_vazios():
+    # Os caches de secao sao do processo; cada teste parte do zero.
+    limpar_caches_fco()
+    yield
+    limpar_caches_fco()
+
+
+def _caso_corpus(prefixo):
+    return next(
+        caso for caso in CORPUS_BENCHMARK_FCO if caso.nome.startswith(prefixo)
+    )
+
+
+def _analisar_caso(prefixo, modo):
+    catalogo_base = CatalogoArmadurasFCO(
+        bitolas_longitudinais_mm=(),
+        quantidades_barras=(),
+        motor="nativo",
+        incluir_diagrama_recomendacao=False,
+    )
+    return _caso_corpus(prefixo).dimensionador(catalogo_base, modo).analisar()
+
+
+def test_busca_direcional_converge_no_caso_d050():
+    # Com a partida fria espelhada, todas as alternativas terminavam com erro
+    # angular de 180 graus.
+    direcional = _analisar_caso("d050", "direcional")
+    completo = _analisar_caso("d050", "diagrama_completo")
+
+    assert all(
+        opcao["status"] != "erro_analise" for opcao in direcional["opcoes"]
+    )
+    assert direcional["recomendacao"]["id"] == completo["recomendacao"]["id"]
+    utilizacoes = {
+        opcao["id"]: opcao["utilizacao"] for opcao in completo["opcoes"]
+    }
+    for opcao in direcional["opcoes"]:
+        assert opcao["utilizacao"] == pytest.approx(
+            utilizacoes[opcao["id"]], abs=0.03
+        )
+
+
+def test_partida_fria_resolve_primeira_alternativa_em_poucas_analises():
+    servico = DimensionadorFlexoCompressaoObliqua(
+        secao=SecaoCircularFCO(
+            diametro_m=0.40, cobrimento_nominal_mm=40.0
+        ),
+        materiais=MateriaisFCO(fck_mpa=30.0),
+        esforcos=EsforcosFCO(
+            normal_compressao_sd_tf=35.0,
+            momento_x_sd_tf_m=5.0,
+            momento_y_sd_tf_m=3.0,
+        ),
+        catalogo=CatalogoArmadurasFCO(
+            bitolas_longitudinais_mm=(),
+            quantidades_barras=(),
+            combinacoes_explicitas=((6, 16.0), (8, 16.0)),
+            tolerancia_angular_graus=0.05,
+            motor="nativo",
+            incluir_diagrama_recomendacao=False,
+        ),
+    )
+
+    primeira = servico.analisar()["opcoes"][0]
+
+    assert primeira["id"] == "6x16"
+    assert primeira["iteracoes_angulo"] <= 2
@@ -0,0 +1,47 @@
+"""Interseções raio-contorno da geometria de setor FCO."""
+
+import math
+
+import numpy as np
+import pytest
+
+from app.services.dimensionamento.estacas.geometria_setor_fco import (
+    intersecao_raio_poligono,
+    intersecoes_raios_poligonos,
+)
+
+QUADRADO = [(-2.0, -2.0), (2.0, -2.0), (2.0, 2.0), (-2.0, 2.0)]
+
+
+def test_versao_vetorizada_coincide_com_a_escalar():
+    demandas = [
+        (math.cos(angulo), math.sin(angulo))
+        for angulo in np.linspace(-math.pi, math.pi, 13, endpoint=False)
+    ]
+
+    resultado = intersecoes_raios_poligonos(demandas, QUADRADO)
+
+    for demanda, fator in zip(demandas, resultado["fator_escala"]):
+        escalar = intersecao_raio_poligono(demanda=demanda, poligono=QUADRADO)
+        assert fator == pytest.approx(escalar["fator_escala"])
+    assert resultado["dentro"].all()
+
+
+@pytest.mark.parametrize("poligonos", [[], np.zeros((0, 2))])
+def test_contorno_vazio_nao_tem_intersecao(poligonos):
+    resultado = intersecoes_raios_poligonos(
+        [(1.0, 0.0), (0.0, 1.0)], poligonos
+    )
+
+    assert np.isnan(resultado["fator_escala"]).all()
+    assert not resultado["dentro"].any()
+
+
+def test_contorno_vazio_entre_contornos_por_demanda():
+    resultado = intersecoes_raios_poligonos(
+        [(1.0, 0.0), (0.0, 1.0)], [[], QUADRADO]
+    )
+
+    assert math.isnan(resultado["fator_escala"][0])
+    assert resultado["fator_escala"][1] == pytest.approx(2.0)
+    assert resultado["dentro"].tolist() == [False, True]